@@ -0,0 +1,133 @@
+"""
+In-process stand-in for the BillKit API, served through httpx.MockTransport.
+
+Simulates the endpoints the benchmarks exercise with a fixed latency per
+response and configurable payload sizes:
+
+    POST invoices/generate    PDF of `pdf_size` bytes with an X-Billkit-File-Id
+    GET  invoices/download    the same PDF
+    GET  invoices             a page of `limit` (at most `list_size`) documents
+    GET  batch/jobs/{job_id}  a completed job with `batch_records` records
+    GET  reports/revenue      a report with `report_rows` rows per breakdown
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+
+import httpx
+
+
+@dataclass
+class MockBillKit:
+    latency: float = 0.0
+    """Seconds to wait before answering each request."""
+    pdf_size: int = 50_000
+    list_size: int = 50
+    batch_records: int = 100
+    report_rows: int = 12
+
+    def __post_init__(self) -> None:
+        self._pdf = b"%PDF-1.7\n" + b"0" * max(0, self.pdf_size - 9)
+        documents = [
+            {
+                "file_id": f"file_{i}",
+                "created_at": "2026-01-01T00:00:00Z",
+                "client_name": f"Client {i}",
+                "invoice_number": f"INV-{i:05d}",
+                "due_date": "2026-02-01",
+                "status": "paid",
+            }
+            for i in range(self.list_size)
+        ]
+        self._documents = [json.dumps(doc).encode() for doc in documents]
+        self._bodies: dict[str, bytes] = {}
+        self._bodies["batch"] = json.dumps(
+            {
+                "job_id": "job",
+                "status": "completed",
+                "entity_type": "invoice",
+                "source": "json",
+                "total_count": self.batch_records,
+                "imported_count": self.batch_records,
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:05Z",
+                "records": [
+                    {"invoiceNumber": f"INV-{i:05d}", "s3Key": f"invoices/{i}.pdf"}
+                    for i in range(self.batch_records)
+                ],
+            }
+        ).encode()
+        rows = [
+            {"label": f"Client {i}", "total": "1250.50", "count": 3}
+            for i in range(self.report_rows)
+        ]
+        periods = [
+            {"period": f"2026-{i % 12 + 1:02d}", "total": "1250.50", "count": 3}
+            for i in range(self.report_rows)
+        ]
+        self._bodies["report"] = json.dumps(
+            {
+                "currencyCode": "GBP",
+                "currencySymbol": "£",
+                "summary": {"total": "15006.00", "count": 36, "overdueCount": 2},
+                "byPeriod": {
+                    "daily": periods,
+                    "weekly": periods,
+                    "monthly": periods,
+                    "yearly": periods,
+                },
+                "byClient": rows,
+                "byStatus": rows,
+                "availableCurrencies": [
+                    {"code": "GBP", "name": "British Pound", "symbol": "£"}
+                ],
+            }
+        ).encode()
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Build the response for `request` without waiting."""
+        path = request.url.path.rstrip("/")
+        if path.endswith(("/invoices/generate", "/invoices/download")):
+            return httpx.Response(
+                200,
+                content=self._pdf,
+                headers={
+                    "Content-Type": "application/pdf",
+                    "X-Billkit-File-Id": request.url.params.get("file_id", "file_0"),
+                },
+            )
+        if path.endswith("/invoices"):
+            limit = int(request.url.params.get("limit", self.list_size))
+            body = b"[" + b",".join(self._documents[:limit]) + b"]"
+            return _json(body)
+        if "/batch/jobs/" in path:
+            return _json(self._bodies["batch"])
+        if path.endswith("/reports/revenue"):
+            return _json(self._bodies["report"])
+        return httpx.Response(404, json={"detail": "Not found"})
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            time.sleep(self.latency)
+        return self.respond(request)
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.respond(request)
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for BillKitClient(transport=...)."""
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for AsyncBillKitClient(transport=...)."""
+        return httpx.MockTransport(self.ahandle)
+
+
+def _json(body: bytes) -> httpx.Response:
+    return httpx.Response(
+        200, content=body, headers={"Content-Type": "application/json"}
+    )
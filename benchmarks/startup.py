@@ -0,0 +1,63 @@
+"""
+Cold-start benchmark: time to import billkit and the client class, construct a
+client, and make the first API call, each measured in a fresh interpreter
+(httpx is imported beforehand and not counted).
+
+Usage:
+    python benchmarks/startup.py [--runs 20]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+
+_PROBE = r"""
+import json, time
+t0 = time.perf_counter()
+import httpx
+t1 = time.perf_counter()
+import billkit
+t1b = time.perf_counter()
+from billkit import BillKitClient
+t2 = time.perf_counter()
+user = {
+    "id": "usr_1", "email": "a@example.com", "first_name": "A", "last_name": "B",
+    "created_at": "2025-01-01", "updated_at": "2025-01-01", "default_currency": "GBP",
+}
+transport = httpx.MockTransport(lambda request: httpx.Response(200, json=user))
+client = BillKitClient(api_key="sk_bench", transport=transport)
+t3 = time.perf_counter()
+client.users.get_user()
+t4 = time.perf_counter()
+client.users.get_user()
+t5 = time.perf_counter()
+print(json.dumps({
+    "import": t1b - t1, "client_import": t2 - t1b, "construct": t3 - t2,
+    "first_call": t4 - t3, "second_call": t5 - t4,
+}))
+"""
+
+
+def _run_once() -> dict[str, float]:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args(argv)
+    samples = [_run_once() for _ in range(args.runs)]
+    print(f"{'phase':<14} {'median ms':>10} {'min ms':>10}")
+    for phase in samples[0]:
+        values = [sample[phase] * 1000 for sample in samples]
+        print(f"{phase:<14} {statistics.median(values):>10.2f} {min(values):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
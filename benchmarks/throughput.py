@@ -0,0 +1,182 @@
+"""
+Throughput benchmark: calls/sec, latency percentiles, CPU time per call and
+peak RSS for common API calls against the mock server, for the sync and async
+clients. Each scenario runs in a fresh interpreter so peak RSS is its own.
+
+Usage:
+    python benchmarks/throughput.py [--calls 2000] [--concurrency 8]
+        [--latency-ms 0] [--pdf-kb 50] [--list-size 50]
+        [--batch-records 100] [--report-rows 12]
+        [--scenario generate --scenario list ...] [--client sync|async|both]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from mock_server import MockBillKit
+
+SCENARIOS = ("generate", "download", "list", "batch", "reports")
+
+_ITEMS = [
+    {"description": f"Consulting hour {i}", "qty": 1 + i % 3, "price": "95.00"}
+    for i in range(10)
+]
+
+
+def _call(client: Any, scenario: str) -> Callable[[int], Any]:
+    if scenario == "generate":
+        return lambda i: client.invoices.create(
+            client_name="Acme Ltd",
+            client_email="billing@acme.example",
+            items=_ITEMS,
+            invoice_number=f"INV-{i:05d}",
+            due_date="2026-02-01",
+        )
+    # Distinct keys per call, so concurrent identical GETs are not coalesced.
+    if scenario == "download":
+        return lambda i: client.invoices.download_pdf(f"file_{i}")
+    if scenario == "list":
+        return lambda i: client.invoices.list(offset=i)
+    if scenario == "batch":
+        return lambda i: client.invoices.get_batch_status(f"job_{i}")
+    return lambda i: client.reports.get_revenue(currency=f"C{i}")
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, round(q * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _summary(latencies: list[float], wall: float, cpu: float) -> dict[str, float]:
+    latencies.sort()
+    return {
+        "calls_per_sec": len(latencies) / wall,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "cpu_us_per_call": cpu / len(latencies) * 1e6,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def _run_sync(
+    server: MockBillKit, scenario: str, calls: int, concurrency: int
+) -> dict[str, float]:
+    from billkit import BillKitClient
+
+    client = BillKitClient(api_key="sk_bench", transport=server.transport())
+    call = _call(client, scenario)
+    call(0)  # warm up imports and validators
+
+    def timed(i: int) -> float:
+        start = time.perf_counter()
+        call(i)
+        return time.perf_counter() - start
+
+    cpu, wall = time.process_time(), time.perf_counter()
+    if concurrency == 1:
+        latencies = [timed(i) for i in range(calls)]
+    else:
+        with ThreadPoolExecutor(concurrency) as pool:
+            latencies = list(pool.map(timed, range(calls)))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    client.close()
+    return _summary(latencies, wall, cpu)
+
+
+async def _run_async(
+    server: MockBillKit, scenario: str, calls: int, concurrency: int
+) -> dict[str, float]:
+    from billkit import AsyncBillKitClient
+
+    client = AsyncBillKitClient(api_key="sk_bench", transport=server.async_transport())
+    call = _call(client, scenario)
+    await call(0)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i: int) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            await call(i)
+            return time.perf_counter() - start
+
+    cpu, wall = time.process_time(), time.perf_counter()
+    latencies = list(await asyncio.gather(*(timed(i) for i in range(calls))))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    await client.aclose()
+    return _summary(latencies, wall, cpu)
+
+
+def _child(args: argparse.Namespace) -> None:
+    server = MockBillKit(
+        latency=args.latency_ms / 1000,
+        pdf_size=args.pdf_kb * 1024,
+        list_size=args.list_size,
+        batch_records=args.batch_records,
+        report_rows=args.report_rows,
+    )
+    scenario, client = args.child
+    if client == "sync":
+        result = _run_sync(server, scenario, args.calls, args.concurrency)
+    else:
+        result = asyncio.run(_run_async(server, scenario, args.calls, args.concurrency))
+    print(json.dumps(result))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--pdf-kb", type=int, default=50)
+    parser.add_argument("--list-size", type=int, default=50)
+    parser.add_argument("--batch-records", type=int, default=100)
+    parser.add_argument("--report-rows", type=int, default=12)
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS)
+    parser.add_argument("--client", choices=("sync", "async", "both"), default="both")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _child(args)
+        return
+
+    options = [
+        f"--calls={args.calls}",
+        f"--concurrency={args.concurrency}",
+        f"--latency-ms={args.latency_ms}",
+        f"--pdf-kb={args.pdf_kb}",
+        f"--list-size={args.list_size}",
+        f"--batch-records={args.batch_records}",
+        f"--report-rows={args.report_rows}",
+    ]
+    clients = ("sync", "async") if args.client == "both" else (args.client,)
+    print(
+        f"{'scenario':<10} {'client':<6} {'calls/s':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'cpu us/call':>12} {'peak RSS MB':>12}"
+    )
+    for scenario in args.scenario or SCENARIOS:
+        for client in clients:
+            out = subprocess.run(
+                [sys.executable, __file__, *options, "--child", scenario, client],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            r = json.loads(out)
+            print(
+                f"{scenario:<10} {client:<6} {r['calls_per_sec']:>9.0f} "
+                f"{r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} "
+                f"{r['cpu_us_per_call']:>12.0f} {r['peak_rss_mb']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,111 @@
-from .client import BillKitClient
-from .exceptions import BillKitException
-from .models._base import PDFResponse
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["BillKitClient", "BillKitException", "PDFResponse"]
+if TYPE_CHECKING:
+    from ._bulk import BulkResult
+    from ._cache import CacheStats, ResponseCache
+    from ._conditional import (
+        ConditionalCache,
+        DirectoryStore,
+        MemoryStore,
+        ResponseStore,
+        StoredResponse,
+    )
+    from ._decode import JSONDecoder
+    from ._instrument import OpenTelemetryHook, RequestMetrics
+    from ._items import Totals, build_items, compute_totals
+    from ._pdfcache import PDFCache
+    from ._ratelimit import RateLimiter, TokenBucket
+    from ._registry import close_shared_clients, shared_client
+    from ._retry import RetryPolicy
+    from ._settings import TransportConfig
+    from .api._batch import AsyncBatchGroup, BatchGroup
+    from .api._csv import CSVRowError
+    from .client import AsyncBillKitClient, BillKitClient
+    from .exceptions import BatchTimeoutError, BillKitException, CSVValidationError
+    from .models._base import DocumentRecord, PDFResponse, StreamedPDF
+
+# Public names are imported on first access (PEP 562), so `import billkit` only
+# loads the modules a program actually uses.
+_EXPORTS = {
+    "BulkResult": "._bulk",
+    "CacheStats": "._cache",
+    "ResponseCache": "._cache",
+    "ConditionalCache": "._conditional",
+    "DirectoryStore": "._conditional",
+    "MemoryStore": "._conditional",
+    "ResponseStore": "._conditional",
+    "StoredResponse": "._conditional",
+    "JSONDecoder": "._decode",
+    "OpenTelemetryHook": "._instrument",
+    "RequestMetrics": "._instrument",
+    "Totals": "._items",
+    "build_items": "._items",
+    "compute_totals": "._items",
+    "PDFCache": "._pdfcache",
+    "RateLimiter": "._ratelimit",
+    "TokenBucket": "._ratelimit",
+    "close_shared_clients": "._registry",
+    "shared_client": "._registry",
+    "RetryPolicy": "._retry",
+    "TransportConfig": "._settings",
+    "AsyncBatchGroup": ".api._batch",
+    "BatchGroup": ".api._batch",
+    "CSVRowError": ".api._csv",
+    "AsyncBillKitClient": ".client",
+    "BillKitClient": ".client",
+    "BatchTimeoutError": ".exceptions",
+    "BillKitException": ".exceptions",
+    "CSVValidationError": ".exceptions",
+    "DocumentRecord": ".models._base",
+    "PDFResponse": ".models._base",
+    "StreamedPDF": ".models._base",
+}
+
+__all__ = [
+    "AsyncBatchGroup",
+    "AsyncBillKitClient",
+    "BatchGroup",
+    "BatchTimeoutError",
+    "BillKitClient",
+    "BillKitException",
+    "BulkResult",
+    "CSVRowError",
+    "CSVValidationError",
+    "CacheStats",
+    "ConditionalCache",
+    "DirectoryStore",
+    "DocumentRecord",
+    "JSONDecoder",
+    "MemoryStore",
+    "OpenTelemetryHook",
+    "PDFCache",
+    "PDFResponse",
+    "RateLimiter",
+    "RequestMetrics",
+    "ResponseCache",
+    "ResponseStore",
+    "RetryPolicy",
+    "StoredResponse",
+    "StreamedPDF",
+    "TokenBucket",
+    "Totals",
+    "TransportConfig",
+    "build_items",
+    "close_shared_clients",
+    "compute_totals",
+    "shared_client",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
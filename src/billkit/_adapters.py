@@ -0,0 +1,12 @@
+"""Cached pydantic adapters shared by the client-side validation helpers."""
+
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+@cache
+def list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return the TypeAdapter validating a list of `model`, built once per model."""
+    return TypeAdapter(list[model])  # pyright: ignore[reportInvalidTypeForm]
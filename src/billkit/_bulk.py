@@ -0,0 +1,93 @@
+"""Bounded-concurrency helpers shared by the bulk resource methods."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass(slots=True)
+class BulkResult(Generic[K, V]):
+    """
+    Outcome of one item in a bulk operation.
+
+    `key` identifies the input (e.g. a file_id); exactly one of `value` and
+    `error` is set.
+    """
+
+    key: K
+    value: V | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def _future_result(key: K, future: "Future[V] | asyncio.Future[V]") -> BulkResult[K, V]:
+    exc = future.exception()
+    if exc is None:
+        return BulkResult(key, value=future.result())
+    if not isinstance(exc, Exception):
+        raise exc
+    return BulkResult(key, error=exc)
+
+
+def run_bounded(
+    fn: Callable[[K], V], keys: Iterable[K], *, concurrency: int
+) -> Iterator[BulkResult[K, V]]:
+    """
+    Call `fn` for every key on a thread pool, yielding results as they complete.
+
+    At most `concurrency` calls are in flight and `keys` is consumed lazily,
+    so arbitrarily long inputs are never materialized.
+    """
+    _check_concurrency(concurrency)
+    keys_iter = iter(keys)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = {pool.submit(fn, key): key for key in islice(keys_iter, concurrency)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = pending.pop(future)
+                for next_key in islice(keys_iter, 1):
+                    pending[pool.submit(fn, next_key)] = next_key
+                yield _future_result(key, future)
+
+
+async def arun_bounded(
+    fn: Callable[[K], Awaitable[V]], keys: Iterable[K], *, concurrency: int
+) -> AsyncIterator[BulkResult[K, V]]:
+    """Async counterpart of run_bounded using tasks on the running loop."""
+    _check_concurrency(concurrency)
+    keys_iter = iter(keys)
+    pending: dict[asyncio.Future[V], K] = {}
+
+    def submit(key: K) -> None:
+        pending[asyncio.ensure_future(fn(key))] = key
+
+    try:
+        for key in islice(keys_iter, concurrency):
+            submit(key)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                key = pending.pop(task)
+                for next_key in islice(keys_iter, 1):
+                    submit(next_key)
+                yield _future_result(key, task)
+    finally:
+        for task in pending:
+            task.cancel()
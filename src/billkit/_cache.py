@@ -0,0 +1,151 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...], Any]
+
+# First path segment of a non-GET request -> cached endpoints it may change.
+# Families missing here clear the whole cache.
+_INVALIDATES: Mapping[str, tuple[str, ...]] = {
+    "invoices": ("invoices*", "reports/*"),
+    "quotes": ("quotes*", "invoices*", "reports/*"),
+    "batch": ("invoices*", "quotes*", "reports/*"),
+    "users": ("users/*", "reports/*"),
+    "templates": ("templates*",),
+    # Sending an email leaves every cached resource as it was.
+    "email": (),
+}
+
+
+def endpoint_path(endpoint: str) -> str:
+    """Normalize an endpoint to its path, without leading slash or query."""
+    return endpoint.lstrip("/").split("?", 1)[0]
+
+
+def cache_key(
+    endpoint: str, params: Mapping[str, Any] | None, response_type: Any = None
+) -> CacheKey:
+    items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return endpoint.lstrip("/"), items, response_type
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    In-memory TTL + LRU cache for GET responses, shared by all resource groups of
+    a client.
+
+    Only endpoints matching a pattern in `ttls` (glob over the endpoint path,
+    mapped to a lifetime in seconds) are cached. Any non-GET request made through
+    the same client drops cached entries its resource family could affect, e.g.
+    `invoices.update_status` clears invoice documents and revenue reports.
+    Cached response models are shared between callers and should not be
+    modified.
+
+    Usage:
+        client = BillKitClient(cache=ResponseCache())
+        client.invoices.get_document(file_id)  # miss
+        client.invoices.get_document(file_id)  # hit
+        client.cache.stats()
+    """
+
+    DEFAULT_TTLS: Mapping[str, float] = {
+        "invoices/by-id/*": 60.0,
+        "quotes/by-id/*": 60.0,
+        "users/me": 300.0,
+        "templates/all": 300.0,
+        "reports/revenue": 60.0,
+    }
+
+    def __init__(
+        self, ttls: Mapping[str, float] | None = None, *, maxsize: int = 1024
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        path = endpoint_path(endpoint)
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return None
+
+    def get(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+        response_type: Any = None,
+    ) -> Any:
+        """Return the cached value, or raise KeyError on a miss or expiry."""
+        key = cache_key(endpoint, params, response_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(
+        self,
+        endpoint: str,
+        params: Mapping[str, Any] | None,
+        value: Any,
+        response_type: Any = None,
+    ) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl is None or ttl <= 0:
+            return
+        key = cache_key(endpoint, params, response_type)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *patterns: str) -> None:
+        """Drop entries whose endpoint path matches any of `patterns`."""
+        with self._lock:
+            for key in list(self._entries):
+                path = endpoint_path(key[0])
+                if any(fnmatchcase(path, pattern) for pattern in patterns):
+                    del self._entries[key]
+
+    def invalidate_after(self, method: str, endpoint: str) -> None:
+        """Drop entries a `method` request to `endpoint` may have changed."""
+        if method.upper() in ("GET", "HEAD", "OPTIONS"):
+            return
+        family = endpoint_path(endpoint).split("/", 1)[0]
+        self.invalidate(*_INVALIDATES.get(family, ("*",)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries))
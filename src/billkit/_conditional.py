@@ -0,0 +1,219 @@
+"""Conditional GET revalidation with ETag / Last-Modified validators."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any
+
+import httpx
+
+from ._cache import endpoint_path
+
+# Response headers kept with a stored body so a 304 can be answered from it.
+_KEPT_HEADERS = ("content-type", "etag", "last-modified", "x-billkit-file-id")
+
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """A response body stored together with its validators."""
+
+    headers: Mapping[str, str]
+    body: bytes
+
+    def validators(self) -> dict[str, str]:
+        """Request headers asking the server to revalidate this response."""
+        headers: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+class ResponseStore(ABC):
+    """Storage backend for ConditionalCache."""
+
+    @abstractmethod
+    def get(self, key: str) -> StoredResponse | None: ...
+
+    @abstractmethod
+    def set(self, key: str, response: StoredResponse) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+
+class MemoryStore(ResponseStore):
+    """In-process store evicting least recently used bodies beyond `max_bytes`."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, StoredResponse] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> StoredResponse | None:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        if len(response.body) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = response
+            self._size += len(response.body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+
+
+class DirectoryStore(ResponseStore):
+    """
+    Store keeping one file per response in `path`, so several processes or
+    workers on the same host can share revalidated bodies.
+
+    Files are written to a temporary name and renamed into place, so readers
+    never see a partial entry.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, hashlib.sha256(key.encode()).hexdigest())
+
+    def get(self, key: str) -> StoredResponse | None:
+        try:
+            with open(self._file(key), "rb") as f:
+                meta: dict[str, Any] = json.loads(f.readline())
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key:
+            return None
+        headers: dict[str, str] = meta.get("headers") or {}
+        return StoredResponse(headers=headers, body=body)
+
+    def set(self, key: str, response: StoredResponse) -> None:
+        meta = json.dumps({"key": key, "headers": dict(response.headers)})
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(meta.encode() + b"\n")
+                f.write(response.body)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        with suppress(OSError):
+            os.unlink(self._file(key))
+
+
+class ConditionalCache:
+    """
+    Revalidates cached GET responses with If-None-Match / If-Modified-Since.
+
+    Bodies of responses to `endpoints` (globs over the endpoint path) that carry
+    an ETag or Last-Modified header are kept in `store`. The next request for
+    the same endpoint sends the validators, and a 304 Not Modified is answered
+    from the stored body, so unchanged PDFs and documents are not downloaded
+    again. Unlike ResponseCache, every call still reaches the server, so no
+    invalidation is needed.
+
+    Usage:
+        client = BillKitClient(
+            conditional_cache=ConditionalCache(DirectoryStore("/var/cache/billkit"))
+        )
+    """
+
+    DEFAULT_ENDPOINTS: tuple[str, ...] = (
+        "invoices/download",
+        "quotes/download",
+        "invoices/by-id/*",
+        "quotes/by-id/*",
+    )
+
+    def __init__(
+        self,
+        store: ResponseStore | None = None,
+        *,
+        endpoints: tuple[str, ...] | None = None,
+    ) -> None:
+        self.store = store if store is not None else MemoryStore()
+        self.endpoints = endpoints if endpoints is not None else self.DEFAULT_ENDPOINTS
+        self.revalidated = 0
+        """Number of requests answered from the store after a 304."""
+
+    def lookup(
+        self, method: str, endpoint: str, request_kwargs: dict[str, Any]
+    ) -> tuple[str | None, StoredResponse | None]:
+        """
+        Return the store key and stored response for a request, adding the
+        stored validators to `request_kwargs["headers"]`. The key is None when
+        the request is not eligible for revalidation.
+        """
+        if method.upper() != "GET":
+            return None, None
+        path = endpoint_path(endpoint)
+        if not any(fnmatchcase(path, pattern) for pattern in self.endpoints):
+            return None, None
+        params: dict[str, Any] = request_kwargs.get("params") or {}
+        key = str(httpx.URL(endpoint.lstrip("/")).copy_merge_params(params))
+        stored = self.store.get(key)
+        if stored is not None:
+            headers: dict[str, str] = dict(request_kwargs.get("headers") or {})
+            for name, value in stored.validators().items():
+                headers.setdefault(name, value)
+            request_kwargs["headers"] = headers
+        return key, stored
+
+    def resolve(
+        self, key: str, stored: StoredResponse | None, response: httpx.Response
+    ) -> httpx.Response:
+        """
+        Answer a 304 from `stored`, or remember a fresh response carrying
+        validators. `response` must have been read.
+        """
+        if response.status_code == 304 and stored is not None:
+            self.revalidated += 1
+            return httpx.Response(
+                200,
+                headers=dict(stored.headers),
+                content=stored.body,
+                request=response.request,
+            )
+        if response.is_success:
+            headers = {
+                name: value
+                for name in _KEPT_HEADERS
+                if (value := response.headers.get(name)) is not None
+            }
+            if "etag" in headers or "last-modified" in headers:
+                self.store.set(key, StoredResponse(headers, response.content))
+            elif stored is not None:
+                self.store.delete(key)
+        return response
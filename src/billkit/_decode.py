@@ -0,0 +1,51 @@
+"""Decoding of JSON response bodies, straight into response models."""
+
+import json
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+def _default_loads() -> Callable[[bytes], Any]:
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+@lru_cache(maxsize=256)
+def _adapter(response_type: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(response_type)
+
+
+class JSONDecoder:
+    """
+    Decodes JSON response bodies.
+
+    When an API method passes its expected response type (a model or e.g.
+    list[Model]), the body is parsed and validated in a single pass with
+    pydantic's JSON validator instead of decoding to dicts first. Untyped
+    bodies are decoded with `loads`, which defaults to orjson when installed
+    (pip install billkit[orjson]) and the standard library otherwise; pass
+    e.g. msgspec.json.decode to use another library.
+
+    Usage:
+        client = BillKitClient(decoder=JSONDecoder(loads=msgspec.json.decode))
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] | None = None) -> None:
+        self.loads = loads if loads is not None else _default_loads()
+
+    def decode(self, content: bytes, response_type: Any = None) -> Any:
+        """Decode `content`, validating it as `response_type` when given.
+
+        Raises:
+            ValueError: If `content` is not valid JSON.
+            pydantic.ValidationError: If it does not match `response_type`.
+        """
+        if response_type is None:
+            return self.loads(content)
+        return _adapter(response_type).validate_json(content)
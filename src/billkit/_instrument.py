@@ -0,0 +1,277 @@
+"""Per-request timing and size metrics reported to client hooks."""
+
+import logging
+import re
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+import httpx
+
+from ._cache import endpoint_path
+
+if TYPE_CHECKING:
+    from opentelemetry.metrics import Histogram, MeterProvider
+    from opentelemetry.trace import Tracer, TracerProvider
+
+logger = logging.getLogger(__name__)
+
+_ID_SEGMENTS = (
+    (re.compile(r"^(invoices|quotes)/by-id/[^/]+$"), r"\1/by-id/{file_id}"),
+    (re.compile(r"^batch/jobs/[^/]+$"), "batch/jobs/{job_id}"),
+    (re.compile(r"^templates/(?!all$)[^/]+$"), "templates/{template_id}"),
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Return `endpoint` without its query and with IDs replaced by placeholders,
+    e.g. "invoices/by-id/{file_id}", for use as a low-cardinality label.
+    """
+    path = endpoint_path(endpoint)
+    for pattern, template in _ID_SEGMENTS:
+        path, count = pattern.subn(template, path)
+        if count:
+            break
+    return path
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """
+    Timings and sizes of one HTTP exchange, i.e. one attempt of an API call.
+
+    Durations are in seconds. `connect` covers opening a new connection
+    (including TLS) and is None when a pooled connection was reused or the
+    transport does not report it. `ttfb` runs from sending the request to
+    receiving the response headers, excluding `connect`; `body` covers reading
+    or streaming the response body; `decode` is the time spent parsing JSON and
+    validating it into the response model. Byte counts are as sent and
+    received on the wire, when known.
+    """
+
+    method: str
+    endpoint: str
+    """Endpoint template, e.g. "invoices/by-id/{file_id}"."""
+    attempt: int
+    """Number of retries before this attempt."""
+    status_code: int | None = None
+    duration: float = 0.0
+    connect: float | None = None
+    ttfb: float | None = None
+    body: float | None = None
+    decode: float | None = None
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    error: Exception | None = None
+
+
+MetricsHook = Callable[[RequestMetrics], None]
+
+
+class Probe:
+    """Instrumentation points of one request attempt; this base records nothing."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        pass
+
+    def request_sent(self, request: httpx.Request, *, is_async: bool = False) -> None:
+        pass
+
+    def headers_received(self, response: httpx.Response) -> None:
+        pass
+
+    def body_received(self, response: httpx.Response) -> None:
+        pass
+
+    @contextmanager
+    def decoding(self) -> Generator[None, None, None]:
+        yield
+
+
+NULL_PROBE = Probe()
+
+
+class MetricsProbe(Probe):
+    """
+    Collects RequestMetrics for one attempt and reports them to `hooks` when
+    the `with` block exits, successfully or not. Exceptions raised by a hook
+    are logged and otherwise ignored.
+    """
+
+    def __init__(
+        self, hooks: tuple[MetricsHook, ...], method: str, endpoint: str, attempt: int
+    ) -> None:
+        self.hooks = hooks
+        self.metrics = RequestMetrics(
+            method.upper(), endpoint_template(endpoint), attempt
+        )
+        self._start = 0.0
+        self._phase_start = 0.0
+        self._headers_at: float | None = None
+
+    def __enter__(self) -> Self:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.metrics.duration = time.perf_counter() - self._start
+        if isinstance(exc, Exception):
+            self.metrics.error = exc
+        for hook in self.hooks:
+            # Instrumentation must never fail (or mask the error of) the call.
+            try:
+                hook(self.metrics)
+            except Exception:
+                logger.exception("billkit metrics hook %r failed", hook)
+
+    def _trace(self, event: str, info: dict[str, Any]) -> None:
+        # httpcore reports connection setup as connection.<step>.started /
+        # .complete pairs, e.g. connect_tcp followed by start_tls.
+        if not event.startswith("connection."):
+            return
+        now = time.perf_counter()
+        if event.endswith(".started"):
+            self._phase_start = now
+        elif event.endswith(".complete"):
+            self.metrics.connect = (self.metrics.connect or 0.0) + (
+                now - self._phase_start
+            )
+
+    async def _atrace(self, event: str, info: dict[str, Any]) -> None:
+        self._trace(event, info)
+
+    def request_sent(self, request: httpx.Request, *, is_async: bool = False) -> None:
+        """Attach the connection trace to `request` and record its size."""
+        request.extensions["trace"] = self._atrace if is_async else self._trace
+        length = request.headers.get("Content-Length")
+        if length is not None:
+            self.metrics.request_bytes = int(length)
+        elif isinstance(request.stream, httpx.ByteStream):
+            self.metrics.request_bytes = len(request.content)
+
+    def headers_received(self, response: httpx.Response) -> None:
+        self._headers_at = time.perf_counter()
+        self.metrics.status_code = response.status_code
+        self.metrics.ttfb = (
+            self._headers_at - self._start - (self.metrics.connect or 0.0)
+        )
+
+    def body_received(self, response: httpx.Response) -> None:
+        if self._headers_at is not None:
+            self.metrics.body = time.perf_counter() - self._headers_at
+        self.metrics.response_bytes = response.num_bytes_downloaded
+
+    @contextmanager
+    def decoding(self) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.metrics.decode = time.perf_counter() - start
+
+
+class OpenTelemetryHook:
+    """
+    Hook that records each request attempt as an OpenTelemetry client span and
+    in duration and size histograms.
+
+    Requires opentelemetry-api (pip install billkit[opentelemetry]). Spans and
+    metrics go to the globally configured providers unless `tracer_provider`
+    or `meter_provider` is given; spans are children of the span current in
+    the calling thread or task.
+
+    Usage:
+        client = BillKitClient(hooks=[OpenTelemetryHook()])
+    """
+
+    def __init__(
+        self,
+        *,
+        tracer_provider: "TracerProvider | None" = None,
+        meter_provider: "MeterProvider | None" = None,
+    ) -> None:
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryHook requires opentelemetry-api: "
+                "pip install billkit[opentelemetry]"
+            ) from e
+        self._tracer: Tracer = trace.get_tracer(
+            "billkit", tracer_provider=tracer_provider
+        )
+        meter = metrics.get_meter("billkit", meter_provider=meter_provider)
+        self._duration: Histogram = meter.create_histogram(
+            "http.client.request.duration",
+            unit="s",
+            description="Duration of BillKit API requests.",
+        )
+        self._phase: Histogram = meter.create_histogram(
+            "billkit.client.phase.duration",
+            unit="s",
+            description="Time per request phase: connect, ttfb, body, decode.",
+        )
+        self._request_size: Histogram = meter.create_histogram(
+            "http.client.request.body.size", unit="By"
+        )
+        self._response_size: Histogram = meter.create_histogram(
+            "http.client.response.body.size", unit="By"
+        )
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        from opentelemetry.trace import SpanKind, Status, StatusCode
+
+        attributes: dict[str, str | int] = {
+            "http.request.method": metrics.method,
+            "url.template": metrics.endpoint,
+        }
+        if metrics.status_code is not None:
+            attributes["http.response.status_code"] = metrics.status_code
+        if metrics.error is not None:
+            attributes["error.type"] = type(metrics.error).__name__
+        self._duration.record(metrics.duration, attributes)
+        phases = {
+            "connect": metrics.connect,
+            "ttfb": metrics.ttfb,
+            "body": metrics.body,
+            "decode": metrics.decode,
+        }
+        for phase, seconds in phases.items():
+            if seconds is not None:
+                self._phase.record(seconds, {**attributes, "billkit.phase": phase})
+        if metrics.request_bytes is not None:
+            self._request_size.record(metrics.request_bytes, attributes)
+        if metrics.response_bytes is not None:
+            self._response_size.record(metrics.response_bytes, attributes)
+
+        end = time.time_ns()
+        span = self._tracer.start_span(
+            f"{metrics.method} {metrics.endpoint}",
+            kind=SpanKind.CLIENT,
+            start_time=end - int(metrics.duration * 1e9),
+            attributes={**attributes, "http.request.resend_count": metrics.attempt},
+        )
+        for phase, seconds in phases.items():
+            if seconds is not None:
+                span.set_attribute(f"billkit.{phase}.duration", seconds)
+        if metrics.error is not None:
+            span.record_exception(metrics.error)
+            span.set_status(Status(StatusCode.ERROR, str(metrics.error)))
+        span.end(end_time=end)
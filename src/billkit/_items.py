@@ -0,0 +1,170 @@
+"""Columnar construction of line items and local invoice/quote totals."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import repeat
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from ._adapters import list_adapter
+from .models._base import DiscountType, _BaseItem  # pyright: ignore[reportPrivateUsage]
+
+I = TypeVar("I", bound=_BaseItem)
+
+_CENT = Decimal("0.01")
+_HUNDRED = Decimal(100)
+
+
+def _column(values: Iterable[Any] | None) -> list[Any] | None:
+    """Materialize a column; numpy arrays and pandas Series become plain lists."""
+    if values is None:
+        return None
+    tolist: Any = getattr(values, "tolist", None)
+    return list(tolist()) if tolist is not None else list(values)
+
+
+def _columns(**columns: Iterable[Any] | None) -> tuple[int, dict[str, list[Any]]]:
+    present = {
+        name: column
+        for name, values in columns.items()
+        if (column := _column(values)) is not None
+    }
+    lengths = {len(column) for column in present.values()}
+    if len(lengths) > 1:
+        sizes = ", ".join(f"{name}={len(col)}" for name, col in present.items())
+        raise ValueError(f"columns must have the same length ({sizes})")
+    return (lengths.pop() if lengths else 0), present
+
+
+def build_items(
+    item_model: type[I],
+    *,
+    description: Iterable[str],
+    qty: Iterable[int],
+    price: Iterable[Any],
+    tax: Iterable[Any] | None = None,
+    discount_type: Iterable[DiscountType | str | None] | None = None,
+    discount_value: Iterable[Any] | None = None,
+) -> list[I]:
+    """
+    Build line items from columns (lists, tuples, numpy arrays, pandas Series)
+    validated in one batch.
+
+    Omitted columns and None cells are left unset on the items, so they are not
+    sent to the API. Validation errors are raised together as a single
+    ValidationError whose locations start with the row index.
+
+    Usage:
+        items = build_items(
+            InvoiceItem,
+            description=df["description"],
+            qty=df["qty"],
+            price=df["price"],
+        )
+    """
+    _, columns = _columns(
+        description=description,
+        qty=qty,
+        price=price,
+        tax=tax,
+        discount_type=discount_type,
+        discount_value=discount_value,
+    )
+    names = list(columns)
+    rows = [
+        {name: value for name, value in zip(names, row) if value is not None}
+        for row in zip(*columns.values())
+    ]
+    adapter: TypeAdapter[list[Any]] = list_adapter(item_model)
+    return adapter.validate_python(rows)
+
+
+@dataclass(frozen=True)
+class Totals:
+    """Amounts of a document, rounded to cents."""
+
+    subtotal: Decimal
+    """Sum of qty * price over all lines."""
+    discount: Decimal
+    """Line discounts plus the document discount."""
+    tax: Decimal
+    total: Decimal
+
+
+def _decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    # str() avoids carrying binary float artifacts into the amounts.
+    return Decimal(value) if isinstance(value, int) else Decimal(str(value))
+
+
+def _discount(amount: Decimal, kind: Any, value: Any) -> Decimal:
+    if kind is None or value is None:
+        return Decimal(0)
+    discount = _decimal(value)
+    if discount < 0:
+        raise ValueError("Discount value must be 0 or more")
+    if DiscountType(kind) == DiscountType.PERCENTAGE:
+        # Same limit as _BaseItem.validate_discount.
+        if discount > _HUNDRED:
+            raise ValueError("Percentage discount must be 100 or less")
+        return amount * discount / _HUNDRED
+    return min(discount, amount)
+
+
+def compute_totals(
+    *,
+    qty: Iterable[Any],
+    price: Iterable[Any],
+    tax: Iterable[Any] | None = None,
+    discount_type: Iterable[DiscountType | str | None] | None = None,
+    discount_value: Iterable[Any] | None = None,
+    document_discount_type: DiscountType | str | None = None,
+    document_discount_value: Any = 0,
+) -> Totals:
+    """
+    Compute document totals locally from line item columns, without building
+    item models.
+
+    Each line's discount (a percentage of qty * price, or a fixed amount capped
+    at it) is applied first and `tax` is a percentage rate on the discounted
+    line. The document discount then applies to the sum of discounted lines,
+    reducing the taxable amount of every line proportionally. Intermediate
+    amounts keep full Decimal precision; subtotal, discount and tax are rounded
+    half-up to cents and the total is their sum.
+
+    Raises ValueError for a negative discount or a percentage discount over
+    100, which the item models reject as well.
+    """
+    count, columns = _columns(
+        qty=qty,
+        price=price,
+        tax=tax,
+        discount_type=discount_type,
+        discount_value=discount_value,
+    )
+    subtotal = line_discounts = net = tax_amount = Decimal(0)
+    for q, p, rate, kind, value in zip(
+        columns["qty"],
+        columns["price"],
+        columns.get("tax") or repeat(None, count),
+        columns.get("discount_type") or repeat(None, count),
+        columns.get("discount_value") or repeat(None, count),
+    ):
+        gross = _decimal(q) * _decimal(p)
+        line_discount = _discount(gross, kind, value)
+        line_net = gross - line_discount
+        subtotal += gross
+        line_discounts += line_discount
+        net += line_net
+        if rate:
+            tax_amount += line_net * _decimal(rate) / _HUNDRED
+    document_discount = _discount(net, document_discount_type, document_discount_value)
+    if net:
+        tax_amount *= (net - document_discount) / net
+    subtotal = subtotal.quantize(_CENT, ROUND_HALF_UP)
+    discount = (line_discounts + document_discount).quantize(_CENT, ROUND_HALF_UP)
+    tax_amount = tax_amount.quantize(_CENT, ROUND_HALF_UP)
+    return Totals(subtotal, discount, tax_amount, subtotal - discount + tax_amount)
@@ -0,0 +1,165 @@
+"""Persistent, content-addressed on-disk cache of PDFs keyed by file_id."""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+from collections.abc import Generator
+from contextlib import ExitStack, contextmanager, suppress
+
+from typing_extensions import Buffer
+
+_COPY_CHUNK_SIZE = 64 * 1024
+
+
+class PDFCache:
+    """
+    On-disk cache of invoice and quote PDFs, keyed by file_id.
+
+    PDF bodies are stored once per content hash under `objects/`, and each
+    file_id points at its body through a small entry under `index/`, so
+    identical PDFs share storage. Every file is written under a temporary name
+    and renamed into place, which makes the cache safe to share between
+    processes. When the bodies exceed `max_bytes`, the least recently used
+    ones are evicted.
+
+    Cached PDFs can be memory-mapped with open(), e.g. to hand them to an HTTP
+    layer without copying them into memory first.
+
+    Usage:
+        client = BillKitClient(pdf_cache=PDFCache("/var/cache/billkit/pdf"))
+        client.invoices.download_pdf(file_id)  # downloaded and cached
+        with client.pdf_cache.open(file_id) as pdf:
+            response.write(pdf)
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str], *, max_bytes: int = 1024**3
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self._objects = os.path.join(self.directory, "objects")
+        self._index = os.path.join(self.directory, "index")
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._index, exist_ok=True)
+        self._lock = threading.Lock()
+        # Approximate total body size; recounted from disk before evicting,
+        # since other processes may share the directory.
+        self._size: int | None = None
+
+    def _index_path(self, file_id: str) -> str:
+        return os.path.join(self._index, hashlib.sha256(file_id.encode()).hexdigest())
+
+    def _atomic_write(self, directory: str, path: str, data: Buffer) -> None:
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+
+    def path(self, file_id: str) -> str | None:
+        """Return the path of the cached PDF for `file_id`, or None on a miss."""
+        try:
+            with open(self._index_path(file_id), encoding="ascii") as f:
+                digest = f.read().strip()
+        except OSError:
+            return None
+        path = os.path.join(self._objects, digest)
+        try:
+            os.utime(path)  # mtime doubles as the LRU timestamp
+        except OSError:
+            # The body was evicted; drop the dangling entry.
+            self.discard(file_id)
+            return None
+        return path
+
+    def __contains__(self, file_id: str) -> bool:
+        return self.path(file_id) is not None
+
+    @contextmanager
+    def open(self, file_id: str) -> Generator[mmap.mmap, None, None]:
+        """
+        Memory-map the cached PDF for `file_id` read-only.
+
+        Raises:
+            KeyError: If the PDF is not cached.
+        """
+        path = self.path(file_id)
+        if path is None:
+            raise KeyError(file_id)
+        with ExitStack() as stack:
+            try:
+                f = stack.enter_context(open(path, "rb"))
+            except FileNotFoundError:
+                raise KeyError(file_id) from None
+            yield stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def put(self, file_id: str, data: Buffer) -> None:
+        """Store the PDF body `data` under `file_id`."""
+        view = memoryview(data)
+        if not view.nbytes:
+            return
+        digest = hashlib.sha256(view).hexdigest()
+        path = os.path.join(self._objects, digest)
+        if os.path.exists(path):
+            os.utime(path)
+        else:
+            self._atomic_write(self._objects, path, view)
+            self._grow(view.nbytes)
+        self._atomic_write(self._index, self._index_path(file_id), digest.encode())
+
+    def put_file(self, file_id: str, source: str | os.PathLike[str]) -> None:
+        """Store the PDF at `source` under `file_id`, copying it in chunks."""
+        hasher = hashlib.sha256()
+        fd, tmp = tempfile.mkstemp(dir=self._objects, suffix=".part")
+        try:
+            with open(source, "rb") as src, os.fdopen(fd, "wb") as dst:
+                while chunk := src.read(_COPY_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    dst.write(chunk)
+                size = dst.tell()
+            if not size:
+                os.unlink(tmp)
+                return
+            digest = hasher.hexdigest()
+            os.replace(tmp, os.path.join(self._objects, digest))
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp)
+            raise
+        self._grow(size)
+        self._atomic_write(self._index, self._index_path(file_id), digest.encode())
+
+    def discard(self, file_id: str) -> None:
+        """Forget `file_id`; its body is reclaimed by eviction."""
+        with suppress(OSError):
+            os.unlink(self._index_path(file_id))
+
+    def _scan(self) -> list[os.DirEntry[str]]:
+        with os.scandir(self._objects) as entries:
+            return [e for e in entries if e.is_file() and not e.name.endswith(".part")]
+
+    def _grow(self, nbytes: int) -> None:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(e.stat().st_size for e in self._scan())
+            else:
+                self._size += nbytes
+            if self._size <= self.max_bytes:
+                return
+            entries = sorted(self._scan(), key=lambda e: e.stat().st_mtime)
+            self._size = sum(e.stat().st_size for e in entries)
+            for entry in entries:
+                if self._size <= self.max_bytes:
+                    break
+                with suppress(OSError):
+                    size = entry.stat().st_size
+                    os.unlink(entry.path)
+                    self._size -= size
@@ -0,0 +1,67 @@
+"""Adaptive polling schedule for batch jobs."""
+
+import time
+from typing import Any
+
+# The API does not document its batch job states; these are the spellings of
+# a finished job we expect. A job that reports anything else is polled until
+# the caller's timeout.
+BATCH_TERMINAL_STATUSES = frozenset(
+    {"completed", "complete", "done", "failed", "error", "cancelled", "canceled"}
+)
+
+# Aim to pick up roughly this fraction of the job's records on each poll.
+_RECORDS_PER_POLL_FRACTION = 0.05
+
+
+def is_batch_finished(status: Any) -> bool:
+    return str(status.status).lower() in BATCH_TERMINAL_STATUSES
+
+
+class BatchPoller:
+    """
+    Decides how long to wait between batch status polls.
+
+    The import rate is estimated from successive `imported_count` values. While
+    the job progresses, polls are spaced so each one picks up a few percent of
+    `total_count` new records (but never later than the projected finish);
+    while it stalls, the interval backs off geometrically. Delays always stay
+    within [min_interval, max_interval].
+    """
+
+    def __init__(
+        self, *, min_interval: float, max_interval: float, timeout: float | None
+    ) -> None:
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("require 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self._delay = min_interval
+        self._last_count: int | None = None
+        self._last_time = time.monotonic()
+        self._rate: float | None = None
+
+    def next_delay(self, status: Any) -> float:
+        """Return the seconds to sleep before the next poll of `status`'s job."""
+        now = time.monotonic()
+        count: int = status.imported_count or 0
+        total: int | None = status.total_count
+        if self._last_count is not None and count > self._last_count:
+            rate = (count - self._last_count) / max(now - self._last_time, 1e-6)
+            # Exponential moving average smooths bursty server-side progress.
+            self._rate = rate if self._rate is None else 0.5 * (self._rate + rate)
+            target = max(1.0, (total or 0) * _RECORDS_PER_POLL_FRACTION)
+            delay = target / self._rate
+            if total is not None and total > count:
+                delay = min(delay, (total - count) / self._rate)
+        else:
+            delay = self._delay * 1.5 if self._last_count is not None else self._delay
+        self._last_count, self._last_time = count, now
+        self._delay = min(self.max_interval, max(self.min_interval, delay))
+        if self.deadline is not None:
+            self._delay = min(self._delay, max(0.0, self.deadline - now))
+        return self._delay
+
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+
+import httpx
+
+from ._retry import parse_retry_after
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` requests per second with bursts of
+    up to `capacity` requests.
+
+    Callers reserve a token under a short lock and then sleep outside it, so one
+    bucket can pace any mix of threads and asyncio tasks.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._not_before = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._not_before - now)
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for `seconds`, e.g. after a 429."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+    def sync(self, remaining: int, reset_after: float | None) -> None:
+        """Align the bucket with the server's view of the remaining quota."""
+        with self._lock:
+            self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0 and reset_after is not None:
+            self.pause(reset_after)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiting per endpoint family.
+
+    `limits` maps glob patterns over endpoint paths (e.g. "invoices/generate",
+    "email/send", "batch/*") to a TokenBucket or a requests-per-second rate;
+    the first matching pattern wins and unmatched endpoints use `default`, if
+    any. Buckets tighten automatically from 429 Retry-After and
+    X-RateLimit-Remaining / X-RateLimit-Reset response headers.
+
+    Usage:
+        limiter = RateLimiter(
+            {"invoices/generate": 5, "email/send": TokenBucket(2, capacity=10)},
+            default=20,
+        )
+        client = BillKitClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, TokenBucket | float],
+        *,
+        default: TokenBucket | float | None = None,
+    ) -> None:
+        self._buckets = [
+            (pattern, _as_bucket(limit)) for pattern, limit in limits.items()
+        ]
+        self._default = _as_bucket(default) if default is not None else None
+
+    def bucket_for(self, endpoint: str) -> TokenBucket | None:
+        path = endpoint.lstrip("/").split("?", 1)[0]
+        for pattern, bucket in self._buckets:
+            if fnmatchcase(path, pattern):
+                return bucket
+        return self._default
+
+    def acquire(self, endpoint: str) -> None:
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, endpoint: str) -> None:
+        bucket = self.bucket_for(endpoint)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def observe(self, endpoint: str, response: httpx.Response) -> None:
+        """Adapt the endpoint's bucket to rate-limit headers on `response`."""
+        bucket = self.bucket_for(endpoint)
+        if bucket is None:
+            return
+        headers = response.headers
+        if response.status_code == 429:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            bucket.pause(retry_after if retry_after is not None else 1.0 / bucket.rate)
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            bucket.sync(int(remaining), _parse_reset(headers.get("X-RateLimit-Reset")))
+
+
+def _as_bucket(limit: TokenBucket | float) -> TokenBucket:
+    return limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """X-RateLimit-Reset is either seconds until reset or a Unix timestamp."""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset > 1_000_000_000:
+        reset -= time.time()
+    return max(0.0, reset)
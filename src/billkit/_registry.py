@@ -0,0 +1,69 @@
+"""Process-wide registry of shared clients."""
+
+import atexit
+import os
+import threading
+
+from ._settings import TransportConfig
+from .client import BillKitClient, _resolve_config  # pyright: ignore[reportPrivateUsage]
+
+_RegistryKey = tuple[str, str, TransportConfig]
+
+_clients: dict[_RegistryKey, BillKitClient] = {}
+_lock = threading.Lock()
+
+
+def shared_client(
+    api_key: str | None = None,
+    base_url: str | None = None,
+    *,
+    transport_config: TransportConfig | None = None,
+) -> BillKitClient:
+    """
+    Return the process-wide BillKitClient for this configuration, creating it on
+    first use.
+
+    Clients are keyed by (api_key, base_url, transport_config) after applying
+    the same defaults as BillKitClient, so repeated calls in e.g. a web worker
+    reuse one connection pool. In a forked child (gunicorn, multiprocessing)
+    every shared client gets a fresh pool on first use instead of sharing the
+    parent's sockets, and all shared clients are closed at interpreter exit.
+
+    Shared clients use the default retry, caching and decoding options; derive
+    variants with `with_options()` rather than closing or mutating them. A
+    client that was closed anyway is replaced on the next call.
+
+    Usage:
+        client = shared_client()
+        client.invoices.list()
+    """
+    key = _resolve_config(api_key, base_url, transport_config)
+    with _lock:
+        client = _clients.get(key)
+        if client is None or client._client.is_closed:  # pyright: ignore[reportPrivateUsage]
+            client = _clients[key] = BillKitClient(
+                key[0], key[1], transport_config=key[2]
+            )
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close and forget all clients returned by shared_client()."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _after_fork_in_child() -> None:
+    global _lock
+    # The parent may have held the lock while forking.
+    _lock = threading.Lock()
+    for client in _clients.values():
+        client._after_fork()  # pyright: ignore[reportPrivateUsage]
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+atexit.register(close_shared_clients)
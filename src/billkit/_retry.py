@@ -0,0 +1,125 @@
+import random
+import uuid
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from .exceptions import BillKitException
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Transport errors raised before any request bytes reached the server; these are
+# safe to retry whatever the HTTP method.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How transient failures are retried.
+
+    A request is retried when it fails with a transport error or with one of
+    `retry_statuses`, and it is safe to repeat: its method is idempotent, it
+    carries an Idempotency-Key header, or it never reached the server. Delays
+    grow exponentially from `backoff_base` up to `backoff_max` with full jitter;
+    a Retry-After header, when present, takes precedence, and one asking for
+    more than `max_retry_after` seconds gives up instead of retrying early.
+
+    Set `idempotency_keys=True` to send a generated Idempotency-Key with every
+    POST/PATCH so that those are retried too.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    idempotency_keys: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """A policy that never retries."""
+        return cls(max_attempts=1)
+
+    def retry_delay(
+        self,
+        method: str,
+        request_kwargs: Mapping[str, Any],
+        error: BillKitException,
+        retries: int,
+    ) -> float | None:
+        """Return the seconds to wait before retrying, or None to give up."""
+        if retries + 1 >= self.max_attempts:
+            return None
+        cause = error.__cause__
+        response: httpx.Response | None = None
+        if isinstance(cause, _NOT_SENT_ERRORS):
+            return self._backoff(retries)
+        if isinstance(cause, httpx.HTTPStatusError):
+            if cause.response.status_code not in self.retry_statuses:
+                return None
+            response = cause.response
+        elif not isinstance(cause, httpx.RequestError):
+            return None
+        # Uploaded file objects have been consumed by the first attempt.
+        if "files" in request_kwargs or not self._is_replayable(method, request_kwargs):
+            return None
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                # A server asking for a longer wait than we are willing to
+                # sleep gets its error surfaced rather than an early retry.
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self._backoff(retries)
+
+    def ensure_idempotency_key(
+        self, method: str, request_kwargs: dict[str, Any]
+    ) -> None:
+        """Attach a generated Idempotency-Key to non-idempotent requests when
+        `idempotency_keys` is enabled; the key is reused across attempts."""
+        if not self.idempotency_keys or method.upper() in self.idempotent_methods:
+            return
+        headers: dict[str, str] = dict(request_kwargs.get("headers") or {})
+        if not any(k.lower() == IDEMPOTENCY_HEADER.lower() for k in headers):
+            headers[IDEMPOTENCY_HEADER] = str(uuid.uuid4())
+        request_kwargs["headers"] = headers
+
+    def _is_replayable(self, method: str, request_kwargs: Mapping[str, Any]) -> bool:
+        if method.upper() in self.idempotent_methods:
+            return True
+        headers: Mapping[str, str] = request_kwargs.get("headers") or {}
+        return any(k.lower() == IDEMPOTENCY_HEADER.lower() for k in headers)
+
+    def _backoff(self, retries: int) -> float:
+        delay = min(self.backoff_max, self.backoff_base * 2**retries)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -1,12 +1,95 @@
-from dataclasses import dataclass
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 
+import httpx
+
+
+def _env_float(name: str, default: float | None) -> float | None:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    if value.lower() == "none":
+        return None
+    return float(value)
+
+
+def _env_int(name: str, default: int | None) -> int | None:
+    value = _env_float(name, default)
+    return None if value is None else int(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    Connection pool, timeout and protocol settings for the HTTP transport.
+
+    Timeouts are in seconds; None disables the corresponding limit.
+    Enabling http2 requires the optional `h2` dependency
+    (`pip install billkit[http2]`).
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    connect_timeout: float | None = 30.0
+    read_timeout: float | None = 30.0
+    write_timeout: float | None = 30.0
+    pool_timeout: float | None = 30.0
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        default = cls()
+        return cls(
+            max_connections=_env_int(
+                "BILLKIT_MAX_CONNECTIONS", default.max_connections
+            ),
+            max_keepalive_connections=_env_int(
+                "BILLKIT_MAX_KEEPALIVE_CONNECTIONS", default.max_keepalive_connections
+            ),
+            keepalive_expiry=_env_float(
+                "BILLKIT_KEEPALIVE_EXPIRY", default.keepalive_expiry
+            ),
+            connect_timeout=_env_float(
+                "BILLKIT_CONNECT_TIMEOUT", default.connect_timeout
+            ),
+            read_timeout=_env_float("BILLKIT_READ_TIMEOUT", default.read_timeout),
+            write_timeout=_env_float("BILLKIT_WRITE_TIMEOUT", default.write_timeout),
+            pool_timeout=_env_float("BILLKIT_POOL_TIMEOUT", default.pool_timeout),
+            http2=_env_bool("BILLKIT_HTTP2", default.http2),
+        )
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
 
 @dataclass
 class Settings:
     api_key: str | None = None
     base_url: str = "https://api.billkit.co/v1"
+    transport: TransportConfig = field(default_factory=TransportConfig)
 
     @classmethod
     def from_env(cls, env_file: str | None = None) -> "Settings":
@@ -22,6 +105,7 @@ class Settings:
         return cls(
             api_key=os.getenv("BILLKIT_SECRET_KEY"),
             base_url=os.getenv("BILLKIT_BASE_URL", "https://api.billkit.co/v1"),
+            transport=TransportConfig.from_env(),
         )
 
 
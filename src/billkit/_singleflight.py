@@ -0,0 +1,101 @@
+"""Coalescing of concurrent identical requests into one in-flight call."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    __slots__ = ("done", "error", "followers", "value")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time across threads; callers arriving
+    while a call is in flight wait for it and share its outcome.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        Return fn()'s result (or raise its error) and whether that same result
+        object is handed to more than one caller. Shared results must be copied
+        before being given out, since every caller receives the same object.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.followers > 0
+            call.done.set()
+        return call.value, shared
+
+
+class _Flight:
+    __slots__ = ("followers", "task")
+
+    def __init__(self, task: "asyncio.Task[Any]") -> None:
+        self.task = task
+        self.followers = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight. The shared call runs in its own task,
+    so cancelling one waiter does not cancel the request for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, _Flight] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """See SingleFlight.do."""
+        flight = self._flights.get(key)
+        if flight is not None:
+            flight.followers += 1
+            return await asyncio.shield(flight.task), True
+
+        async def run() -> Any:
+            return await fn()
+
+        flight = self._flights[key] = _Flight(asyncio.ensure_future(run()))
+        flight.task.add_done_callback(lambda t: self._finish(key, t))
+        value = await asyncio.shield(flight.task)
+        # _finish has run by now, so no further callers can join this flight.
+        return value, flight.followers > 0
+
+    def _finish(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        # Mark the outcome as retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
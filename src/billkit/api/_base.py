@@ -1,17 +1,146 @@
+import asyncio
 import os
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BufferedReader
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
-from ..models._base import _BaseItem  # pyright: ignore[reportPrivateUsage]
+from .._bulk import DEFAULT_CONCURRENCY, BulkResult, arun_bounded, run_bounded
+from .._polling import BatchPoller, is_batch_finished
+from ..exceptions import BatchTimeoutError
+from ..models._base import (
+    DocumentRecord,
+    _BaseBatchStatusResponse,  # pyright: ignore[reportPrivateUsage]
+    _BaseDocumentResponse,  # pyright: ignore[reportPrivateUsage]
+    _BaseItem,  # pyright: ignore[reportPrivateUsage]
+)
 
 if TYPE_CHECKING:
     from io import BytesIO
 
 T = TypeVar("T", bound="_BaseItem")
+D = TypeVar("D", bound="_BaseDocumentResponse")
+X = TypeVar("X")
 
 
-class _BaseDocuments(ABC, Generic[T]):  # pyright: ignore[reportUnusedClass]
+async def aopen_binary(path: str) -> BufferedReader:
+    """Open `path` for reading in a worker thread, keeping the event loop free."""
+
+    def open_binary() -> BufferedReader:
+        return open(path, "rb")
+
+    return await asyncio.to_thread(open_binary)
+
+
+def _pdf_path(dest_dir: Path, file_id: str) -> Path:
+    if not file_id or os.path.basename(file_id) != file_id:
+        raise ValueError(f"file_id {file_id!r} cannot be used as a file name")
+    return dest_dir / f"{file_id}.pdf"
+
+
+def _group_email_jobs(jobs: Iterable[Mapping[str, Any]]) -> Iterator[dict[str, Any]]:
+    """
+    Merge jobs sharing recipients, subject, body and sender into one email
+    attaching all their file_ids, in order of first appearance. Jobs missing
+    the fields to group on are passed through for send_email to reject.
+    """
+    groups: dict[tuple[Any, ...], dict[str, Any]] = {}
+    attachments: dict[tuple[Any, ...], dict[str, None]] = {}
+    for job in jobs:
+        try:
+            key = (
+                tuple(job["to"]),
+                job["subject"],
+                job.get("body", ""),
+                job.get("from_email"),
+            )
+            hash(key)
+        except (KeyError, TypeError):
+            yield dict(job)
+            continue
+        if key not in groups:
+            groups[key] = dict(job)
+            attachments[key] = {}
+        attachments[key].update(dict.fromkeys(job.get("file_ids") or ()))
+    for key, email in groups.items():
+        email["file_ids"] = list(attachments[key]) or None
+        yield email
+
+
+def _iter_pages(
+    fetch: Callable[..., Sequence[X]], page_size: int, prefetch: bool
+) -> Iterator[X]:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        offset = 0
+        page = fetch(limit=page_size, offset=offset)
+        while True:
+            next_page: Future[Sequence[X]] | None = None
+            has_more = len(page) >= page_size
+            if has_more and prefetch:
+                next_page = pool.submit(
+                    fetch, limit=page_size, offset=offset + page_size
+                )
+            yield from page
+            if not has_more:
+                return
+            offset += page_size
+            if next_page is not None:
+                page = next_page.result()
+            else:
+                page = fetch(limit=page_size, offset=offset)
+
+
+async def _aiter_pages(
+    fetch: Callable[..., Awaitable[Sequence[X]]], page_size: int, prefetch: bool
+) -> AsyncIterator[X]:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    offset = 0
+    page = await fetch(limit=page_size, offset=offset)
+    while True:
+        next_page: asyncio.Future[Sequence[X]] | None = None
+        has_more = len(page) >= page_size
+        if has_more and prefetch:
+            next_page = asyncio.ensure_future(
+                fetch(limit=page_size, offset=offset + page_size)
+            )
+        try:
+            for item in page:
+                yield item
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+            raise
+        if not has_more:
+            return
+        offset += page_size
+        if next_page is not None:
+            page = await next_page
+        else:
+            page = await fetch(limit=page_size, offset=offset)
+
+
+class _BaseDocuments(ABC, Generic[T, D]):  # pyright: ignore[reportUnusedClass]
+    _resource: str
+    """URL prefix of the document type, e.g. "invoices"."""
+    _document_model: type[D]
+    """Model of the documents returned by list()."""
+    _batch_status_model: type[_BaseBatchStatusResponse]
+    """Model of batch job statuses returned by get_batch_status()."""
+
     def __init__(self, requester: Callable[..., Any]) -> None:
         self._requester = requester
 
@@ -34,6 +163,8 @@ class _BaseDocuments(ABC, Generic[T]):  # pyright: ignore[reportUnusedClass]
         self,
         data_file_path: os.PathLike[str],
         items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
     ) -> Any:
         """Create a batch job from two CSV files (data + line items)."""
 
@@ -57,18 +188,423 @@ class _BaseDocuments(ABC, Generic[T]):  # pyright: ignore[reportUnusedClass]
     @abstractmethod
     def download_pdf(self, file_id: str) -> "BytesIO": ...
 
+    def download_many(
+        self,
+        file_ids: Iterable[str],
+        dest_dir: os.PathLike[str] | str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BulkResult[str, Path]]:
+        """Download many PDFs concurrently, streaming each one to disk.
+
+        Each PDF is written to `dest_dir/<file_id>.pdf` without being buffered in
+        memory. Failures are reported per file instead of aborting the run.
+
+        Args:
+            file_ids: Identifiers of the stored documents to download.
+                Repeated identifiers are downloaded once.
+            dest_dir: Directory to write the PDFs to; created if missing.
+            concurrency: Maximum number of downloads in flight at once.
+                Defaults to 8.
+
+        Returns:
+            One BulkResult per distinct file_id, in completion order, whose value is
+            the written path or whose error is the exception raised.
+        """
+        dest = Path(dest_dir)
+        dest.mkdir(parents=True, exist_ok=True)
+
+        def download(file_id: str) -> Path:
+            path = _pdf_path(dest, file_id)
+            self._requester(
+                "GET", f"{self._resource}/download?file_id={file_id}", stream_to=path
+            )
+            return path
+
+        return list(
+            run_bounded(download, dict.fromkeys(file_ids), concurrency=concurrency)
+        )
+
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[BulkResult[dict[str, Any], Any]]:
+        """Send many emails concurrently, yielding each result as it completes.
+
+        Each job holds send_email's keyword arguments (to, subject and
+        optionally body, from_email and file_ids). Sends are paced by the
+        client's rate_limiter, e.g. RateLimiter({"email/send": 10}), and a
+        failed send is reported in its result instead of stopping the run.
+
+        Args:
+            jobs: Emails to send.
+            group_attachments: Merge jobs with the same recipients, subject,
+                body and sender into one email attaching all their file_ids.
+                This changes what recipients receive and reads all jobs
+                before sending. Defaults to False.
+            concurrency: Maximum number of sends in flight at once.
+                Defaults to 8.
+
+        Returns:
+            Iterator of BulkResult in completion order, keyed by the job as
+            sent, whose value is the send_email response or whose error is
+            the exception raised.
+        """
+        if group_attachments:
+            jobs = _group_email_jobs(jobs)
+
+        def send(job: Mapping[str, Any]) -> Any:
+            return self.send_email(**job)
+
+        return run_bounded(send, map(dict, jobs), concurrency=concurrency)
+
     def get_batch_status(
         self,
         job_id: str,
     ) -> Any:
-        response_data: dict[str, Any] = self._requester(
-            "GET",
-            f"batch/jobs/{job_id}",
+        return self._requester(
+            "GET", f"batch/jobs/{job_id}", response_type=self._batch_status_model
         )
-        return response_data
+
+    def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Any:
+        """Poll a batch job until it finishes and return its final status.
+
+        The polling interval adapts to the job's progress: it tightens while
+        records are being imported (based on total_count and the observed import
+        rate) and backs off while the job is queued or stalled.
+
+        Args:
+            job_id: Identifier of the batch job.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+                Defaults to 600.
+            min_interval: Shortest delay between polls in seconds. Defaults to 1.
+            max_interval: Longest delay between polls in seconds. Defaults to 30.
+
+        Returns:
+            The final batch status response.
+
+        Raises:
+            BatchTimeoutError: If the job is still running after timeout seconds.
+        """
+        status: Any = None
+        for status in self._poll_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            pass
+        return status
+
+    def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[Any]:
+        """Yield a batch job's records as soon as they are imported.
+
+        Polls like wait_for_batch and yields each new record once, stopping when
+        the job finishes. Arguments are as for wait_for_batch; pass
+        timeout=None to follow a long job without a limit.
+        """
+        seen = 0
+        for status in self._poll_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            records: Sequence[Any] = status.records or ()
+            yield from records[seen:]
+            seen = max(seen, len(records))
+
+    def _poll_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None,
+        min_interval: float,
+        max_interval: float,
+    ) -> Iterator[Any]:
+        poller = BatchPoller(
+            min_interval=min_interval, max_interval=max_interval, timeout=timeout
+        )
+        while True:
+            status = self.get_batch_status(job_id)
+            yield status
+            if is_batch_finished(status):
+                return
+            if poller.expired():
+                raise BatchTimeoutError(
+                    f"Batch job {job_id} did not finish within {timeout} seconds",
+                    job_id=job_id,
+                    last_status=status,
+                )
+            time.sleep(poller.next_delay(status))
 
     @abstractmethod
-    def list(self, *, limit: int, offset: int) -> Sequence[Any]: ...
+    def list(self, *, limit: int, offset: int) -> Sequence[D]: ...
+
+    def iter_all(self, *, page_size: int = 50, prefetch: bool = True) -> Iterator[D]:
+        """Iterate over every document, fetching pages lazily.
+
+        While the caller consumes one page the next one is fetched in the
+        background, so at most two pages are held in memory. Iteration stops
+        after the first page shorter than page_size.
+
+        Args:
+            page_size: Number of documents requested per page. Defaults to 50.
+            prefetch: Whether to fetch the next page in the background.
+                Defaults to True.
+
+        Returns:
+            Iterator over the documents, in API order.
+        """
+        return _iter_pages(self.list, page_size, prefetch)
+
+    def list_records(
+        self, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[DocumentRecord[D]]:
+        """List documents as lightweight records, skipping model validation.
+
+        Useful when paging through many documents to read a few fields such
+        as file_id and status; promote a record with DocumentRecord.to_model().
+
+        Args:
+            limit: Maximum number of documents to return. Defaults to 50.
+            offset: Number of documents to skip. Defaults to 0.
+
+        Returns:
+            Sequence of DocumentRecord, one per document.
+        """
+        response_data: list[dict[str, Any]] = self._requester(
+            "GET", self._resource, params={"limit": limit, "offset": offset}
+        )
+        model = self._document_model
+        return [DocumentRecord(item, model) for item in response_data]
+
+    def iter_all_records(
+        self, *, page_size: int = 50, prefetch: bool = True
+    ) -> Iterator[DocumentRecord[D]]:
+        """Iterate over every document as a lightweight record. See iter_all
+        and list_records."""
+        return _iter_pages(self.list_records, page_size, prefetch)
 
     @abstractmethod
     def get_document(self, file_id: str) -> Any: ...
+
+
+class _AsyncBaseDocuments(ABC, Generic[T, D]):  # pyright: ignore[reportUnusedClass]
+    _resource: str
+    """URL prefix of the document type, e.g. "invoices"."""
+    _document_model: type[D]
+    """Model of the documents returned by list()."""
+    _batch_status_model: type[_BaseBatchStatusResponse]
+    """Model of batch job statuses returned by get_batch_status()."""
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        self._requester = requester
+
+    @abstractmethod
+    async def create(
+        self,
+        *,
+        client_name: str,
+        client_email: str,
+        items: Sequence[T],
+        save_to_cloud: bool = True,
+        **kwargs: Any,
+    ) -> "BytesIO": ...
+
+    @abstractmethod
+    async def delete(self, file_id: str) -> Any: ...
+
+    @abstractmethod
+    async def create_batch_from_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
+    ) -> Any:
+        """Create a batch job from two CSV files (data + line items)."""
+
+    @abstractmethod
+    async def create_batch_from_json(
+        self,
+        data: dict[str, Any],
+    ) -> Any: ...
+
+    @abstractmethod
+    async def send_email(
+        self,
+        *,
+        to: Sequence[str],
+        subject: str,
+        body: str,
+        from_email: str | None = None,
+        file_ids: Sequence[str] | None = None,
+    ) -> Any: ...
+
+    @abstractmethod
+    async def download_pdf(self, file_id: str) -> "BytesIO": ...
+
+    async def download_many(
+        self,
+        file_ids: Iterable[str],
+        dest_dir: os.PathLike[str] | str,
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BulkResult[str, Path]]:
+        """Download many PDFs concurrently, streaming each one to disk. See
+        _BaseDocuments.download_many."""
+        dest = Path(dest_dir)
+        await asyncio.to_thread(dest.mkdir, parents=True, exist_ok=True)
+
+        async def download(file_id: str) -> Path:
+            path = _pdf_path(dest, file_id)
+            await self._requester(
+                "GET", f"{self._resource}/download?file_id={file_id}", stream_to=path
+            )
+            return path
+
+        return [
+            result
+            async for result in arun_bounded(
+                download, dict.fromkeys(file_ids), concurrency=concurrency
+            )
+        ]
+
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult[dict[str, Any], Any]]:
+        """Send many emails concurrently, yielding each result as it completes.
+        See _BaseDocuments.send_email_many."""
+        if group_attachments:
+            jobs = _group_email_jobs(jobs)
+
+        async def send(job: Mapping[str, Any]) -> Any:
+            return await self.send_email(**job)
+
+        return arun_bounded(send, map(dict, jobs), concurrency=concurrency)
+
+    async def get_batch_status(
+        self,
+        job_id: str,
+    ) -> Any:
+        return await self._requester(
+            "GET", f"batch/jobs/{job_id}", response_type=self._batch_status_model
+        )
+
+    async def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Any:
+        """Poll a batch job until it finishes and return its final status. See
+        _BaseDocuments.wait_for_batch."""
+        status: Any = None
+        async for status in self._poll_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            pass
+        return status
+
+    async def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[Any]:
+        """Yield a batch job's records as soon as they are imported. See
+        _BaseDocuments.iter_batch_records."""
+        seen = 0
+        async for status in self._poll_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            records: Sequence[Any] = status.records or ()
+            for record in records[seen:]:
+                yield record
+            seen = max(seen, len(records))
+
+    async def _poll_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None,
+        min_interval: float,
+        max_interval: float,
+    ) -> AsyncIterator[Any]:
+        poller = BatchPoller(
+            min_interval=min_interval, max_interval=max_interval, timeout=timeout
+        )
+        while True:
+            status = await self.get_batch_status(job_id)
+            yield status
+            if is_batch_finished(status):
+                return
+            if poller.expired():
+                raise BatchTimeoutError(
+                    f"Batch job {job_id} did not finish within {timeout} seconds",
+                    job_id=job_id,
+                    last_status=status,
+                )
+            await asyncio.sleep(poller.next_delay(status))
+
+    @abstractmethod
+    async def list(self, *, limit: int, offset: int) -> Sequence[D]: ...
+
+    def iter_all(
+        self, *, page_size: int = 50, prefetch: bool = True
+    ) -> AsyncIterator[D]:
+        """Iterate over every document, fetching pages lazily. See
+        _BaseDocuments.iter_all."""
+        return _aiter_pages(self.list, page_size, prefetch)
+
+    async def list_records(
+        self, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[DocumentRecord[D]]:
+        """List documents as lightweight records. See _BaseDocuments.list_records."""
+        response_data: list[dict[str, Any]] = await self._requester(
+            "GET", self._resource, params={"limit": limit, "offset": offset}
+        )
+        model = self._document_model
+        return [DocumentRecord(item, model) for item in response_data]
+
+    def iter_all_records(
+        self, *, page_size: int = 50, prefetch: bool = True
+    ) -> AsyncIterator[DocumentRecord[D]]:
+        """Iterate over every document as a lightweight record. See
+        _BaseDocuments.iter_all_records."""
+        return _aiter_pages(self.list_records, page_size, prefetch)
+
+    @abstractmethod
+    async def get_document(self, file_id: str) -> Any: ...
@@ -0,0 +1,203 @@
+"""Client-side chunking of large JSON batch submissions."""
+
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Generic, Protocol, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .._bulk import BulkResult
+
+S_co = TypeVar("S_co", covariant=True)
+R_co = TypeVar("R_co", covariant=True)
+P = TypeVar("P", bound=BaseModel)
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_MAX_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ChunkInfo:
+    """Position of a chunk in the batch and the number of payloads it holds."""
+
+    index: int
+    count: int
+
+
+@dataclass(frozen=True)
+class JsonChunk(ChunkInfo):
+    """A serialized slice of a batch, ready to be posted as one job."""
+
+    body: bytes
+
+
+def without_body(result: BulkResult[JsonChunk, Any]) -> BulkResult[ChunkInfo, Any]:
+    """
+    Re-key a successful chunk submission by its ChunkInfo so the serialized
+    body can be freed; failed chunks keep theirs for resubmission.
+    """
+    chunk = result.key
+    if not result.ok:
+        return BulkResult(chunk, error=result.error)
+    return BulkResult(ChunkInfo(chunk.index, chunk.count), value=result.value)
+
+
+def iter_json_chunks(
+    payloads: Iterable[P | dict[str, Any]],
+    model: type[P],
+    key: str,
+    *,
+    chunk_size: int,
+    max_chunk_bytes: int,
+    invalid: list[tuple[int, ValidationError]],
+) -> Iterator[JsonChunk]:
+    """
+    Validate and serialize `payloads` one at a time into JSON request bodies of
+    the form {key: [...]}.
+
+    A chunk is closed when it reaches `chunk_size` payloads or when adding the
+    next payload would exceed `max_chunk_bytes` (a single oversized payload
+    still gets a chunk of its own). Payloads that fail validation are skipped
+    and appended to `invalid` with their position in the input.
+    """
+    if chunk_size < 1 or max_chunk_bytes < 1:
+        raise ValueError("chunk_size and max_chunk_bytes must be positive")
+    prefix = b'{"' + key.encode() + b'":['
+    suffix = b"]}"
+    parts: list[bytes] = []
+    size = len(prefix) + len(suffix)
+    index = 0
+    for position, payload in enumerate(payloads):
+        try:
+            if not isinstance(payload, model):
+                payload = model.model_validate(payload)
+        except ValidationError as e:
+            invalid.append((position, e))
+            continue
+        encoded = payload.model_dump_json(exclude_unset=True).encode()
+        if parts and (
+            len(parts) >= chunk_size or size + len(encoded) + 1 > max_chunk_bytes
+        ):
+            yield JsonChunk(index, len(parts), prefix + b",".join(parts) + suffix)
+            index += 1
+            parts = []
+            size = len(prefix) + len(suffix)
+        parts.append(encoded)
+        size += len(encoded) + 1
+    if parts:
+        yield JsonChunk(index, len(parts), prefix + b",".join(parts) + suffix)
+
+
+class _BatchSource(Protocol[S_co, R_co]):
+    def get_batch_status(self, job_id: str) -> S_co: ...
+
+    def wait_for_batch(self, job_id: str, *, timeout: float | None = ...) -> S_co: ...
+
+    def iter_batch_records(self, job_id: str) -> Iterator[R_co]: ...
+
+
+class _AsyncBatchSource(Protocol[S_co, R_co]):
+    async def get_batch_status(self, job_id: str) -> S_co: ...
+
+    async def wait_for_batch(
+        self, job_id: str, *, timeout: float | None = ...
+    ) -> S_co: ...
+
+    def iter_batch_records(self, job_id: str) -> AsyncIterator[R_co]: ...
+
+
+class _BaseBatchGroup:
+    def __init__(
+        self,
+        chunks: Iterable[BulkResult[ChunkInfo, Any]],
+        invalid: list[tuple[int, ValidationError]],
+    ) -> None:
+        self.chunks = sorted(chunks, key=lambda chunk: chunk.key.index)
+        """One result per submitted chunk, in input order; the value is the
+        batch job response. Only failed chunks keep their JsonChunk body."""
+        self.invalid = invalid
+        """(input position, error) for every payload skipped by validation."""
+
+    @property
+    def job_ids(self) -> list[str]:
+        return [chunk.value.job_id for chunk in self.chunks if chunk.value is not None]
+
+    @property
+    def failed(self) -> list[BulkResult[JsonChunk, Any]]:
+        """Chunks whose submission failed; `key.body` can be resubmitted."""
+        return [
+            BulkResult(chunk.key, error=chunk.error)
+            for chunk in self.chunks
+            if isinstance(chunk.key, JsonChunk)
+        ]
+
+    @property
+    def submitted_count(self) -> int:
+        """Number of payloads in successfully submitted chunks."""
+        return sum(chunk.key.count for chunk in self.chunks if chunk.ok)
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class BatchGroup(_BaseBatchGroup, Generic[S_co, R_co]):
+    """Handle tracking every job created by a chunked batch submission."""
+
+    def __init__(
+        self,
+        source: _BatchSource[S_co, R_co],
+        chunks: Iterable[BulkResult[ChunkInfo, Any]],
+        invalid: list[tuple[int, ValidationError]],
+    ) -> None:
+        super().__init__(chunks, invalid)
+        self._source = source
+
+    def statuses(self) -> list[S_co]:
+        """Fetch the current status of every job."""
+        return [self._source.get_batch_status(job_id) for job_id in self.job_ids]
+
+    def wait(self, timeout: float | None = None) -> list[S_co]:
+        """Wait for every job to finish, sharing one overall timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return [
+            self._source.wait_for_batch(job_id, timeout=_remaining(deadline))
+            for job_id in self.job_ids
+        ]
+
+    def iter_records(self) -> Iterator[R_co]:
+        """Yield the records of every job, job by job, as they are imported."""
+        for job_id in self.job_ids:
+            yield from self._source.iter_batch_records(job_id)
+
+
+class AsyncBatchGroup(_BaseBatchGroup, Generic[S_co, R_co]):
+    """Async counterpart of BatchGroup."""
+
+    def __init__(
+        self,
+        source: _AsyncBatchSource[S_co, R_co],
+        chunks: Iterable[BulkResult[ChunkInfo, Any]],
+        invalid: list[tuple[int, ValidationError]],
+    ) -> None:
+        super().__init__(chunks, invalid)
+        self._source = source
+
+    async def statuses(self) -> list[S_co]:
+        """Fetch the current status of every job."""
+        return [await self._source.get_batch_status(job_id) for job_id in self.job_ids]
+
+    async def wait(self, timeout: float | None = None) -> list[S_co]:
+        """Wait for every job to finish, sharing one overall timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return [
+            await self._source.wait_for_batch(job_id, timeout=_remaining(deadline))
+            for job_id in self.job_ids
+        ]
+
+    async def iter_records(self) -> AsyncIterator[R_co]:
+        """Yield the records of every job, job by job, as they are imported."""
+        for job_id in self.job_ids:
+            async for record in self._source.iter_batch_records(job_id):
+                yield record
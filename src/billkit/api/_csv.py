@@ -0,0 +1,174 @@
+"""Client-side validation of batch CSV files before upload."""
+
+import csv
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from .._adapters import list_adapter
+
+# Rows are validated in slices through one list TypeAdapter call, which keeps
+# per-row Python overhead low while bounding memory to one slice.
+_VALIDATION_SLICE = 512
+
+
+@dataclass(frozen=True)
+class CSVRowError:
+    """A problem found in one row of a batch CSV file."""
+
+    file: str
+    line: int
+    """1-based line number in the file (the row's last line if it spans several)."""
+    column: str | None
+    message: str
+
+    def __str__(self) -> str:
+        where = f"{self.file}:{self.line}"
+        if self.column:
+            where += f" [{self.column}]"
+        return f"{where}: {self.message}"
+
+
+class _ErrorSink:
+    def __init__(self, max_errors: int, *, enabled: bool = True) -> None:
+        self.errors: list[CSVRowError] = []
+        self.max_errors = max_errors
+        self.enabled = enabled
+
+    @property
+    def full(self) -> bool:
+        return self.enabled and len(self.errors) >= self.max_errors
+
+    def add(self, error: CSVRowError) -> None:
+        if self.enabled and not self.full:
+            self.errors.append(error)
+
+
+def _iter_rows(
+    path: str, id_column: str, sink: _ErrorSink | None
+) -> Iterator[tuple[int, str, dict[str, Any]]]:
+    """Yield (line, id, non-empty cells) for each well-formed row of `path`.
+
+    Problems are reported to `sink`; pass None when re-reading a file whose
+    problems were already reported.
+    """
+    if sink is None:
+        sink = _ErrorSink(max_errors=0, enabled=False)
+    name = os.path.basename(path)
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        if not fieldnames:
+            sink.add(CSVRowError(name, 1, None, "file has no header row"))
+            return
+        if id_column not in fieldnames:
+            sink.add(CSVRowError(name, 1, id_column, "missing id column"))
+            return
+        for row in reader:
+            if sink.full:
+                return
+            line = reader.line_num
+            if None in row or any(value is None for value in row.values()):
+                sink.add(
+                    CSVRowError(name, line, None, f"expected {len(fieldnames)} columns")
+                )
+                continue
+            cells = {k: v for k, v in row.items() if v != ""}
+            yield line, row[id_column], cells
+
+
+def _validate_slice(
+    name: str,
+    model: type[BaseModel],
+    rows: list[dict[str, Any]],
+    lines: list[int],
+    sink: _ErrorSink,
+) -> None:
+    try:
+        list_adapter(model).validate_python(rows)
+    except ValidationError as e:
+        for err in e.errors(include_url=False):
+            index, *field = err["loc"]
+            column = ".".join(str(part) for part in field) or None
+            sink.add(CSVRowError(name, lines[int(index)], column, err["msg"]))
+
+
+def _validate_file(
+    path: str,
+    model: type[BaseModel],
+    id_column: str,
+    sink: _ErrorSink,
+    *,
+    placeholders: dict[str, Any] | None = None,
+    unique_ids: bool = False,
+) -> set[str]:
+    name = os.path.basename(path)
+    ids: set[str] = set()
+    rows: list[dict[str, Any]] = []
+    lines: list[int] = []
+    for line, row_id, cells in _iter_rows(path, id_column, sink):
+        if not row_id:
+            sink.add(CSVRowError(name, line, id_column, "id is empty"))
+        elif unique_ids and row_id in ids:
+            sink.add(CSVRowError(name, line, id_column, f"duplicate id {row_id!r}"))
+        ids.add(row_id)
+        if placeholders:
+            cells.update(placeholders)
+        rows.append(cells)
+        lines.append(line)
+        if len(rows) >= _VALIDATION_SLICE:
+            _validate_slice(name, model, rows, lines, sink)
+            rows, lines = [], []
+    if rows:
+        _validate_slice(name, model, rows, lines, sink)
+    return ids
+
+
+def validate_batch_csv(
+    data_path: str,
+    items_path: str,
+    *,
+    payload_model: type[BaseModel],
+    item_model: type[BaseModel],
+    id_column: str = "id",
+    max_errors: int = 100,
+) -> list[CSVRowError]:
+    """
+    Validate a pair of batch CSV files row by row without loading them.
+
+    Document rows are checked against `payload_model` (items excepted) and line
+    item rows against `item_model`; empty cells count as missing values. Rows
+    are then cross-checked by `id_column`: every document needs at least one
+    item and every item must reference a document. Only the ids are kept in
+    memory. At most `max_errors` errors are collected.
+    """
+    sink = _ErrorSink(max_errors)
+    data_ids = _validate_file(
+        data_path,
+        payload_model,
+        id_column,
+        sink,
+        placeholders={"items": []},
+        unique_ids=True,
+    )
+    item_ids = _validate_file(items_path, item_model, id_column, sink)
+    # Only re-read a file for line numbers when its ids do not match up.
+    if item_ids - data_ids and not sink.full:
+        name = os.path.basename(items_path)
+        for line, row_id, _ in _iter_rows(items_path, id_column, None):
+            if row_id and row_id not in data_ids:
+                sink.add(
+                    CSVRowError(
+                        name, line, id_column, f"unknown document id {row_id!r}"
+                    )
+                )
+    if data_ids - item_ids and not sink.full:
+        name = os.path.basename(data_path)
+        for line, row_id, _ in _iter_rows(data_path, id_column, None):
+            if row_id and row_id not in item_ids:
+                sink.add(CSVRowError(name, line, id_column, "document has no items"))
+    data_name = os.path.basename(data_path)
+    return sorted(sink.errors, key=lambda e: (e.file != data_name, e.line))
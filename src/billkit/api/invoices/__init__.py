@@ -1,11 +1,24 @@
+import asyncio
 import os
-from collections.abc import Callable, Sequence
-from typing import Any, get_args
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import Any, get_args, overload
 
+from pydantic import ValidationError
 from typing_extensions import override
 
-from ...models._base import PDFResponse
+from ..._bulk import DEFAULT_CONCURRENCY, BulkResult, arun_bounded, run_bounded
+from ...exceptions import CSVValidationError
+from ...models._base import PDFResponse, StreamedPDF, StreamTarget
 from ...models.invoices import (
+    InvoiceBatchRecord,
     InvoiceBatchResponse,
     InvoiceBatchStatusResponse,
     InvoiceByIdResponse,
@@ -19,12 +32,37 @@ from ...models.invoices import (
     InvoiceStatusUpdateRequest,
     InvoiceStatusUpdateResponse,
 )
-from .._base import _BaseDocuments  # pyright: ignore[reportPrivateUsage]
+from .._base import (
+    _AsyncBaseDocuments,  # pyright: ignore[reportPrivateUsage]
+    _BaseDocuments,  # pyright: ignore[reportPrivateUsage]
+    aopen_binary,
+)
+from .._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CHUNK_BYTES,
+    AsyncBatchGroup,
+    BatchGroup,
+    JsonChunk,
+    iter_json_chunks,
+    without_body,
+)
+from .._csv import CSVRowError, validate_batch_csv
+
+_INVOICE_STATUSES: tuple[str, ...] = get_args(InvoiceStatus)
 
 
-class Invoices(_BaseDocuments[InvoiceItem]):
+def _check_status(invoice_status: str) -> None:
+    if invoice_status not in _INVOICE_STATUSES:
+        raise ValueError(f"invoice_status must be either {_INVOICE_STATUSES}")
+
+
+class Invoices(_BaseDocuments[InvoiceItem, InvoiceDocumentResponse]):
     """API client for creating, listing, and managing invoices."""
 
+    _resource = "invoices"
+    _document_model = InvoiceDocumentResponse
+    _batch_status_model = InvoiceBatchStatusResponse
+
     def __init__(self, requester: Callable[..., Any]) -> None:
         super().__init__(requester)
 
@@ -58,21 +96,25 @@ class Invoices(_BaseDocuments[InvoiceItem]):
             PDFResponse: File-like object containing the PDF bytes; may include
                 file_id if save_to_cloud is True.
         """
-        payload_dict: Any = dict(
-            client_name=client_name,
-            client_email=client_email,
-            items=[item.model_dump(mode="json", exclude_unset=True) for item in items],
-            invoice_number=invoice_number,
-            invoice_date=invoice_date,
-            upload_to_s3=save_to_cloud,
-            due_date=due_date,
-            **kwargs,
-        )
-        payload = InvoiceCreatePayload(**payload_dict)
+        # Validate once (item models are reused as-is) and serialize straight
+        # to JSON bytes instead of round-tripping every item through a dict.
+        payload = InvoiceCreatePayload.model_validate(
+            dict(
+                client_name=client_name,
+                client_email=client_email,
+                items=items,
+                invoice_number=invoice_number,
+                invoice_date=invoice_date,
+                upload_to_s3=save_to_cloud,
+                due_date=due_date,
+                **kwargs,
+            )
+        )
         response_data: PDFResponse = self._requester(
             "POST",
             "invoices/generate",
-            json=payload.model_dump(mode="json", exclude_unset=True),
+            content=payload.model_dump_json(exclude_unset=True),
+            headers={"Content-Type": "application/json"},
         )
         return response_data
 
@@ -91,18 +133,56 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Raises:
             ValueError: If invoice_status is not a valid InvoiceStatus value.
         """
-        if invoice_status not in get_args(InvoiceStatus):
-            raise ValueError(f"invoice_status must be either {get_args(InvoiceStatus)}")
+        _check_status(invoice_status)
 
         payload: InvoiceStatusUpdateRequest = InvoiceStatusUpdateRequest(
             file_id=file_id,
             status=invoice_status,
         )
 
-        request_data: dict[str, Any] = self._requester(
-            "PATCH", "invoices/status", json=payload.model_dump()
+        request_data: InvoiceStatusUpdateResponse = self._requester(
+            "PATCH",
+            "invoices/status",
+            json=payload.model_dump(),
+            response_type=InvoiceStatusUpdateResponse,
         )
-        return InvoiceStatusUpdateResponse(**request_data)
+        return request_data
+
+    def update_status_many(
+        self,
+        updates: Mapping[str, InvoiceStatus] | Iterable[tuple[str, InvoiceStatus]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BulkResult[str, InvoiceStatusUpdateResponse]]:
+        """Update the status of many invoices concurrently.
+
+        The PATCH requests share the client's connection pool. Failures,
+        including invalid statuses, are reported per invoice instead of
+        aborting the run.
+
+        Args:
+            updates: New status per file_id, as a mapping or (file_id, status)
+                pairs; for repeated file_ids the last status wins.
+            concurrency: Maximum number of updates in flight at once.
+                Defaults to 8.
+
+        Returns:
+            One BulkResult per file_id, in completion order, whose value is
+            the InvoiceStatusUpdateResponse or whose error is the exception
+            raised.
+
+        Usage:
+            results = client.invoices.update_status_many(
+                {payment.file_id: "paid" for payment in payments}
+            )
+            failed = [result.key for result in results if not result.ok]
+        """
+        statuses = dict(updates)
+
+        def update(file_id: str) -> InvoiceStatusUpdateResponse:
+            return self.update_status(file_id, invoice_status=statuses[file_id])
+
+        return list(run_bounded(update, statuses, concurrency=concurrency))
 
     def delete(self, file_id: str) -> InvoiceDeleteResponse:
         """Delete an invoice document by file_id.
@@ -113,8 +193,10 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Returns:
             InvoiceDeleteResponse: Confirmation of the deletion.
         """
-        response_data = self._requester("DELETE", f"invoices?file_id={file_id}")
-        return InvoiceDeleteResponse(**response_data)
+        response_data: InvoiceDeleteResponse = self._requester(
+            "DELETE", f"invoices?file_id={file_id}", response_type=InvoiceDeleteResponse
+        )
+        return response_data
 
     def send_email(
         self,
@@ -145,23 +227,66 @@ class Invoices(_BaseDocuments[InvoiceItem]):
             file_ids=file_ids,
         )
 
-        response_data = self._requester("POST", "email/send", json=payload.model_dump())
-        return InvoiceSendEmailResponse(**response_data)
+        response_data: InvoiceSendEmailResponse = self._requester(
+            "POST",
+            "email/send",
+            json=payload.model_dump(),
+            response_type=InvoiceSendEmailResponse,
+        )
+        return response_data
+
+    @override
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[BulkResult[dict[str, Any], InvoiceSendEmailResponse]]:
+        """Send many invoice emails concurrently, yielding each result as it
+        completes. See _BaseDocuments.send_email_many.
+
+        Usage:
+            jobs = (
+                {"to": [c.email], "subject": "Reminder", "file_ids": [c.file_id]}
+                for c in overdue
+            )
+            for result in client.invoices.send_email_many(jobs):
+                if not result.ok:
+                    print(result.key["to"], result.error)
+        """
+        return super().send_email_many(
+            jobs, group_attachments=group_attachments, concurrency=concurrency
+        )
 
     def create_batch_from_csv(
         self,
         data_file_path: os.PathLike[str],
         items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
     ) -> InvoiceBatchResponse:
         """Create a batch invoices job from two CSV files (invoices data + line items).
 
+        Both files are streamed to the API in chunks rather than read into
+        memory.
+
         Args:
             data_file_path: Path to the CSV with invoice-level data.
             items_file_path: Path to the CSV with line items.
+            validate: Whether to check every row with validate_csv before
+                uploading. Defaults to False.
 
         Returns:
             InvoiceBatchResponse: Job details including job_id for status polling.
+
+        Raises:
+            CSVValidationError: If validate is True and any row is invalid.
         """
+        if validate:
+            errors = self.validate_csv(data_file_path, items_file_path)
+            if errors:
+                raise CSVValidationError(errors)
         data_path = os.fspath(data_file_path)
         items_path = os.fspath(items_file_path)
         with open(data_path, "rb") as invoice_f, open(items_path, "rb") as items_f:
@@ -169,10 +294,42 @@ class Invoices(_BaseDocuments[InvoiceItem]):
                 "invoice_csv": (os.path.basename(data_path), invoice_f, "text/csv"),
                 "items_csv": (os.path.basename(items_path), items_f, "text/csv"),
             }
-            return InvoiceBatchResponse(
-                **self._requester("POST", "batch/invoices/csv", files=files)
+            return self._requester(
+                "POST",
+                "batch/invoices/csv",
+                files=files,
+                response_type=InvoiceBatchResponse,
             )
 
+    def validate_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        max_errors: int = 100,
+    ) -> list[CSVRowError]:
+        """Validate batch invoice CSV files locally, row by row, without uploading.
+
+        Invoice rows are checked against InvoiceCreatePayload and line item rows
+        against InvoiceItem; rows are linked by their id column. Neither file is
+        loaded into memory.
+
+        Args:
+            data_file_path: Path to the CSV with invoice-level data.
+            items_file_path: Path to the CSV with line items.
+            max_errors: Stop after this many problems. Defaults to 100.
+
+        Returns:
+            List of CSVRowError (file, line, column, message); empty if valid.
+        """
+        return validate_batch_csv(
+            os.fspath(data_file_path),
+            os.fspath(items_file_path),
+            payload_model=InvoiceCreatePayload,
+            item_model=InvoiceItem,
+            max_errors=max_errors,
+        )
+
     @override
     def get_batch_status(self, job_id: str) -> InvoiceBatchStatusResponse:
         """Get the status and results of a batch invoices job.
@@ -184,8 +341,60 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Returns:
             InvoiceBatchStatusResponse: Current status and any completed outputs.
         """
-        data = super().get_batch_status(job_id)
-        return InvoiceBatchStatusResponse.model_validate(data)
+        status: InvoiceBatchStatusResponse = super().get_batch_status(job_id)
+        return status
+
+    @override
+    def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> InvoiceBatchStatusResponse:
+        """Poll a batch invoices job until it finishes, with adaptive backoff.
+
+        Args:
+            job_id: Identifier of the batch job.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+                Defaults to 600.
+            min_interval: Shortest delay between polls in seconds. Defaults to 1.
+            max_interval: Longest delay between polls in seconds. Defaults to 30.
+
+        Returns:
+            InvoiceBatchStatusResponse: The final status, including all records.
+
+        Raises:
+            BatchTimeoutError: If the job is still running after timeout seconds.
+        """
+        status: InvoiceBatchStatusResponse = super().wait_for_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        return status
+
+    @override
+    def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[InvoiceBatchRecord]:
+        """Yield each InvoiceBatchRecord of a batch job as soon as it is imported.
+
+        Polls like wait_for_batch and stops once the job finishes.
+        """
+        return super().iter_batch_records(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
 
     def create_batch_from_json(
         self,
@@ -200,8 +409,59 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Returns:
             InvoiceBatchResponse: Job details including job_id for status polling.
         """
-        return InvoiceBatchResponse(
-            **self._requester("POST", "batch/invoices/json", json=data)
+        return self._requester(
+            "POST", "batch/invoices/json", json=data, response_type=InvoiceBatchResponse
+        )
+
+    def submit_batch(
+        self,
+        payloads: Iterable[InvoiceCreatePayload | dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = 4,
+    ) -> BatchGroup[InvoiceBatchStatusResponse, InvoiceBatchRecord]:
+        """Submit a very large invoice batch as several size-bounded JSON jobs.
+
+        Payloads are validated and serialized one at a time, grouped into chunks
+        of at most chunk_size payloads and max_chunk_bytes of JSON, and the
+        chunks are posted concurrently. A chunk's body is released once it is
+        accepted, so at most `concurrency` bodies (plus those of failed chunks)
+        are held in memory at a time.
+
+        Args:
+            payloads: InvoiceCreatePayload objects, or dicts to be validated as such.
+            chunk_size: Maximum payloads per job. Defaults to 1000.
+            max_chunk_bytes: Maximum JSON body size per job. Defaults to 4 MiB.
+            concurrency: Maximum chunk submissions in flight. Defaults to 4.
+
+        Returns:
+            BatchGroup: Handle over all created jobs (job_ids, statuses(),
+                wait(), iter_records()), plus failed chunks and any payloads
+                skipped because they failed validation.
+        """
+        invalid: list[tuple[int, ValidationError]] = []
+        chunks = iter_json_chunks(
+            payloads,
+            InvoiceCreatePayload,
+            "invoices",
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            invalid=invalid,
+        )
+        results = map(
+            without_body,
+            run_bounded(self._submit_json_chunk, chunks, concurrency=concurrency),
+        )
+        return BatchGroup(self, results, invalid)
+
+    def _submit_json_chunk(self, chunk: JsonChunk) -> InvoiceBatchResponse:
+        return self._requester(
+            "POST",
+            "batch/invoices/json",
+            content=chunk.body,
+            headers={"Content-Type": "application/json"},
+            response_type=InvoiceBatchResponse,
         )
 
     def list(
@@ -216,26 +476,41 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Returns:
             Sequence of InvoiceDocumentResponse for each invoice.
         """
-        response_data = self._requester(
-            "GET", "invoices", params={"limit": limit, "offset": offset}
+        response_data: list[InvoiceDocumentResponse] = self._requester(
+            "GET",
+            "invoices",
+            params={"limit": limit, "offset": offset},
+            response_type=list[InvoiceDocumentResponse],
         )
-        return [InvoiceDocumentResponse.model_validate(item) for item in response_data]
+        return response_data
+
+    @overload
+    def download_pdf(self, file_id: str, *, stream_to: None = None) -> PDFResponse: ...
 
-    def download_pdf(self, file_id: str) -> PDFResponse:
+    @overload
+    def download_pdf(self, file_id: str, *, stream_to: StreamTarget) -> StreamedPDF: ...
+
+    def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget | None = None
+    ) -> PDFResponse | StreamedPDF:
         """Download the PDF of the specified invoice.
 
         Args:
             file_id: Identifier of the stored invoice.
+            stream_to: Optional file path or binary file object. When given, the
+                PDF is streamed to it in chunks instead of being held in memory;
+                paths are written atomically. Defaults to None.
 
         Returns:
-            PDFResponse: File-like object containing the PDF bytes.
+            PDFResponse: File-like object containing the PDF bytes, or
+                StreamedPDF (file_id and bytes written) when stream_to is given.
 
         Note:
-            To get document metadata (invoice_number, due_date, status, etc.)
-            instead of the PDF, use client.invoices.get_document(file_id).
+            To get document metadata (invoice_number, due_date, status, etc.) instead of
+            the PDF, use client.invoices.get_document(file_id).
         """
-        response_data: PDFResponse = self._requester(
-            "GET", f"invoices/download?file_id={file_id}"
+        response_data: PDFResponse | StreamedPDF = self._requester(
+            "GET", f"invoices/download?file_id={file_id}", stream_to=stream_to
         )
         return response_data
 
@@ -253,5 +528,315 @@ class Invoices(_BaseDocuments[InvoiceItem]):
         Note:
             To get the PDF file instead, use client.invoices.download_pdf(file_id).
         """
-        response_data = self._requester("GET", f"invoices/by-id/{file_id}")
-        return InvoiceByIdResponse(**response_data)
+        response_data: InvoiceByIdResponse = self._requester(
+            "GET", f"invoices/by-id/{file_id}", response_type=InvoiceByIdResponse
+        )
+        return response_data
+
+
+class AsyncInvoices(_AsyncBaseDocuments[InvoiceItem, InvoiceDocumentResponse]):
+    """Async API client for creating, listing, and managing invoices.
+
+    Mirrors Invoices; every method is awaitable.
+    """
+
+    _resource = "invoices"
+    _document_model = InvoiceDocumentResponse
+    _batch_status_model = InvoiceBatchStatusResponse
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        super().__init__(requester)
+
+    @override
+    async def create(
+        self,
+        *,
+        client_name: str,
+        client_email: str,
+        items: Sequence[InvoiceItem],
+        invoice_number: str,
+        due_date: str,
+        invoice_date: str | None = None,
+        save_to_cloud: bool = True,
+        **kwargs: Any,
+    ) -> PDFResponse:
+        """Generate a single invoice and return its PDF. See Invoices.create."""
+        payload = InvoiceCreatePayload.model_validate(
+            dict(
+                client_name=client_name,
+                client_email=client_email,
+                items=items,
+                invoice_number=invoice_number,
+                invoice_date=invoice_date,
+                upload_to_s3=save_to_cloud,
+                due_date=due_date,
+                **kwargs,
+            )
+        )
+        response_data: PDFResponse = await self._requester(
+            "POST",
+            "invoices/generate",
+            content=payload.model_dump_json(exclude_unset=True),
+            headers={"Content-Type": "application/json"},
+        )
+        return response_data
+
+    async def update_status(
+        self, file_id: str, *, invoice_status: InvoiceStatus
+    ) -> InvoiceStatusUpdateResponse:
+        """Update the status of an existing invoice. See Invoices.update_status."""
+        _check_status(invoice_status)
+
+        payload: InvoiceStatusUpdateRequest = InvoiceStatusUpdateRequest(
+            file_id=file_id,
+            status=invoice_status,
+        )
+
+        request_data: InvoiceStatusUpdateResponse = await self._requester(
+            "PATCH",
+            "invoices/status",
+            json=payload.model_dump(),
+            response_type=InvoiceStatusUpdateResponse,
+        )
+        return request_data
+
+    async def update_status_many(
+        self,
+        updates: Mapping[str, InvoiceStatus] | Iterable[tuple[str, InvoiceStatus]],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[BulkResult[str, InvoiceStatusUpdateResponse]]:
+        """Update the status of many invoices concurrently. See
+        Invoices.update_status_many."""
+        statuses = dict(updates)
+
+        async def update(file_id: str) -> InvoiceStatusUpdateResponse:
+            return await self.update_status(file_id, invoice_status=statuses[file_id])
+
+        return [
+            result
+            async for result in arun_bounded(update, statuses, concurrency=concurrency)
+        ]
+
+    async def delete(self, file_id: str) -> InvoiceDeleteResponse:
+        """Delete an invoice document by file_id. See Invoices.delete."""
+        response_data: InvoiceDeleteResponse = await self._requester(
+            "DELETE", f"invoices?file_id={file_id}", response_type=InvoiceDeleteResponse
+        )
+        return response_data
+
+    async def send_email(
+        self,
+        *,
+        to: Sequence[str],
+        subject: str,
+        body: str = "",
+        from_email: str | None = None,
+        file_ids: Sequence[str] | None = None,
+    ) -> InvoiceSendEmailResponse:
+        """Send one or more invoice PDFs by email. See Invoices.send_email."""
+        payload = InvoiceSendEmailRequest(
+            to=to,
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            file_ids=file_ids,
+        )
+
+        response_data: InvoiceSendEmailResponse = await self._requester(
+            "POST",
+            "email/send",
+            json=payload.model_dump(),
+            response_type=InvoiceSendEmailResponse,
+        )
+        return response_data
+
+    @override
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult[dict[str, Any], InvoiceSendEmailResponse]]:
+        """Send many invoice emails concurrently, yielding each result as it
+        completes. See Invoices.send_email_many."""
+        return super().send_email_many(
+            jobs, group_attachments=group_attachments, concurrency=concurrency
+        )
+
+    async def create_batch_from_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
+    ) -> InvoiceBatchResponse:
+        """Create a batch invoices job from two CSV files. See
+        Invoices.create_batch_from_csv."""
+        if validate:
+            errors = await self.validate_csv(data_file_path, items_file_path)
+            if errors:
+                raise CSVValidationError(errors)
+        data_path = os.fspath(data_file_path)
+        items_path = os.fspath(items_file_path)
+        with (
+            await aopen_binary(data_path) as invoice_f,
+            await aopen_binary(items_path) as items_f,
+        ):
+            files = {
+                "invoice_csv": (os.path.basename(data_path), invoice_f, "text/csv"),
+                "items_csv": (os.path.basename(items_path), items_f, "text/csv"),
+            }
+            return await self._requester(
+                "POST",
+                "batch/invoices/csv",
+                files=files,
+                response_type=InvoiceBatchResponse,
+            )
+
+    async def validate_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        max_errors: int = 100,
+    ) -> list[CSVRowError]:
+        """Validate batch invoice CSV files locally in a worker thread. See
+        Invoices.validate_csv."""
+        return await asyncio.to_thread(
+            validate_batch_csv,
+            os.fspath(data_file_path),
+            os.fspath(items_file_path),
+            payload_model=InvoiceCreatePayload,
+            item_model=InvoiceItem,
+            max_errors=max_errors,
+        )
+
+    @override
+    async def get_batch_status(self, job_id: str) -> InvoiceBatchStatusResponse:
+        """Get the status and results of a batch invoices job. See
+        Invoices.get_batch_status."""
+        status: InvoiceBatchStatusResponse = await super().get_batch_status(job_id)
+        return status
+
+    @override
+    async def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> InvoiceBatchStatusResponse:
+        """Poll a batch invoices job until it finishes. See
+        Invoices.wait_for_batch."""
+        status: InvoiceBatchStatusResponse = await super().wait_for_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        return status
+
+    @override
+    def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[InvoiceBatchRecord]:
+        """Yield each InvoiceBatchRecord of a batch job as soon as it is imported. See
+        Invoices.iter_batch_records."""
+        return super().iter_batch_records(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def create_batch_from_json(
+        self,
+        data: dict[str, Any],
+    ) -> InvoiceBatchResponse:
+        """Create a batch invoices job from a JSON payload. See
+        Invoices.create_batch_from_json."""
+        return await self._requester(
+            "POST", "batch/invoices/json", json=data, response_type=InvoiceBatchResponse
+        )
+
+    async def submit_batch(
+        self,
+        payloads: Iterable[InvoiceCreatePayload | dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = 4,
+    ) -> AsyncBatchGroup[InvoiceBatchStatusResponse, InvoiceBatchRecord]:
+        """Submit a very large invoice batch as several size-bounded JSON jobs.
+        See Invoices.submit_batch."""
+        invalid: list[tuple[int, ValidationError]] = []
+        chunks = iter_json_chunks(
+            payloads,
+            InvoiceCreatePayload,
+            "invoices",
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            invalid=invalid,
+        )
+        results = [
+            without_body(result)
+            async for result in arun_bounded(
+                self._submit_json_chunk, chunks, concurrency=concurrency
+            )
+        ]
+        return AsyncBatchGroup(self, results, invalid)
+
+    async def _submit_json_chunk(self, chunk: JsonChunk) -> InvoiceBatchResponse:
+        return await self._requester(
+            "POST",
+            "batch/invoices/json",
+            content=chunk.body,
+            headers={"Content-Type": "application/json"},
+            response_type=InvoiceBatchResponse,
+        )
+
+    async def list(
+        self, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[InvoiceDocumentResponse]:
+        """List invoice documents with optional pagination. See Invoices.list."""
+        response_data: list[InvoiceDocumentResponse] = await self._requester(
+            "GET",
+            "invoices",
+            params={"limit": limit, "offset": offset},
+            response_type=list[InvoiceDocumentResponse],
+        )
+        return response_data
+
+    @overload
+    async def download_pdf(
+        self, file_id: str, *, stream_to: None = None
+    ) -> PDFResponse: ...
+
+    @overload
+    async def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget
+    ) -> StreamedPDF: ...
+
+    async def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget | None = None
+    ) -> PDFResponse | StreamedPDF:
+        """Download the PDF of the specified invoice. See Invoices.download_pdf."""
+        response_data: PDFResponse | StreamedPDF = await self._requester(
+            "GET", f"invoices/download?file_id={file_id}", stream_to=stream_to
+        )
+        return response_data
+
+    async def get_document(self, file_id: str) -> InvoiceByIdResponse:
+        """Get full document details of an invoice. See Invoices.get_document."""
+        response_data: InvoiceByIdResponse = await self._requester(
+            "GET", f"invoices/by-id/{file_id}", response_type=InvoiceByIdResponse
+        )
+        return response_data
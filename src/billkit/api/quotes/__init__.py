@@ -1,12 +1,27 @@
+import asyncio
 import os
-from collections.abc import Callable, Sequence
-from typing import Any
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from io import BytesIO
+from pathlib import Path
+from typing import Any, overload
 
-from typing_extensions import override
+from pydantic import ValidationError
+from typing_extensions import Buffer, override
 
-from ...models._base import PDFResponse
+from ..._bulk import DEFAULT_CONCURRENCY, BulkResult, arun_bounded, run_bounded
+from ...exceptions import CSVValidationError
+from ...models._base import PDFResponse, StreamedPDF, StreamTarget
 from ...models.quotes import (
     Quote2InvoiceRequest,
+    QuoteBatchRecord,
     QuoteBatchResponse,
     QuoteBatchStatusResponse,
     QuoteByIdResponse,
@@ -17,12 +32,60 @@ from ...models.quotes import (
     QuoteSendEmailRequest,
     QuoteSendEmailResponse,
 )
-from .._base import _BaseDocuments  # pyright: ignore[reportPrivateUsage]
+from .._base import (
+    _AsyncBaseDocuments,  # pyright: ignore[reportPrivateUsage]
+    _BaseDocuments,  # pyright: ignore[reportPrivateUsage]
+    _pdf_path,  # pyright: ignore[reportPrivateUsage]
+    aopen_binary,
+)
+from .._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CHUNK_BYTES,
+    AsyncBatchGroup,
+    BatchGroup,
+    JsonChunk,
+    iter_json_chunks,
+    without_body,
+)
+from .._csv import CSVRowError, validate_batch_csv
+
+
+class _DiscardedPDF(BytesIO):
+    """Stream target that drops the body; only its size is counted."""
+
+    @override
+    def write(self, buffer: Buffer, /) -> int:
+        return memoryview(buffer).nbytes
 
 
-class Quotes(_BaseDocuments[QuoteItem]):
+def _conversion_target(
+    request: Quote2InvoiceRequest, dest_dir: Path | None, skip_pdf: bool
+) -> StreamTarget | None:
+    if skip_pdf:
+        return _DiscardedPDF()
+    if dest_dir is not None:
+        return _pdf_path(dest_dir, request.file_id)
+    return None
+
+
+def _conversion_dest(
+    dest_dir: os.PathLike[str] | str | None, skip_pdf: bool
+) -> Path | None:
+    """Validate convert_many's dest_dir; the caller creates the directory."""
+    if dest_dir is None:
+        return None
+    if skip_pdf:
+        raise ValueError("dest_dir and skip_pdf are mutually exclusive")
+    return Path(dest_dir)
+
+
+class Quotes(_BaseDocuments[QuoteItem, QuoteDocumentResponse]):
     """API client for creating, listing, and managing quotes."""
 
+    _resource = "quotes"
+    _document_model = QuoteDocumentResponse
+    _batch_status_model = QuoteBatchStatusResponse
+
     def __init__(self, requester: Callable[..., Any]) -> None:
         super().__init__(requester)
 
@@ -35,8 +98,10 @@ class Quotes(_BaseDocuments[QuoteItem]):
         Returns:
             QuoteDeleteResponse: Confirmation of the deletion.
         """
-        response_data = self._requester("DELETE", f"quotes?file_id={file_id}")
-        return QuoteDeleteResponse(**response_data)
+        response_data: QuoteDeleteResponse = self._requester(
+            "DELETE", f"quotes?file_id={file_id}", response_type=QuoteDeleteResponse
+        )
+        return response_data
 
     @override
     def create(
@@ -66,20 +131,24 @@ class Quotes(_BaseDocuments[QuoteItem]):
             PDFResponse: File-like object containing the PDF bytes; may include
                 file_id if save_to_cloud is True.
         """
-        payload_dict: Any = dict(
-            client_name=client_name,
-            client_email=client_email,
-            items=[item.model_dump(mode="json", exclude_unset=True) for item in items],
-            quote_number=quote_number,
-            quote_date=quote_date,
-            upload_to_s3=save_to_cloud,
-            **kwargs,
+        # Validate once (item models are reused as-is) and serialize straight
+        # to JSON bytes instead of round-tripping every item through a dict.
+        payload = QuoteCreatePayload.model_validate(
+            dict(
+                client_name=client_name,
+                client_email=client_email,
+                items=items,
+                quote_number=quote_number,
+                quote_date=quote_date,
+                upload_to_s3=save_to_cloud,
+                **kwargs,
+            )
         )
-        payload = QuoteCreatePayload(**payload_dict)
         response_data: PDFResponse = self._requester(
             "POST",
             "quotes/generate",
-            json=payload.model_dump(mode="json", exclude_unset=True),
+            content=payload.model_dump_json(exclude_unset=True),
+            headers={"Content-Type": "application/json"},
         )
         return response_data
 
@@ -112,23 +181,66 @@ class Quotes(_BaseDocuments[QuoteItem]):
             file_ids=file_ids,
         )
 
-        response_data = self._requester("POST", "email/send", json=payload.model_dump())
-        return QuoteSendEmailResponse(**response_data)
+        response_data: QuoteSendEmailResponse = self._requester(
+            "POST",
+            "email/send",
+            json=payload.model_dump(),
+            response_type=QuoteSendEmailResponse,
+        )
+        return response_data
+
+    @override
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[BulkResult[dict[str, Any], QuoteSendEmailResponse]]:
+        """Send many quote emails concurrently, yielding each result as it
+        completes. See _BaseDocuments.send_email_many.
+
+        Usage:
+            jobs = (
+                {"to": [c.email], "subject": "Reminder", "file_ids": [c.file_id]}
+                for c in overdue
+            )
+            for result in client.quotes.send_email_many(jobs):
+                if not result.ok:
+                    print(result.key["to"], result.error)
+        """
+        return super().send_email_many(
+            jobs, group_attachments=group_attachments, concurrency=concurrency
+        )
 
     def create_batch_from_csv(
         self,
         data_file_path: os.PathLike[str],
         items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
     ) -> QuoteBatchResponse:
         """Create a batch quotes job from two CSV files (quotes data + line items).
 
+        Both files are streamed to the API in chunks rather than read into
+        memory.
+
         Args:
             data_file_path: Path to the CSV with quote-level data.
             items_file_path: Path to the CSV with line items.
+            validate: Whether to check every row with validate_csv before
+                uploading. Defaults to False.
 
         Returns:
             QuoteBatchResponse: Job details including job_id for status polling.
+
+        Raises:
+            CSVValidationError: If validate is True and any row is invalid.
         """
+        if validate:
+            errors = self.validate_csv(data_file_path, items_file_path)
+            if errors:
+                raise CSVValidationError(errors)
         data_path = os.fspath(data_file_path)
         items_path = os.fspath(items_file_path)
         with open(data_path, "rb") as quote_f, open(items_path, "rb") as items_f:
@@ -136,10 +248,42 @@ class Quotes(_BaseDocuments[QuoteItem]):
                 "quote_csv": (os.path.basename(data_path), quote_f, "text/csv"),
                 "items_csv": (os.path.basename(items_path), items_f, "text/csv"),
             }
-            return QuoteBatchResponse(
-                **self._requester("POST", "batch/quotes/csv", files=files)
+            return self._requester(
+                "POST",
+                "batch/quotes/csv",
+                files=files,
+                response_type=QuoteBatchResponse,
             )
 
+    def validate_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        max_errors: int = 100,
+    ) -> list[CSVRowError]:
+        """Validate batch quote CSV files locally, row by row, without uploading.
+
+        Quote rows are checked against QuoteCreatePayload and line item rows
+        against QuoteItem; rows are linked by their id column. Neither file is
+        loaded into memory.
+
+        Args:
+            data_file_path: Path to the CSV with quote-level data.
+            items_file_path: Path to the CSV with line items.
+            max_errors: Stop after this many problems. Defaults to 100.
+
+        Returns:
+            List of CSVRowError (file, line, column, message); empty if valid.
+        """
+        return validate_batch_csv(
+            os.fspath(data_file_path),
+            os.fspath(items_file_path),
+            payload_model=QuoteCreatePayload,
+            item_model=QuoteItem,
+            max_errors=max_errors,
+        )
+
     @override
     def get_batch_status(self, job_id: str) -> QuoteBatchStatusResponse:
         """Get the status and results of a batch quotes job.
@@ -151,8 +295,60 @@ class Quotes(_BaseDocuments[QuoteItem]):
         Returns:
             QuoteBatchStatusResponse: Current status and any completed outputs.
         """
-        data = super().get_batch_status(job_id)
-        return QuoteBatchStatusResponse.model_validate(data)
+        status: QuoteBatchStatusResponse = super().get_batch_status(job_id)
+        return status
+
+    @override
+    def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> QuoteBatchStatusResponse:
+        """Poll a batch quotes job until it finishes, with adaptive backoff.
+
+        Args:
+            job_id: Identifier of the batch job.
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+                Defaults to 600.
+            min_interval: Shortest delay between polls in seconds. Defaults to 1.
+            max_interval: Longest delay between polls in seconds. Defaults to 30.
+
+        Returns:
+            QuoteBatchStatusResponse: The final status, including all records.
+
+        Raises:
+            BatchTimeoutError: If the job is still running after timeout seconds.
+        """
+        status: QuoteBatchStatusResponse = super().wait_for_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        return status
+
+    @override
+    def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> Iterator[QuoteBatchRecord]:
+        """Yield each QuoteBatchRecord of a batch job as soon as it is imported.
+
+        Polls like wait_for_batch and stops once the job finishes.
+        """
+        return super().iter_batch_records(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
 
     def create_batch_from_json(
         self,
@@ -167,8 +363,59 @@ class Quotes(_BaseDocuments[QuoteItem]):
         Returns:
             QuoteBatchResponse: Job details including job_id for status polling.
         """
-        return QuoteBatchResponse(
-            **self._requester("POST", "batch/quotes/json", json=data)
+        return self._requester(
+            "POST", "batch/quotes/json", json=data, response_type=QuoteBatchResponse
+        )
+
+    def submit_batch(
+        self,
+        payloads: Iterable[QuoteCreatePayload | dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = 4,
+    ) -> BatchGroup[QuoteBatchStatusResponse, QuoteBatchRecord]:
+        """Submit a very large quote batch as several size-bounded JSON jobs.
+
+        Payloads are validated and serialized one at a time, grouped into chunks
+        of at most chunk_size payloads and max_chunk_bytes of JSON, and the
+        chunks are posted concurrently. A chunk's body is released once it is
+        accepted, so at most `concurrency` bodies (plus those of failed chunks)
+        are held in memory at a time.
+
+        Args:
+            payloads: QuoteCreatePayload objects, or dicts to be validated as such.
+            chunk_size: Maximum payloads per job. Defaults to 1000.
+            max_chunk_bytes: Maximum JSON body size per job. Defaults to 4 MiB.
+            concurrency: Maximum chunk submissions in flight. Defaults to 4.
+
+        Returns:
+            BatchGroup: Handle over all created jobs (job_ids, statuses(),
+                wait(), iter_records()), plus failed chunks and any payloads
+                skipped because they failed validation.
+        """
+        invalid: list[tuple[int, ValidationError]] = []
+        chunks = iter_json_chunks(
+            payloads,
+            QuoteCreatePayload,
+            "quotes",
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            invalid=invalid,
+        )
+        results = map(
+            without_body,
+            run_bounded(self._submit_json_chunk, chunks, concurrency=concurrency),
+        )
+        return BatchGroup(self, results, invalid)
+
+    def _submit_json_chunk(self, chunk: JsonChunk) -> QuoteBatchResponse:
+        return self._requester(
+            "POST",
+            "batch/quotes/json",
+            content=chunk.body,
+            headers={"Content-Type": "application/json"},
+            response_type=QuoteBatchResponse,
         )
 
     def list(
@@ -183,26 +430,41 @@ class Quotes(_BaseDocuments[QuoteItem]):
         Returns:
             Sequence of QuoteDocumentResponse for each quote.
         """
-        response_data = self._requester(
-            "GET", "quotes", params={"limit": limit, "offset": offset}
+        response_data: list[QuoteDocumentResponse] = self._requester(
+            "GET",
+            "quotes",
+            params={"limit": limit, "offset": offset},
+            response_type=list[QuoteDocumentResponse],
         )
-        return [QuoteDocumentResponse(**item) for item in response_data]
+        return response_data
 
-    def download_pdf(self, file_id: str) -> PDFResponse:
+    @overload
+    def download_pdf(self, file_id: str, *, stream_to: None = None) -> PDFResponse: ...
+
+    @overload
+    def download_pdf(self, file_id: str, *, stream_to: StreamTarget) -> StreamedPDF: ...
+
+    def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget | None = None
+    ) -> PDFResponse | StreamedPDF:
         """Download the PDF of the specified quote.
 
         Args:
             file_id: Identifier of the stored quote.
+            stream_to: Optional file path or binary file object. When given, the
+                PDF is streamed to it in chunks instead of being held in memory;
+                paths are written atomically. Defaults to None.
 
         Returns:
-            PDFResponse: File-like object containing the PDF bytes.
+            PDFResponse: File-like object containing the PDF bytes, or
+                StreamedPDF (file_id and bytes written) when stream_to is given.
 
         Note:
             To get document metadata (quote_number, created_at, etc.) instead of
             the PDF, use client.quotes.get_document(file_id).
         """
-        response_data: PDFResponse = self._requester(
-            "GET", f"quotes/download?file_id={file_id}"
+        response_data: PDFResponse | StreamedPDF = self._requester(
+            "GET", f"quotes/download?file_id={file_id}", stream_to=stream_to
         )
         return response_data
 
@@ -232,6 +494,62 @@ class Quotes(_BaseDocuments[QuoteItem]):
         )
         return self._requester("POST", "quotes/convert", json=payload.model_dump())
 
+    def convert_many(
+        self,
+        requests: Iterable[Quote2InvoiceRequest],
+        *,
+        dest_dir: os.PathLike[str] | str | None = None,
+        skip_pdf: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> Iterator[BulkResult[Quote2InvoiceRequest, PDFResponse | StreamedPDF]]:
+        """Convert many quotes to invoices concurrently, yielding each result as
+        it completes so follow-up work (e.g. emailing) can start right away.
+
+        By default each invoice PDF is returned in memory. With `dest_dir` it
+        is streamed to `dest_dir/<quote file_id>.pdf` instead, and with
+        `skip_pdf` the body is read and dropped without being buffered, keeping
+        only the new invoice's file_id. Failures are reported per quote
+        instead of aborting the run.
+
+        Args:
+            requests: Quotes to convert.
+            dest_dir: Directory to stream the invoice PDFs to; created if
+                missing. Defaults to None.
+            skip_pdf: Only capture the new invoice's file_id. Defaults to False.
+            concurrency: Maximum number of conversions in flight at once.
+                Defaults to 8.
+
+        Returns:
+            Iterator of BulkResult in completion order, keyed by request, whose
+            value is a PDFResponse (default) or a StreamedPDF (with `dest_dir`
+            or `skip_pdf`), carrying the new invoice's file_id, or whose error
+            is the exception raised.
+
+        Raises:
+            ValueError: If both `dest_dir` and `skip_pdf` are given.
+
+        Usage:
+            requests = (Quote2InvoiceRequest(file_id=q.file_id) for q in accepted)
+            for result in client.quotes.convert_many(requests, skip_pdf=True):
+                if result.ok:
+                    client.invoices.send_email(
+                        to=[...], subject="Invoice", file_ids=[result.value.file_id]
+                    )
+        """
+        dest = _conversion_dest(dest_dir, skip_pdf)
+        if dest is not None:
+            dest.mkdir(parents=True, exist_ok=True)
+
+        def convert(request: Quote2InvoiceRequest) -> PDFResponse | StreamedPDF:
+            return self._requester(
+                "POST",
+                "quotes/convert",
+                json=request.model_dump(),
+                stream_to=_conversion_target(request, dest, skip_pdf),
+            )
+
+        return run_bounded(convert, requests, concurrency=concurrency)
+
     def get_document(self, file_id: str) -> QuoteByIdResponse:
         """Get full document details of a quote (metadata and payload, not the PDF).
 
@@ -246,5 +564,328 @@ class Quotes(_BaseDocuments[QuoteItem]):
         Note:
             To get the PDF file instead, use client.quotes.download_pdf(file_id).
         """
-        response_data = self._requester("GET", f"quotes/by-id/{file_id}")
-        return QuoteByIdResponse(**response_data)
+        response_data: QuoteByIdResponse = self._requester(
+            "GET", f"quotes/by-id/{file_id}", response_type=QuoteByIdResponse
+        )
+        return response_data
+
+
+class AsyncQuotes(_AsyncBaseDocuments[QuoteItem, QuoteDocumentResponse]):
+    """Async API client for creating, listing, and managing quotes.
+
+    Mirrors Quotes; every method is awaitable.
+    """
+
+    _resource = "quotes"
+    _document_model = QuoteDocumentResponse
+    _batch_status_model = QuoteBatchStatusResponse
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        super().__init__(requester)
+
+    async def delete(self, file_id: str) -> QuoteDeleteResponse:
+        """Delete a quote document by file_id. See Quotes.delete."""
+        response_data: QuoteDeleteResponse = await self._requester(
+            "DELETE", f"quotes?file_id={file_id}", response_type=QuoteDeleteResponse
+        )
+        return response_data
+
+    @override
+    async def create(
+        self,
+        *,
+        client_name: str,
+        client_email: str,
+        items: Sequence[QuoteItem],
+        quote_number: str,
+        quote_date: str | None = None,
+        save_to_cloud: bool = True,
+        **kwargs: Any,
+    ) -> PDFResponse:
+        """Generate a single quote and return its PDF. See Quotes.create."""
+        payload = QuoteCreatePayload.model_validate(
+            dict(
+                client_name=client_name,
+                client_email=client_email,
+                items=items,
+                quote_number=quote_number,
+                quote_date=quote_date,
+                upload_to_s3=save_to_cloud,
+                **kwargs,
+            )
+        )
+        response_data: PDFResponse = await self._requester(
+            "POST",
+            "quotes/generate",
+            content=payload.model_dump_json(exclude_unset=True),
+            headers={"Content-Type": "application/json"},
+        )
+        return response_data
+
+    async def send_email(
+        self,
+        *,
+        to: Sequence[str],
+        subject: str,
+        body: str = "",
+        from_email: str | None = None,
+        file_ids: Sequence[str] | None = None,
+    ) -> QuoteSendEmailResponse:
+        """Send one or more quote PDFs by email. See Quotes.send_email."""
+        payload = QuoteSendEmailRequest(
+            to=to,
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            file_ids=file_ids,
+        )
+
+        response_data: QuoteSendEmailResponse = await self._requester(
+            "POST",
+            "email/send",
+            json=payload.model_dump(),
+            response_type=QuoteSendEmailResponse,
+        )
+        return response_data
+
+    @override
+    def send_email_many(
+        self,
+        jobs: Iterable[Mapping[str, Any]],
+        *,
+        group_attachments: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult[dict[str, Any], QuoteSendEmailResponse]]:
+        """Send many quote emails concurrently, yielding each result as it
+        completes. See Quotes.send_email_many."""
+        return super().send_email_many(
+            jobs, group_attachments=group_attachments, concurrency=concurrency
+        )
+
+    async def create_batch_from_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        validate: bool = False,
+    ) -> QuoteBatchResponse:
+        """Create a batch quotes job from two CSV files. See
+        Quotes.create_batch_from_csv."""
+        if validate:
+            errors = await self.validate_csv(data_file_path, items_file_path)
+            if errors:
+                raise CSVValidationError(errors)
+        data_path = os.fspath(data_file_path)
+        items_path = os.fspath(items_file_path)
+        with (
+            await aopen_binary(data_path) as quote_f,
+            await aopen_binary(items_path) as items_f,
+        ):
+            files = {
+                "quote_csv": (os.path.basename(data_path), quote_f, "text/csv"),
+                "items_csv": (os.path.basename(items_path), items_f, "text/csv"),
+            }
+            return await self._requester(
+                "POST",
+                "batch/quotes/csv",
+                files=files,
+                response_type=QuoteBatchResponse,
+            )
+
+    async def validate_csv(
+        self,
+        data_file_path: os.PathLike[str],
+        items_file_path: os.PathLike[str],
+        *,
+        max_errors: int = 100,
+    ) -> list[CSVRowError]:
+        """Validate batch quote CSV files locally in a worker thread. See
+        Quotes.validate_csv."""
+        return await asyncio.to_thread(
+            validate_batch_csv,
+            os.fspath(data_file_path),
+            os.fspath(items_file_path),
+            payload_model=QuoteCreatePayload,
+            item_model=QuoteItem,
+            max_errors=max_errors,
+        )
+
+    @override
+    async def get_batch_status(self, job_id: str) -> QuoteBatchStatusResponse:
+        """Get the status and results of a batch quotes job. See
+        Quotes.get_batch_status."""
+        status: QuoteBatchStatusResponse = await super().get_batch_status(job_id)
+        return status
+
+    @override
+    async def wait_for_batch(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> QuoteBatchStatusResponse:
+        """Poll a batch quotes job until it finishes. See
+        Quotes.wait_for_batch."""
+        status: QuoteBatchStatusResponse = await super().wait_for_batch(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+        return status
+
+    @override
+    def iter_batch_records(
+        self,
+        job_id: str,
+        *,
+        timeout: float | None = 600.0,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[QuoteBatchRecord]:
+        """Yield each QuoteBatchRecord of a batch job as soon as it is imported. See
+        Quotes.iter_batch_records."""
+        return super().iter_batch_records(
+            job_id,
+            timeout=timeout,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def create_batch_from_json(
+        self,
+        data: dict[str, Any],
+    ) -> QuoteBatchResponse:
+        """Create a batch quotes job from a JSON payload. See
+        Quotes.create_batch_from_json."""
+        return await self._requester(
+            "POST", "batch/quotes/json", json=data, response_type=QuoteBatchResponse
+        )
+
+    async def submit_batch(
+        self,
+        payloads: Iterable[QuoteCreatePayload | dict[str, Any]],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        concurrency: int = 4,
+    ) -> AsyncBatchGroup[QuoteBatchStatusResponse, QuoteBatchRecord]:
+        """Submit a very large quote batch as several size-bounded JSON jobs.
+        See Quotes.submit_batch."""
+        invalid: list[tuple[int, ValidationError]] = []
+        chunks = iter_json_chunks(
+            payloads,
+            QuoteCreatePayload,
+            "quotes",
+            chunk_size=chunk_size,
+            max_chunk_bytes=max_chunk_bytes,
+            invalid=invalid,
+        )
+        results = [
+            without_body(result)
+            async for result in arun_bounded(
+                self._submit_json_chunk, chunks, concurrency=concurrency
+            )
+        ]
+        return AsyncBatchGroup(self, results, invalid)
+
+    async def _submit_json_chunk(self, chunk: JsonChunk) -> QuoteBatchResponse:
+        return await self._requester(
+            "POST",
+            "batch/quotes/json",
+            content=chunk.body,
+            headers={"Content-Type": "application/json"},
+            response_type=QuoteBatchResponse,
+        )
+
+    async def list(
+        self, *, limit: int = 50, offset: int = 0
+    ) -> Sequence[QuoteDocumentResponse]:
+        """List quote documents with optional pagination. See Quotes.list."""
+        response_data: list[QuoteDocumentResponse] = await self._requester(
+            "GET",
+            "quotes",
+            params={"limit": limit, "offset": offset},
+            response_type=list[QuoteDocumentResponse],
+        )
+        return response_data
+
+    @overload
+    async def download_pdf(
+        self, file_id: str, *, stream_to: None = None
+    ) -> PDFResponse: ...
+
+    @overload
+    async def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget
+    ) -> StreamedPDF: ...
+
+    async def download_pdf(
+        self, file_id: str, *, stream_to: StreamTarget | None = None
+    ) -> PDFResponse | StreamedPDF:
+        """Download the PDF of the specified quote. See Quotes.download_pdf."""
+        response_data: PDFResponse | StreamedPDF = await self._requester(
+            "GET", f"quotes/download?file_id={file_id}", stream_to=stream_to
+        )
+        return response_data
+
+    async def convert_to_invoice(
+        self,
+        *,
+        file_id: str,
+        invoice_number: str | None = None,
+        save_to_cloud: bool = True,
+    ) -> PDFResponse:
+        """Convert an existing quote to an invoice and return the invoice PDF. See
+        Quotes.convert_to_invoice."""
+        payload = Quote2InvoiceRequest(
+            file_id=file_id,
+            invoice_number=invoice_number,
+            upload_to_s3=save_to_cloud,
+        )
+        return await self._requester(
+            "POST", "quotes/convert", json=payload.model_dump()
+        )
+
+    def convert_many(
+        self,
+        requests: Iterable[Quote2InvoiceRequest],
+        *,
+        dest_dir: os.PathLike[str] | str | None = None,
+        skip_pdf: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> AsyncIterator[BulkResult[Quote2InvoiceRequest, PDFResponse | StreamedPDF]]:
+        """Convert many quotes to invoices concurrently, yielding each result as
+        it completes. See Quotes.convert_many."""
+        dest = _conversion_dest(dest_dir, skip_pdf)
+
+        async def convert(
+            request: Quote2InvoiceRequest,
+        ) -> PDFResponse | StreamedPDF:
+            return await self._requester(
+                "POST",
+                "quotes/convert",
+                json=request.model_dump(),
+                stream_to=_conversion_target(request, dest, skip_pdf),
+            )
+
+        async def results() -> AsyncIterator[
+            BulkResult[Quote2InvoiceRequest, PDFResponse | StreamedPDF]
+        ]:
+            if dest is not None:
+                await asyncio.to_thread(dest.mkdir, parents=True, exist_ok=True)
+            async for result in arun_bounded(
+                convert, requests, concurrency=concurrency
+            ):
+                yield result
+
+        return results()
+
+    async def get_document(self, file_id: str) -> QuoteByIdResponse:
+        """Get full document details of a quote. See Quotes.get_document."""
+        response_data: QuoteByIdResponse = await self._requester(
+            "GET", f"quotes/by-id/{file_id}", response_type=QuoteByIdResponse
+        )
+        return response_data
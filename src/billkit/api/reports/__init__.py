@@ -1,11 +1,11 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from ...models.reports import RevenueReportResponse
 
 
 class Reports:
-    def __init__(self, requester: Callable[..., dict[str, Any]]) -> None:
+    def __init__(self, requester: Callable[..., Any]) -> None:
         self._requester = requester
 
     def get_revenue(self, currency: str | None = None) -> RevenueReportResponse:
@@ -21,8 +21,26 @@ class Reports:
             print(report.summary)
         """
         endpoint: str = "reports/revenue"
-        if currency is None:
-            response_data = self._requester("GET", endpoint)
-        else:
-            response_data = self._requester("GET", f"{endpoint}?currency={currency}")
-        return RevenueReportResponse(**response_data)
+        if currency is not None:
+            endpoint = f"{endpoint}?currency={currency}"
+        response_data: RevenueReportResponse = self._requester(
+            "GET", endpoint, response_type=RevenueReportResponse
+        )
+        return response_data
+
+
+class AsyncReports:
+    """Async counterpart of Reports; every method is awaitable."""
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        self._requester = requester
+
+    async def get_revenue(self, currency: str | None = None) -> RevenueReportResponse:
+        """Fetch the current user's revenue. See Reports.get_revenue."""
+        endpoint: str = "reports/revenue"
+        if currency is not None:
+            endpoint = f"{endpoint}?currency={currency}"
+        response_data: RevenueReportResponse = await self._requester(
+            "GET", endpoint, response_type=RevenueReportResponse
+        )
+        return response_data
@@ -1,4 +1,4 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from ...models.templates import (
@@ -12,7 +12,7 @@ from ...models.templates import (
 
 
 class Templates:
-    def __init__(self, requester: Callable[..., dict[str, Any]]) -> None:
+    def __init__(self, requester: Callable[..., Any]) -> None:
         self._requester = requester
 
     def get_templates(self) -> TemplatesListResponse:
@@ -20,7 +20,9 @@ class Templates:
         Returns all template names including custom html templates.
         These are to be used in create and batch create payloads in the invoice_style/quote_style fields.
         """
-        return TemplatesListResponse(**self._requester("GET", "templates/all"))
+        return self._requester(
+            "GET", "templates/all", response_type=TemplatesListResponse
+        )
 
     def create(
         self, template_name: str, *, html: str, validate: bool = True
@@ -33,8 +35,13 @@ class Templates:
         if validate:
             payload.validate_html(html)
 
-        response_data = self._requester("POST", "templates", json=payload.model_dump())
-        return CreateCustomTemplateResponse(**response_data)
+        response_data: CreateCustomTemplateResponse = self._requester(
+            "POST",
+            "templates",
+            json=payload.model_dump(),
+            response_type=CreateCustomTemplateResponse,
+        )
+        return response_data
 
     def update(
         self,
@@ -49,10 +56,13 @@ class Templates:
         if validate:
             payload.validate_html(html)
 
-        response_data = self._requester(
-            "PATCH", f"templates/{template_id}", json=payload.model_dump()
+        response_data: UpdateCustomTemplateResponse = self._requester(
+            "PATCH",
+            f"templates/{template_id}",
+            json=payload.model_dump(),
+            response_type=UpdateCustomTemplateResponse,
         )
-        return UpdateCustomTemplateResponse(**response_data)
+        return response_data
 
     def delete(self, template_id: str) -> DeleteCustomTemplateResponse:
         """
@@ -86,5 +96,70 @@ class Templates:
         **Returns:**
             dict: Success confirmation, e.g. `{"message": "Template deleted", "id": template_id}`
         """
-        response_data = self._requester("DELETE", f"templates/{template_id}")
-        return DeleteCustomTemplateResponse(**response_data)
+        response_data: DeleteCustomTemplateResponse = self._requester(
+            "DELETE",
+            f"templates/{template_id}",
+            response_type=DeleteCustomTemplateResponse,
+        )
+        return response_data
+
+
+class AsyncTemplates:
+    """Async counterpart of Templates; every method is awaitable."""
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        self._requester = requester
+
+    async def get_templates(self) -> TemplatesListResponse:
+        """Returns all template names. See Templates.get_templates."""
+        return await self._requester(
+            "GET", "templates/all", response_type=TemplatesListResponse
+        )
+
+    async def create(
+        self, template_name: str, *, html: str, validate: bool = True
+    ) -> CreateCustomTemplateResponse:
+        """Create a custom template with HTML. See Templates.create."""
+        payload = CreateCustomTemplateRequest(name=template_name, html=html)
+
+        if validate:
+            payload.validate_html(html)
+
+        response_data: CreateCustomTemplateResponse = await self._requester(
+            "POST",
+            "templates",
+            json=payload.model_dump(),
+            response_type=CreateCustomTemplateResponse,
+        )
+        return response_data
+
+    async def update(
+        self,
+        template_id: str,
+        *,
+        template_name: str | None = None,
+        html: str | None = None,
+        validate: bool = True,
+    ) -> UpdateCustomTemplateResponse:
+        """Update a custom template's name and/or HTML. See Templates.update."""
+        payload = UpdateCustomTemplateRequest(name=template_name, html=html)
+
+        if validate:
+            payload.validate_html(html)
+
+        response_data: UpdateCustomTemplateResponse = await self._requester(
+            "PATCH",
+            f"templates/{template_id}",
+            json=payload.model_dump(),
+            response_type=UpdateCustomTemplateResponse,
+        )
+        return response_data
+
+    async def delete(self, template_id: str) -> DeleteCustomTemplateResponse:
+        """Delete a custom template by ID. See Templates.delete."""
+        response_data: DeleteCustomTemplateResponse = await self._requester(
+            "DELETE",
+            f"templates/{template_id}",
+            response_type=DeleteCustomTemplateResponse,
+        )
+        return response_data
@@ -1,12 +1,13 @@
 import os
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from ...models.users import LogoUploadResponse, PartialUserDetails, UserDetails
+from .._base import aopen_binary
 
 
 class Users:
-    def __init__(self, requester: Callable[..., dict[str, Any]]) -> None:
+    def __init__(self, requester: Callable[..., Any]) -> None:
         self._requester = requester
 
     def get_user(self) -> UserDetails:
@@ -20,8 +21,10 @@ class Users:
             user = client.users.get_user()
             print(user.email)
         """
-        response_data = self._requester("GET", "users/me")
-        return UserDetails(**response_data)
+        response_data: UserDetails = self._requester(
+            "GET", "users/me", response_type=UserDetails
+        )
+        return response_data
 
     def patch_user(self, user_details: PartialUserDetails) -> UserDetails:
         """
@@ -40,10 +43,13 @@ class Users:
             updates = PartialUserDetails(name="New Name")
             updated_user = client.users.patch_user(updates)
         """
-        response_data = self._requester(
-            "PATCH", "users/me", json=user_details.model_dump(exclude_unset=True)
+        response_data: UserDetails = self._requester(
+            "PATCH",
+            "users/me",
+            json=user_details.model_dump(exclude_unset=True),
+            response_type=UserDetails,
         )
-        return UserDetails(**response_data)
+        return response_data
 
     def upload_logo(self, image_path: os.PathLike[str]) -> LogoUploadResponse:
         """
@@ -64,5 +70,41 @@ class Users:
         """
         with open(os.fspath(image_path), "rb") as f:
             files = {"file": f}
-            response_data = self._requester("POST", "users/logo", files=files)
-        return LogoUploadResponse(**response_data)
+            response_data: LogoUploadResponse = self._requester(
+                "POST", "users/logo", files=files, response_type=LogoUploadResponse
+            )
+        return response_data
+
+
+class AsyncUsers:
+    """Async counterpart of Users; every method is awaitable."""
+
+    def __init__(self, requester: Callable[..., Awaitable[Any]]) -> None:
+        self._requester = requester
+
+    async def get_user(self) -> UserDetails:
+        """Fetch the current user's profile details. See Users.get_user."""
+        response_data: UserDetails = await self._requester(
+            "GET", "users/me", response_type=UserDetails
+        )
+        return response_data
+
+    async def patch_user(self, user_details: PartialUserDetails) -> UserDetails:
+        """Update the current user's profile with partial details. See
+        Users.patch_user."""
+        response_data: UserDetails = await self._requester(
+            "PATCH",
+            "users/me",
+            json=user_details.model_dump(exclude_unset=True),
+            response_type=UserDetails,
+        )
+        return response_data
+
+    async def upload_logo(self, image_path: os.PathLike[str]) -> LogoUploadResponse:
+        """Upload a logo image to the user profile. See Users.upload_logo."""
+        with await aopen_binary(os.fspath(image_path)) as f:
+            files = {"file": f}
+            response_data: LogoUploadResponse = await self._requester(
+                "POST", "users/logo", files=files, response_type=LogoUploadResponse
+            )
+        return response_data
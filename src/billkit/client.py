@@ -1,18 +1,234 @@
-from typing import Any
+import asyncio
+import copy
+import os
+import tempfile
+import time
+from collections.abc import AsyncGenerator, Generator, Sequence
+from contextlib import asynccontextmanager, contextmanager, suppress
+from functools import cached_property
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, BinaryIO, Self
 
 import httpx
 
-from ._settings import get_settings
-from .api.invoices import Invoices
-from .api.quotes import Quotes
-from .api.reports import Reports
-from .api.templates import Templates
-from .api.users import Users
+from ._cache import ResponseCache, cache_key, endpoint_path
+from ._conditional import ConditionalCache
+from ._decode import JSONDecoder
+from ._instrument import NULL_PROBE, MetricsHook, MetricsProbe, Probe
+from ._pdfcache import PDFCache
+from ._ratelimit import RateLimiter
+from ._retry import RetryPolicy
+from ._settings import TransportConfig, get_settings
+from ._singleflight import AsyncSingleFlight, SingleFlight
 from .exceptions import BillKitException
-from .models._base import PDFResponse
+from .models._base import PDFResponse, StreamedPDF, StreamTarget
 
+if TYPE_CHECKING:
+    from .api.invoices import AsyncInvoices, Invoices
+    from .api.quotes import AsyncQuotes, Quotes
+    from .api.reports import AsyncReports, Reports
+    from .api.templates import AsyncTemplates, Templates
+    from .api.users import AsyncUsers, Users
 
+_STREAM_CHUNK_SIZE = 64 * 1024
 
+# Resource groups are created on first access, so their API and model modules
+# are only imported when used.
+_RESOURCES = ("users", "reports", "invoices", "quotes", "templates")
+
+
+def _resolve_config(
+    api_key: str | None,
+    base_url: str | None,
+    transport_config: TransportConfig | None,
+) -> tuple[str, str, TransportConfig]:
+    # Check env var first if no param
+    settings = get_settings()
+    if api_key is None:
+        api_key = settings.api_key
+    if base_url is None:
+        base_url = settings.base_url
+    if transport_config is None:
+        transport_config = settings.transport
+    if not api_key:
+        raise ValueError(
+            "API key required. Pass to BillKitClient(api_key='sk_...') "
+            "or set BILLKIT_SECRET_KEY environment variable."
+        )
+    return api_key, base_url.rstrip("/"), transport_config
+
+
+def _status_error(e: httpx.HTTPStatusError) -> BillKitException:
+    """Map an HTTP error status to a BillKitException carrying the response body."""
+    body: str | dict[str, Any] | None = None
+    try:
+        body = e.response.json()
+    except ValueError:
+        body = e.response.text
+    return BillKitException(
+        str(e),
+        status_code=e.response.status_code,
+        response_body=body,
+    )
+
+
+def _parse_response(
+    resp: httpx.Response, decoder: JSONDecoder, response_type: Any = None
+) -> Any:
+    """
+    Decode a successful response into a PDFResponse, an instance of
+    `response_type`, JSON data, or text.
+    """
+    content_type = (
+        (resp.headers.get("content-type") or "").lower().split(";")[0].strip()
+    )
+    if content_type == "application/pdf":
+        file_id = resp.headers.get("X-Billkit-File-Id")
+        return PDFResponse(initial_bytes=resp.content, file_id=file_id)
+    if response_type is not None:
+        return decoder.decode(resp.content, response_type)
+    try:
+        return decoder.decode(resp.content)
+    except ValueError:
+        return resp.text
+
+
+def _share_result(result: Any) -> Any:
+    """
+    Give one caller of a coalesced request its own copy of the shared result.
+
+    The shared result itself is never handed out, so it stays intact (and a
+    PDF buffer stays open) until every caller has taken its copy.
+    """
+    if isinstance(result, PDFResponse):
+        return PDFResponse(
+            initial_bytes=bytes(result.getbuffer()), file_id=result.file_id
+        )
+    return copy.deepcopy(result)
+
+
+def _download_file_id(method: str, endpoint: str) -> str | None:
+    """Return the file_id requested by a GET to a `*/download` endpoint."""
+    if method.upper() != "GET":
+        return None
+    url = httpx.URL(endpoint)
+    if not url.path.endswith("/download"):
+        return None
+    return url.params.get("file_id")
+
+
+def _changed_file_id(method: str, endpoint: str, kwargs: dict[str, Any]) -> str | None:
+    """
+    Return the file_id of the document a mutating request deletes or changes,
+    e.g. `DELETE invoices?file_id=...` or `PATCH invoices/status`.
+    """
+    method = method.upper()
+    if method == "DELETE":
+        return httpx.URL(endpoint).params.get("file_id")
+    if method == "PATCH" and endpoint_path(endpoint).endswith("/status"):
+        body: dict[str, Any] = kwargs.get("json") or {}
+        file_id = body.get("file_id")
+        return file_id if isinstance(file_id, str) else None
+    return None
+
+
+def _read_cached_pdf(
+    pdf_cache: PDFCache, file_id: str, stream_to: StreamTarget | None
+) -> PDFResponse | StreamedPDF | None:
+    try:
+        with pdf_cache.open(file_id) as pdf:
+            if stream_to is None:
+                return PDFResponse(initial_bytes=pdf, file_id=file_id)
+            with _open_stream_target(stream_to) as f:
+                f.write(pdf)
+            return StreamedPDF(file_id=file_id, bytes_written=len(pdf))
+    except KeyError:
+        return None
+
+
+def _remember_pdf(
+    pdf_cache: PDFCache, result: Any, stream_to: StreamTarget | None
+) -> None:
+    """Store a downloaded or generated PDF that carries a file_id."""
+    if isinstance(result, PDFResponse) and result.file_id:
+        with result.getbuffer() as view:
+            pdf_cache.put(result.file_id, view)
+    elif (
+        isinstance(result, StreamedPDF)
+        and result.file_id
+        and isinstance(stream_to, (str, os.PathLike))
+    ):
+        pdf_cache.put_file(result.file_id, stream_to)
+
+
+class _PartialStreamError(BillKitException):
+    """A streamed download failed after writing to a target that cannot be
+    rewound, so retrying it would append to the partial body."""
+
+
+def _rewindable(target: StreamTarget) -> bool:
+    return isinstance(target, (str, os.PathLike)) or target.seekable()
+
+
+def _stream_error(
+    error: httpx.RequestError, target: StreamTarget, written: int
+) -> BillKitException:
+    if written and not _rewindable(target):
+        return _PartialStreamError(
+            f"{error} (after {written} bytes were written to a non-seekable "
+            "stream_to, so the download is not retried)"
+        )
+    return BillKitException(str(error))
+
+
+@contextmanager
+def _open_stream_target(target: StreamTarget) -> Generator[BinaryIO, None, None]:
+    """Yield a writable binary file for `target`.
+
+    Paths are written to a uniquely named temporary sibling and atomically
+    moved into place, so a failed download never leaves a truncated PDF behind
+    and concurrent downloads to the same path cannot clobber each other. Seekable file
+    objects are rewound to their starting position on failure so that a retry
+    does not append to a partial body.
+    """
+    if not isinstance(target, (str, os.PathLike)):
+        start = target.tell() if target.seekable() else None
+        try:
+            yield target
+        except BaseException:
+            if start is not None:
+                target.seek(start)
+                target.truncate()
+            raise
+        return
+    path = os.fspath(target)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or None, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+@asynccontextmanager
+async def _aopen_stream_target(
+    target: StreamTarget,
+) -> AsyncGenerator[BinaryIO, None]:
+    """Async counterpart of _open_stream_target. Opening, finishing and cleaning
+    up the target run in a worker thread; callers write through
+    asyncio.to_thread as well."""
+    manager = _open_stream_target(target)
+    f = await asyncio.to_thread(manager.__enter__)
+    try:
+        yield f
+    except BaseException as e:
+        if not await asyncio.to_thread(manager.__exit__, type(e), e, e.__traceback__):
+            raise
+    else:
+        await asyncio.to_thread(manager.__exit__, None, None, None)
 
 
 class BillKitClient:
@@ -22,60 +238,582 @@ class BillKitClient:
     Usage:
         client = BillKitClient()  # Uses BILLKIT_SECRET_KEY and BASE_URL env vars
         client = BillKitClient(api_key="sk_...", base_url="https://api.billkit.co/v1")  # Or pass in your own API key and base URL
+
+    Connection pooling, per-phase timeouts and HTTP/2 are set with a
+    TransportConfig (defaults come from Settings / BILLKIT_* env vars); a custom
+    httpx transport can be injected with `transport=`. Transient failures are
+    retried per `retry=`, `rate_limiter=` paces requests client-side, and
+    `cache=` enables an opt-in ResponseCache for frequently read GET endpoints.
+    `conditional_cache=` revalidates downloads and documents with ETags instead
+    of fetching them again, and `pdf_cache=` keeps downloaded and generated PDFs
+    on disk by file_id. Concurrent identical GETs share one in-flight request
+    unless `coalesce=False`. JSON bodies are decoded by `decoder=`, straight
+    into the response model each API method expects. Each HTTP attempt is
+    reported to the callables in `hooks=` as a RequestMetrics with its
+    connect/TTFB/body/decode timings and sizes; see OpenTelemetryHook.
     """
 
-    def __init__(self, api_key: str | None = None, base_url: str | None = None) -> None:
-        # Check env var first if no param
-        settings = get_settings()
-        if api_key is None:
-            api_key = settings.api_key
-        if base_url is None:
-            base_url = settings.base_url
-        if not api_key:
-            raise ValueError(
-                "API key required. Pass to BillKitClient(api_key='sk_...') "
-                "or set BILLKIT_SECRET_KEY environment variable."
-            )
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        *,
+        transport_config: TransportConfig | None = None,
+        transport: httpx.BaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        pdf_cache: PDFCache | None = None,
+        coalesce: bool = True,
+        decoder: JSONDecoder | None = None,
+        hooks: Sequence[MetricsHook] = (),
+    ) -> None:
+        self.api_key, self.base_url, self.transport_config = _resolve_config(
+            api_key, base_url, transport_config
+        )
+        self._transport = transport
+        self._client = self._new_http_client()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.conditional_cache = conditional_cache
+        self.pdf_cache = pdf_cache
+        self._inflight = SingleFlight() if coalesce else None
+        self.decoder = decoder if decoder is not None else JSONDecoder()
+        self.hooks = tuple(hooks)
 
-        self.api_key = api_key
-        self.base_url = base_url.rstrip("/")
-        self._client = httpx.Client(
+    def _new_http_client(self) -> httpx.Client:
+        return httpx.Client(
             base_url=self.base_url,
             headers={"Authorization": f"Bearer {self.api_key}"},
-            timeout=30.0,
+            timeout=self.transport_config.timeout,
+            limits=self.transport_config.limits,
+            http2=self.transport_config.http2,
+            transport=self._transport,
         )
-        self.users = Users(self._request)
-        self.reports = Reports(self._request)
-        self.invoices = Invoices(self._request)
-        self.quotes = Quotes(self._request)
-        self.templates = Templates(self._request)
+
+    @cached_property
+    def users(self) -> "Users":
+        from .api.users import Users
+
+        return Users(self._request)
+
+    @cached_property
+    def reports(self) -> "Reports":
+        from .api.reports import Reports
+
+        return Reports(self._request)
+
+    @cached_property
+    def invoices(self) -> "Invoices":
+        from .api.invoices import Invoices
+
+        return Invoices(self._request)
+
+    @cached_property
+    def quotes(self) -> "Quotes":
+        from .api.quotes import Quotes
+
+        return Quotes(self._request)
+
+    @cached_property
+    def templates(self) -> "Templates":
+        from .api.templates import Templates
+
+        return Templates(self._request)
+
+    def _reset_resources(self) -> None:
+        for name in _RESOURCES:
+            self.__dict__.pop(name, None)
+
+    def with_options(self, *, retry: RetryPolicy | None = None) -> Self:
+        """
+        Return a copy of this client with some options overridden.
+
+        The copy shares this client's connection pool, so it is cheap to create
+        per call, e.g. `client.with_options(retry=RetryPolicy.disabled())`.
+        """
+        clone = copy.copy(self)
+        if retry is not None:
+            clone.retry = retry
+        clone._reset_resources()
+        return clone
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def _after_fork(self) -> None:
+        """
+        Give a client inherited from the parent process its own connection
+        pool. The parent's pool is abandoned rather than closed, since its
+        sockets are still in use there.
+        """
+        self._client = self._new_http_client()
+        if self._inflight is not None:
+            self._inflight = SingleFlight()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _probe(self, method: str, endpoint: str, attempt: int) -> Probe:
+        if not self.hooks:
+            return NULL_PROBE
+        return MetricsProbe(self.hooks, method, endpoint, attempt)
+
+    def _observe(self, endpoint: str, resp: httpx.Response) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(endpoint, resp)
 
     def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
-        """Internal proxy to backend API endpoints."""
-        url: str = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Internal proxy to backend API endpoints, coalescing identical reads."""
+        inflight = self._inflight
+        if (
+            inflight is None
+            or method.upper() != "GET"
+            or kwargs.get("stream_to") is not None
+        ):
+            return self._request_once(method, endpoint, **kwargs)
+        key = cache_key(endpoint, kwargs.get("params"), kwargs.get("response_type"))
+        result, shared = inflight.do(
+            key, lambda: self._request_once(method, endpoint, **kwargs)
+        )
+        return _share_result(result) if shared else result
+
+    def _request_once(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Send a request, consulting the opt-in caches."""
+        pdf_cache = self.pdf_cache
+        if pdf_cache is None:
+            return self._request_cached(method, endpoint, **kwargs)
+        stream_to: StreamTarget | None = kwargs.get("stream_to")
+        file_id = _download_file_id(method, endpoint)
+        if file_id is not None:
+            cached = _read_cached_pdf(pdf_cache, file_id, stream_to)
+            if cached is not None:
+                return cached
+        changed = _changed_file_id(method, endpoint, kwargs)
+        result: Any = self._request_cached(method, endpoint, **kwargs)
+        if changed is not None:
+            pdf_cache.discard(changed)
+        _remember_pdf(pdf_cache, result, stream_to)
+        return result
+
+    def _request_cached(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Serve GET requests from `self.cache` when enabled."""
+        cache = self.cache
+        if cache is None:
+            return self._request_uncached(method, endpoint, **kwargs)
+        if method.upper() != "GET":
+            try:
+                return self._request_uncached(method, endpoint, **kwargs)
+            finally:
+                cache.invalidate_after(method, endpoint)
+        if kwargs.get("stream_to") is not None or cache.ttl_for(endpoint) is None:
+            return self._request_uncached(method, endpoint, **kwargs)
+        params = kwargs.get("params")
+        response_type = kwargs.get("response_type")
         try:
-            resp: httpx.Response = self._client.request(method, url, **kwargs)
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            body: str | dict[str, Any] | None = None
+            return cache.get(endpoint, params, response_type)
+        except KeyError:
+            pass
+        result: Any = self._request_uncached(method, endpoint, **kwargs)
+        # PDF buffers are single-use file objects, so only decoded JSON is cached.
+        if not isinstance(result, PDFResponse):
+            cache.set(endpoint, params, result, response_type)
+        return result
+
+    def _request_uncached(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Send a request, retrying per `self.retry`."""
+        stream_to: StreamTarget | None = kwargs.pop("stream_to", None)
+        response_type = kwargs.pop("response_type", None)
+        self.retry.ensure_idempotency_key(method, kwargs)
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            try:
+                probe = self._probe(method, endpoint, retries)
+                if stream_to is not None:
+                    return self._stream(method, endpoint, stream_to, probe, **kwargs)
+                return self._send(method, endpoint, response_type, probe, **kwargs)
+            except _PartialStreamError as e:
+                e.retries = retries
+                raise
+            except BillKitException as e:
+                delay = self.retry.retry_delay(method, kwargs, e, retries)
+                if delay is None:
+                    e.retries = retries
+                    raise
+            retries += 1
+            time.sleep(delay)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        response_type: Any,
+        probe: Probe,
+        **kwargs: Any,
+    ) -> Any:
+        """Make a single request attempt."""
+        key, stored = None, None
+        if self.conditional_cache is not None:
+            key, stored = self.conditional_cache.lookup(method, endpoint, kwargs)
+        with probe:
             try:
-                body = e.response.json()
-            except ValueError:
-                body = e.response.text
-            raise BillKitException(
-                str(e),
-                status_code=e.response.status_code,
-                response_body=body,
-            ) from e
-        except httpx.RequestError as e:
-            raise BillKitException(str(e)) from e
-        content_type = (
-            (resp.headers.get("content-type") or "").lower().split(";")[0].strip()
+                request = self._client.build_request(
+                    method, self._url(endpoint), **kwargs
+                )
+                probe.request_sent(request)
+                resp = self._client.send(request, stream=True)
+                try:
+                    probe.headers_received(resp)
+                    resp.read()
+                finally:
+                    resp.close()
+                probe.body_received(resp)
+                self._observe(endpoint, resp)
+                if key is not None and self.conditional_cache is not None:
+                    resp = self.conditional_cache.resolve(key, stored, resp)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise _status_error(e) from e
+            except httpx.RequestError as e:
+                raise BillKitException(str(e)) from e
+            with probe.decoding():
+                return _parse_response(resp, self.decoder, response_type)
+
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        stream_to: StreamTarget,
+        probe: Probe,
+        **kwargs: Any,
+    ) -> StreamedPDF:
+        """Write the response body to `stream_to` in chunks instead of buffering it."""
+        written = 0
+        with probe:
+            try:
+                request = self._client.build_request(
+                    method, self._url(endpoint), **kwargs
+                )
+                probe.request_sent(request)
+                resp = self._client.send(request, stream=True)
+                try:
+                    probe.headers_received(resp)
+                    self._observe(endpoint, resp)
+                    if resp.is_error:
+                        resp.read()
+                        resp.raise_for_status()
+                    with _open_stream_target(stream_to) as f:
+                        for chunk in resp.iter_bytes(_STREAM_CHUNK_SIZE):
+                            written += f.write(chunk)
+                finally:
+                    resp.close()
+                probe.body_received(resp)
+            except httpx.HTTPStatusError as e:
+                raise _status_error(e) from e
+            except httpx.RequestError as e:
+                raise _stream_error(e, stream_to, written) from e
+        return StreamedPDF(
+            file_id=resp.headers.get("X-Billkit-File-Id"), bytes_written=written
         )
-        if content_type == "application/pdf":
-            file_id = resp.headers.get("X-Billkit-File-Id")
-            return PDFResponse(initial_bytes=resp.content, file_id=file_id)
+
+
+class AsyncBillKitClient:
+    """
+    asyncio client for BillKitco invoicing API.
+
+    Exposes the same resource groups as BillKitClient with awaitable methods,
+    all sharing a single httpx.AsyncClient connection pool.
+
+    Usage:
+        async with AsyncBillKitClient() as client:
+            pdf = await client.invoices.create(...)
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        *,
+        transport_config: TransportConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+        conditional_cache: ConditionalCache | None = None,
+        pdf_cache: PDFCache | None = None,
+        coalesce: bool = True,
+        decoder: JSONDecoder | None = None,
+        hooks: Sequence[MetricsHook] = (),
+    ) -> None:
+        self.api_key, self.base_url, self.transport_config = _resolve_config(
+            api_key, base_url, transport_config
+        )
+        self._transport = transport
+        self._client = self._new_http_client()
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.conditional_cache = conditional_cache
+        self.pdf_cache = pdf_cache
+        self._inflight = AsyncSingleFlight() if coalesce else None
+        self.decoder = decoder if decoder is not None else JSONDecoder()
+        self.hooks = tuple(hooks)
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            timeout=self.transport_config.timeout,
+            limits=self.transport_config.limits,
+            http2=self.transport_config.http2,
+            transport=self._transport,
+        )
+
+    @cached_property
+    def users(self) -> "AsyncUsers":
+        from .api.users import AsyncUsers
+
+        return AsyncUsers(self._request)
+
+    @cached_property
+    def reports(self) -> "AsyncReports":
+        from .api.reports import AsyncReports
+
+        return AsyncReports(self._request)
+
+    @cached_property
+    def invoices(self) -> "AsyncInvoices":
+        from .api.invoices import AsyncInvoices
+
+        return AsyncInvoices(self._request)
+
+    @cached_property
+    def quotes(self) -> "AsyncQuotes":
+        from .api.quotes import AsyncQuotes
+
+        return AsyncQuotes(self._request)
+
+    @cached_property
+    def templates(self) -> "AsyncTemplates":
+        from .api.templates import AsyncTemplates
+
+        return AsyncTemplates(self._request)
+
+    def _reset_resources(self) -> None:
+        for name in _RESOURCES:
+            self.__dict__.pop(name, None)
+
+    def with_options(self, *, retry: RetryPolicy | None = None) -> Self:
+        """
+        Return a copy of this client with some options overridden. See
+        BillKitClient.with_options.
+        """
+        clone = copy.copy(self)
+        if retry is not None:
+            clone.retry = retry
+        clone._reset_resources()
+        return clone
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+
+    def _probe(self, method: str, endpoint: str, attempt: int) -> Probe:
+        if not self.hooks:
+            return NULL_PROBE
+        return MetricsProbe(self.hooks, method, endpoint, attempt)
+
+    def _observe(self, endpoint: str, resp: httpx.Response) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(endpoint, resp)
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Internal proxy to backend API endpoints, coalescing identical reads."""
+        inflight = self._inflight
+        if (
+            inflight is None
+            or method.upper() != "GET"
+            or kwargs.get("stream_to") is not None
+        ):
+            return await self._request_once(method, endpoint, **kwargs)
+        key = cache_key(endpoint, kwargs.get("params"), kwargs.get("response_type"))
+        result, shared = await inflight.do(
+            key, lambda: self._request_once(method, endpoint, **kwargs)
+        )
+        return _share_result(result) if shared else result
+
+    async def _request_once(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Send a request, consulting the opt-in caches."""
+        pdf_cache = self.pdf_cache
+        if pdf_cache is None:
+            return await self._request_cached(method, endpoint, **kwargs)
+        stream_to: StreamTarget | None = kwargs.get("stream_to")
+        file_id = _download_file_id(method, endpoint)
+        if file_id is not None:
+            cached = await asyncio.to_thread(
+                _read_cached_pdf, pdf_cache, file_id, stream_to
+            )
+            if cached is not None:
+                return cached
+        changed = _changed_file_id(method, endpoint, kwargs)
+        result: Any = await self._request_cached(method, endpoint, **kwargs)
+        if changed is not None:
+            await asyncio.to_thread(pdf_cache.discard, changed)
+        await asyncio.to_thread(_remember_pdf, pdf_cache, result, stream_to)
+        return result
+
+    async def _request_cached(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Serve GET requests from `self.cache` when enabled."""
+        cache = self.cache
+        if cache is None:
+            return await self._request_uncached(method, endpoint, **kwargs)
+        if method.upper() != "GET":
+            try:
+                return await self._request_uncached(method, endpoint, **kwargs)
+            finally:
+                cache.invalidate_after(method, endpoint)
+        if kwargs.get("stream_to") is not None or cache.ttl_for(endpoint) is None:
+            return await self._request_uncached(method, endpoint, **kwargs)
+        params = kwargs.get("params")
+        response_type = kwargs.get("response_type")
         try:
-            return resp.json()
-        except ValueError:
-            return resp.text
+            return cache.get(endpoint, params, response_type)
+        except KeyError:
+            pass
+        result: Any = await self._request_uncached(method, endpoint, **kwargs)
+        # PDF buffers are single-use file objects, so only decoded JSON is cached.
+        if not isinstance(result, PDFResponse):
+            cache.set(endpoint, params, result, response_type)
+        return result
+
+    async def _request_uncached(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Send a request, retrying per `self.retry`."""
+        stream_to: StreamTarget | None = kwargs.pop("stream_to", None)
+        response_type = kwargs.pop("response_type", None)
+        self.retry.ensure_idempotency_key(method, kwargs)
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            try:
+                probe = self._probe(method, endpoint, retries)
+                if stream_to is not None:
+                    return await self._stream(
+                        method, endpoint, stream_to, probe, **kwargs
+                    )
+                return await self._send(
+                    method, endpoint, response_type, probe, **kwargs
+                )
+            except _PartialStreamError as e:
+                e.retries = retries
+                raise
+            except BillKitException as e:
+                delay = self.retry.retry_delay(method, kwargs, e, retries)
+                if delay is None:
+                    e.retries = retries
+                    raise
+            retries += 1
+            await asyncio.sleep(delay)
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        response_type: Any,
+        probe: Probe,
+        **kwargs: Any,
+    ) -> Any:
+        """Make a single request attempt."""
+        key, stored = None, None
+        if self.conditional_cache is not None:
+            key, stored = self.conditional_cache.lookup(method, endpoint, kwargs)
+        with probe:
+            try:
+                request = self._client.build_request(
+                    method, self._url(endpoint), **kwargs
+                )
+                probe.request_sent(request, is_async=True)
+                resp = await self._client.send(request, stream=True)
+                try:
+                    probe.headers_received(resp)
+                    await resp.aread()
+                finally:
+                    await resp.aclose()
+                probe.body_received(resp)
+                self._observe(endpoint, resp)
+                if key is not None and self.conditional_cache is not None:
+                    resp = self.conditional_cache.resolve(key, stored, resp)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise _status_error(e) from e
+            except httpx.RequestError as e:
+                raise BillKitException(str(e)) from e
+            with probe.decoding():
+                return _parse_response(resp, self.decoder, response_type)
+
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        stream_to: StreamTarget,
+        probe: Probe,
+        **kwargs: Any,
+    ) -> StreamedPDF:
+        """Write the response body to `stream_to` in chunks instead of buffering it."""
+        written = 0
+        with probe:
+            try:
+                request = self._client.build_request(
+                    method, self._url(endpoint), **kwargs
+                )
+                probe.request_sent(request, is_async=True)
+                resp = await self._client.send(request, stream=True)
+                try:
+                    probe.headers_received(resp)
+                    self._observe(endpoint, resp)
+                    if resp.is_error:
+                        await resp.aread()
+                        resp.raise_for_status()
+                    async with _aopen_stream_target(stream_to) as f:
+                        async for chunk in resp.aiter_bytes(_STREAM_CHUNK_SIZE):
+                            written += await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await resp.aclose()
+                probe.body_received(resp)
+            except httpx.HTTPStatusError as e:
+                raise _status_error(e) from e
+            except httpx.RequestError as e:
+                raise _stream_error(e, stream_to, written) from e
+        return StreamedPDF(
+            file_id=resp.headers.get("X-Billkit-File-Id"), bytes_written=written
+        )
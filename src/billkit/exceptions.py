@@ -1,6 +1,10 @@
 """BillKit SDK exceptions."""
 
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api._csv import CSVRowError
 
 
 class BillKitException(Exception):
@@ -9,6 +13,7 @@ class BillKitException(Exception):
 
     Wraps HTTP and transport errors from the API so callers can catch
     a single exception type. The original exception is available as __cause__.
+    `retries` is the number of times the request was retried before giving up.
     """
 
     def __init__(
@@ -17,8 +22,28 @@ class BillKitException(Exception):
         *,
         status_code: int | None = None,
         response_body: str | dict[str, Any] | None = None,
+        retries: int = 0,
     ) -> None:
         super().__init__(message)
         self.message = message
         self.status_code = status_code
         self.response_body = response_body
+        self.retries = retries
+
+
+class BatchTimeoutError(BillKitException):
+    """Raised when a batch job does not finish within the allowed time."""
+
+    def __init__(self, message: str, *, job_id: str, last_status: Any) -> None:
+        super().__init__(message)
+        self.job_id = job_id
+        self.last_status = last_status
+
+
+class CSVValidationError(BillKitException):
+    """Raised when batch CSV files fail client-side validation before upload."""
+
+    def __init__(self, errors: Sequence["CSVRowError"]) -> None:
+        lines = "\n".join(f"  {error}" for error in errors)
+        super().__init__(f"{len(errors)} problem(s) found in batch CSV:\n{lines}")
+        self.errors = list(errors)
@@ -1,12 +1,14 @@
 import os
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import StrEnum
 from io import BytesIO
-from typing import Any
+from typing import Any, BinaryIO, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing_extensions import Buffer
 
 
 class PDFResponse(BytesIO):
@@ -20,7 +22,7 @@ class PDFResponse(BytesIO):
 
     file_id: str | None = None
 
-    def __init__(self, initial_bytes: bytes = b"", file_id: str | None = None) -> None:
+    def __init__(self, initial_bytes: Buffer = b"", file_id: str | None = None) -> None:
         super().__init__(initial_bytes)
         self.file_id = file_id
 
@@ -28,6 +30,9 @@ class PDFResponse(BytesIO):
         """
         Save the in-memory PDF bytes to a local file path.
 
+        The bytes are written straight from the underlying buffer, without
+        making an intermediate copy.
+
         **Args:**
             file_path (os.PathLike[str] | str): Destination path where the PDF
                 file will be written. If a file already exists at this path,
@@ -43,8 +48,23 @@ class PDFResponse(BytesIO):
             ```
         """
         self.seek(0)
-        with open(file_path, "wb") as f:
-            f.write(self.getvalue())
+        with open(file_path, "wb") as f, self.getbuffer() as view:
+            f.write(view)
+
+
+StreamTarget = str | os.PathLike[str] | BinaryIO
+"""Destination for a streamed PDF: a file path or a binary file object."""
+
+
+@dataclass(frozen=True)
+class StreamedPDF:
+    """
+    Result of a PDF download that was streamed to a destination rather than
+    buffered in memory.
+    """
+
+    file_id: str | None
+    bytes_written: int
 
 
 class DiscountType(StrEnum):
@@ -158,3 +178,51 @@ class _BaseDocumentResponse(BaseModel):  # pyright: ignore[reportUnusedClass]
     file_id: str
     created_at: str
     client_name: str
+
+
+DocT = TypeVar("DocT", bound=_BaseDocumentResponse)
+
+
+class DocumentRecord(Generic[DocT]):
+    """
+    Lightweight, read-only view of a listed document, wrapping its JSON object
+    without validating it.
+
+    Common fields are available as attributes and any field by key; call
+    to_model() to validate the record into the full response model.
+    """
+
+    __slots__ = ("_data", "_model")
+
+    def __init__(self, data: Mapping[str, Any], model: type[DocT]) -> None:
+        self._data = data
+        self._model = model
+
+    @property
+    def file_id(self) -> str:
+        return self._data["file_id"]
+
+    @property
+    def created_at(self) -> str:
+        return self._data["created_at"]
+
+    @property
+    def client_name(self) -> str:
+        return self._data["client_name"]
+
+    @property
+    def status(self) -> str | None:
+        """Invoice status; None for quotes."""
+        return self._data.get("status")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def to_model(self) -> DocT:
+        return self._model.model_validate(self._data)
+
+    def __repr__(self) -> str:
+        return f"DocumentRecord[{self._model.__name__}](file_id={self.file_id!r})"
@@ -0,0 +1,111 @@
+import asyncio
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from billkit import AsyncBillKitClient, BillKitClient
+
+# The benchmark scripts import each other as top-level modules.
+sys.path.insert(0, str(Path(__file__).parents[1] / "benchmarks"))
+
+BASE_URL = "https://api.test/v1"
+
+Responder = Callable[[httpx.Request], httpx.Response]
+ClientFactory = Callable[..., BillKitClient]
+AsyncClientFactory = Callable[..., AsyncBillKitClient]
+
+
+def _empty_list(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=[])
+
+
+class MockServer:
+    """
+    Stand-in for the BillKit API behind httpx.MockTransport.
+
+    Every request is read and recorded in `requests`, then answered by
+    `respond`, which tests replace to script the API; it defaults to `200 []`.
+    Each answer is delayed by `latency` seconds, and `peak_in_flight` tracks
+    the most requests being answered at once. The same server backs both the
+    sync and the async client.
+    """
+
+    def __init__(
+        self, respond: Responder = _empty_list, *, latency: float = 0.0
+    ) -> None:
+        self.respond = respond
+        self.latency = latency
+        self.requests: list[httpx.Request] = []
+        self.in_flight = self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        self._enter(request)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.respond(request)
+        finally:
+            self._exit()
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        self._enter(request)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self.respond(request)
+        finally:
+            self._exit()
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer()
+
+
+@pytest.fixture
+def make_client(server: MockServer) -> ClientFactory:
+    """Build a BillKitClient talking to `server`; options go to the client."""
+
+    def make(**options: Any) -> BillKitClient:
+        return BillKitClient(
+            api_key="sk_test",
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(server.handle),
+            **options,
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_async_client(server: MockServer) -> AsyncClientFactory:
+    """Build an AsyncBillKitClient talking to `server`."""
+
+    def make(**options: Any) -> AsyncBillKitClient:
+        return AsyncBillKitClient(
+            api_key="sk_test",
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(server.ahandle),
+            **options,
+        )
+
+    return make
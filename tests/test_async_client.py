@@ -0,0 +1,81 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, MockServer
+
+from billkit import BillKitException
+
+BATCH = {"job_id": "job_1", "status": "queued", "webhook_url": "https://h.test"}
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.endswith("/users/logo"):
+        return httpx.Response(
+            200, json={"logo_url": "https://l.test", "public_id": "p1"}
+        )
+    if path.endswith("/csv"):
+        return httpx.Response(200, json=BATCH)
+    if path.endswith("/by-id/missing"):
+        return httpx.Response(404, json={"detail": "Invoice not found"})
+    return httpx.Response(200, json=[])
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def test_resource_groups_share_one_authenticated_pool(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            await asyncio.gather(client.invoices.list(), client.quotes.list())
+            assert client.invoices is client.invoices
+        assert client._client.is_closed  # pyright: ignore[reportPrivateUsage]
+
+    asyncio.run(main())
+    assert sorted(str(r.url) for r in server.requests) == [
+        "https://api.test/v1/invoices?limit=50&offset=0",
+        "https://api.test/v1/quotes?limit=50&offset=0",
+    ]
+    assert {r.headers["Authorization"] for r in server.requests} == {"Bearer sk_test"}
+
+
+def test_api_errors_raise_billkit_exception(
+    make_async_client: AsyncClientFactory,
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            await client.invoices.get_document("missing")
+
+    with pytest.raises(BillKitException) as info:
+        asyncio.run(main())
+    assert info.value.status_code == 404
+
+
+def test_uploads_send_file_contents(
+    tmp_path: Path, server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    logo = tmp_path / "logo.png"
+    logo.write_bytes(b"\x89PNG logo")
+    invoices = tmp_path / "invoices.csv"
+    invoices.write_text("invoice_number\nINV-1\n")
+    items = tmp_path / "items.csv"
+    items.write_text("invoice_number,description\nINV-1,Work\n")
+
+    async def main() -> None:
+        async with make_async_client() as client:
+            uploaded = await client.users.upload_logo(logo)
+            assert uploaded.public_id == "p1"
+            job = await client.invoices.create_batch_from_csv(invoices, items)
+            assert job.job_id == "job_1"
+
+    asyncio.run(main())
+    logo_upload, csv_upload = server.requests
+    assert b"\x89PNG logo" in logo_upload.content
+    assert b'name="invoice_csv"; filename="invoices.csv"' in csv_upload.content
+    assert b"INV-1,Work" in csv_upload.content
@@ -0,0 +1,99 @@
+import asyncio
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer, Responder
+
+from billkit import BatchTimeoutError
+from billkit.api.invoices import AsyncInvoices, Invoices
+from billkit.api.quotes import AsyncQuotes, Quotes
+
+
+def _record(i: int) -> dict[str, Any]:
+    return {"invoiceNumber": f"INV-{i}", "s3Key": f"invoices/{i}.pdf"}
+
+
+def _importing(
+    server: MockServer, total: int = 5, final_status: str = "completed"
+) -> Responder:
+    """Imports two records per poll; reports `final_status` once all are in."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        imported = min(total, 2 * len(server.requests))
+        status = final_status if imported == total else "processing"
+        return httpx.Response(
+            200,
+            json={
+                "job_id": "job_1",
+                "status": status,
+                "entity_type": "invoice",
+                "source": "json",
+                "total_count": total,
+                "imported_count": imported,
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:00Z",
+                "records": [_record(i) for i in range(imported)],
+            },
+        )
+
+    return respond
+
+
+def test_iter_batch_records_yields_each_record_once(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _importing(server)
+    records = make_client().invoices.iter_batch_records("job_1", min_interval=0.001)
+    assert [r.invoice_number for r in records] == [f"INV-{i}" for i in range(5)]
+    assert len(server.requests) == 3
+
+
+def test_iter_batch_records_times_out_on_an_unknown_final_status(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _importing(server, total=1, final_status="archived")
+    records = make_client().invoices.iter_batch_records(
+        "job_1", timeout=0.05, min_interval=0.01
+    )
+    with pytest.raises(BatchTimeoutError) as info:
+        list(records)
+    assert info.value.job_id == "job_1"
+
+
+def test_async_iter_batch_records_yields_each_record_once(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    server.respond = _importing(server)
+
+    async def main() -> list[str]:
+        async with make_async_client() as client:
+            return [
+                r.invoice_number
+                async for r in client.invoices.iter_batch_records(
+                    "job_1", min_interval=0.001
+                )
+            ]
+
+    assert asyncio.run(main()) == [f"INV-{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        Invoices.iter_batch_records,
+        Invoices.wait_for_batch,
+        AsyncInvoices.iter_batch_records,
+        AsyncInvoices.wait_for_batch,
+        Quotes.iter_batch_records,
+        Quotes.wait_for_batch,
+        AsyncQuotes.iter_batch_records,
+        AsyncQuotes.wait_for_batch,
+    ],
+)
+def test_batch_polling_has_a_finite_default_timeout(
+    method: Callable[..., object],
+) -> None:
+    assert inspect.signature(method).parameters["timeout"].default == 600.0
@@ -0,0 +1,23 @@
+import pytest
+import throughput
+
+
+def test_throughput_runs_every_scenario(capsys: pytest.CaptureFixture[str]) -> None:
+    throughput.main(
+        [
+            "--calls=5",
+            "--concurrency=2",
+            "--pdf-kb=1",
+            "--list-size=5",
+            "--batch-records=3",
+            "--report-rows=2",
+        ]
+    )
+    header, *rows = capsys.readouterr().out.splitlines()
+    assert header.split()[:2] == ["scenario", "client"]
+    assert [row.split()[:2] for row in rows] == [
+        [scenario, client]
+        for scenario in throughput.SCENARIOS
+        for client in ("sync", "async")
+    ]
+    assert all(float(row.split()[2]) > 0 for row in rows)
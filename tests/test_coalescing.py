@@ -0,0 +1,105 @@
+import asyncio
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit.models.invoices import InvoiceDocumentResponse
+
+DOCUMENTS = [
+    {
+        "file_id": f"file_{i}",
+        "created_at": "2026-01-01",
+        "client_name": "Acme",
+        "invoice_number": f"INV-{i}",
+        "due_date": "2026-02-01",
+        "status": "paid",
+    }
+    for i in range(3)
+]
+PDF = b"%PDF-1.7 test body"
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/download"):
+        return httpx.Response(
+            200,
+            content=PDF,
+            headers={"Content-Type": "application/pdf", "X-Billkit-File-Id": "f1"},
+        )
+    return httpx.Response(200, json=DOCUMENTS)
+
+
+@pytest.fixture
+def server() -> MockServer:
+    # Answers slowly so that concurrent callers overlap.
+    return MockServer(_respond, latency=0.2)
+
+
+def test_threads_share_one_request_but_get_independent_results(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client()
+
+    def list_invoices(_: int) -> Sequence[InvoiceDocumentResponse]:
+        return client.invoices.list()
+
+    with ThreadPoolExecutor(5) as pool:
+        results = list(pool.map(list_invoices, range(5)))
+
+    assert len(server.requests) == 1
+    assert len({id(result) for result in results}) == 5
+    assert len({id(result[0]) for result in results}) == 5
+    results[0][0].client_name = "Mutated"
+    assert all(result[0].client_name == "Acme" for result in results[1:])
+
+
+def test_threads_can_close_their_coalesced_pdfs(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client()
+
+    def download(_: int) -> bytes:
+        with client.invoices.download_pdf("f1") as pdf:
+            return pdf.read()
+
+    with ThreadPoolExecutor(10) as pool:
+        bodies = list(pool.map(download, range(10)))
+
+    assert len(server.requests) == 1
+    assert bodies == [PDF] * 10
+
+
+def test_single_caller_gets_result_without_copy(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.latency = 0
+    client = make_client()
+    assert [doc.file_id for doc in client.invoices.list()] == [
+        "file_0",
+        "file_1",
+        "file_2",
+    ]
+
+
+def test_async_callers_share_one_request_but_get_independent_results(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            results = await asyncio.gather(*(client.invoices.list() for _ in range(5)))
+            assert len({id(result) for result in results}) == 5
+            results[0][0].client_name = "Mutated"
+            assert all(result[0].client_name == "Acme" for result in results[1:])
+
+            async def download() -> bytes:
+                with await client.invoices.download_pdf("f1") as pdf:
+                    return pdf.read()
+
+            bodies = await asyncio.gather(*(download() for _ in range(5)))
+            assert bodies == [PDF] * 5
+
+    asyncio.run(main())
+    assert len(server.requests) == 2
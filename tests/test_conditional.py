@@ -0,0 +1,115 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import ConditionalCache, DirectoryStore, MemoryStore
+
+PDF = b"%PDF-1.7 body"
+
+
+class _ETagAPI:
+    """Serves a PDF with an ETag, answering 304 when the client's ETag matches."""
+
+    def __init__(self) -> None:
+        self.version = 1
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200,
+            content=PDF + str(self.version).encode(),
+            headers={
+                "Content-Type": "application/pdf",
+                "ETag": self.etag,
+                "X-Billkit-File-Id": "f1",
+            },
+        )
+
+
+@pytest.fixture
+def api() -> _ETagAPI:
+    return _ETagAPI()
+
+
+@pytest.fixture
+def server(api: _ETagAPI) -> MockServer:
+    return MockServer(api)
+
+
+def _validators(server: MockServer) -> list[str | None]:
+    return [request.headers.get("If-None-Match") for request in server.requests]
+
+
+@pytest.mark.parametrize("store", ["memory", "directory"])
+def test_unchanged_pdf_is_answered_from_the_store(
+    tmp_path: Path,
+    store: str,
+    api: _ETagAPI,
+    server: MockServer,
+    make_client: ClientFactory,
+) -> None:
+    cache = ConditionalCache(
+        MemoryStore() if store == "memory" else DirectoryStore(tmp_path)
+    )
+    client = make_client(conditional_cache=cache)
+
+    first = client.invoices.download_pdf("f1")
+    second = client.invoices.download_pdf("f1")
+    assert first.read() == second.read() == PDF + b"1"
+    assert second.file_id == "f1"
+    assert _validators(server) == [None, '"v1"']
+    assert cache.revalidated == 1
+
+    api.version = 2
+    assert client.invoices.download_pdf("f1").read() == PDF + b"2"
+    assert cache.revalidated == 1
+
+
+def test_directory_store_is_shared_between_clients(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    first = make_client(conditional_cache=ConditionalCache(DirectoryStore(tmp_path)))
+    first.invoices.download_pdf("f1")
+    cache = ConditionalCache(DirectoryStore(tmp_path))
+    second = make_client(conditional_cache=cache)
+    assert second.invoices.download_pdf("f1").read() == PDF + b"1"
+    assert cache.revalidated == 1
+
+
+def test_other_endpoints_are_not_revalidated(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    cache = ConditionalCache(endpoints=("quotes/download",))
+    client = make_client(conditional_cache=cache)
+    client.invoices.download_pdf("f1")
+    client.invoices.download_pdf("f1")
+    assert _validators(server) == [None, None]
+
+
+def test_memory_store_evicts_beyond_max_bytes(make_client: ClientFactory) -> None:
+    store = MemoryStore(max_bytes=len(PDF) + 1)
+    client = make_client(conditional_cache=ConditionalCache(store))
+    client.invoices.download_pdf("f1")
+    client.quotes.download_pdf("f1")
+    assert store.get("invoices/download?file_id=f1") is None
+    assert store.get("quotes/download?file_id=f1") is not None
+
+
+def test_async_revalidation(make_async_client: AsyncClientFactory) -> None:
+    cache = ConditionalCache()
+
+    async def main() -> bytes:
+        async with make_async_client(conditional_cache=cache) as client:
+            await client.quotes.download_pdf("f1")
+            return (await client.quotes.download_pdf("f1")).read()
+
+    assert asyncio.run(main()) == PDF + b"1"
+    assert cache.revalidated == 1
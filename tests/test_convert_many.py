@@ -0,0 +1,150 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import PDFResponse, ResponseCache, StreamedPDF
+from billkit.models.quotes import Quote2InvoiceRequest
+
+REPORT: dict[str, Any] = {
+    "currencyCode": "GBP",
+    "currencySymbol": "£",
+    "summary": {"total": "10.00", "count": 1, "overdueCount": 0},
+    "byPeriod": {"daily": [], "weekly": [], "monthly": [], "yearly": []},
+    "byClient": [],
+    "byStatus": [],
+    "availableCurrencies": [],
+}
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/reports/revenue"):
+        return httpx.Response(200, json=REPORT)
+    file_id = json.loads(request.content)["file_id"]
+    if file_id == "missing":
+        return httpx.Response(404, json={"detail": "Quote not found"})
+    return httpx.Response(
+        200,
+        content=b"%PDF " + file_id.encode(),
+        headers={
+            "Content-Type": "application/pdf",
+            "X-Billkit-File-Id": f"inv_{file_id}",
+        },
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def _report_requests(server: MockServer) -> int:
+    return sum(r.url.path.endswith("/reports/revenue") for r in server.requests)
+
+
+def _requests(*file_ids: str) -> list[Quote2InvoiceRequest]:
+    return [Quote2InvoiceRequest(file_id=file_id) for file_id in file_ids]
+
+
+def test_convert_many_returns_pdfs_and_reports_failures(
+    make_client: ClientFactory,
+) -> None:
+    convert_many = make_client().quotes.convert_many
+    results = {r.key.file_id: r for r in convert_many(_requests("q1", "missing"))}
+
+    pdf = results["q1"].value
+    assert isinstance(pdf, PDFResponse)
+    assert pdf.file_id == "inv_q1"
+    assert pdf.read() == b"%PDF q1"
+    assert not results["missing"].ok
+    assert results["missing"].error is not None
+
+
+def test_convert_many_skip_pdf_keeps_only_file_id(make_client: ClientFactory) -> None:
+    client = make_client()
+    results = list(client.quotes.convert_many(_requests("q1", "q2"), skip_pdf=True))
+    assert sorted((r.value.file_id for r in results if r.value), key=str) == [
+        "inv_q1",
+        "inv_q2",
+    ]
+    assert all(isinstance(r.value, StreamedPDF) for r in results)
+
+
+def test_convert_many_streams_to_dest_dir(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    client = make_client()
+    results = list(client.quotes.convert_many(_requests("q1"), dest_dir=tmp_path))
+    assert results[0].ok
+    assert (tmp_path / "q1.pdf").read_bytes() == b"%PDF q1"
+
+
+def test_convert_many_rejects_dest_dir_with_skip_pdf(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    client = make_client()
+    with pytest.raises(ValueError):
+        client.quotes.convert_many(_requests("q1"), dest_dir=tmp_path, skip_pdf=True)
+
+
+@pytest.mark.parametrize("skip_pdf", [True, False])
+def test_streamed_conversions_invalidate_the_response_cache(
+    skip_pdf: bool, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client(cache=ResponseCache({"reports/*": 60}))
+    client.reports.get_revenue()
+    client.reports.get_revenue()
+    assert _report_requests(server) == 1
+
+    list(client.quotes.convert_many(_requests("q1"), skip_pdf=skip_pdf))
+    client.reports.get_revenue()
+    assert _report_requests(server) == 2
+
+
+def test_async_convert_many(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> list[str]:
+        async with make_async_client(cache=ResponseCache({"reports/*": 60})) as client:
+            await client.reports.get_revenue()
+            results = [
+                r
+                async for r in client.quotes.convert_many(
+                    _requests("q1", "q2"), skip_pdf=True
+                )
+            ]
+            await client.reports.get_revenue()
+            return sorted(r.value.file_id or "" for r in results if r.value)
+
+    assert asyncio.run(main()) == ["inv_q1", "inv_q2"]
+    assert _report_requests(server) == 2
+
+
+def test_async_convert_many_creates_dest_dir_off_the_event_loop(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    make_async_client: AsyncClientFactory,
+) -> None:
+    mkdir = Path.mkdir
+
+    def checked_mkdir(self: Path, *args: Any, **kwargs: Any) -> None:
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", checked_mkdir)
+    dest = tmp_path / "converted"
+
+    async def main() -> None:
+        async with make_async_client() as client:
+            async for result in client.quotes.convert_many(
+                _requests("q1"), dest_dir=dest
+            ):
+                assert result.ok
+
+    asyncio.run(main())
+    assert (dest / "q1.pdf").read_bytes() == b"%PDF q1"
@@ -0,0 +1,102 @@
+import asyncio
+import json
+from decimal import Decimal
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import PDFResponse
+from billkit.models._base import DiscountType
+from billkit.models.invoices import InvoiceCreatePayload, InvoiceItem
+from billkit.models.quotes import QuoteItem
+
+ITEMS = [
+    InvoiceItem(description="Design", qty=1, price=Decimal("950.00"), tax=Decimal(20)),
+    InvoiceItem(
+        description="Hosting",
+        qty=12,
+        price=Decimal(5),
+        discount_type=DiscountType.FIXED,
+        discount_value=Decimal(10),
+    ),
+]
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    assert request.headers["Content-Type"] == "application/json"
+    return httpx.Response(
+        200,
+        content=b"%PDF",
+        headers={"Content-Type": "application/pdf", "X-Billkit-File-Id": "f1"},
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def _bodies(server: MockServer) -> list[dict[str, Any]]:
+    return [json.loads(request.content) for request in server.requests]
+
+
+def _two_pass_body(items: list[InvoiceItem], **fields: Any) -> dict[str, Any]:
+    """The body as built before create serialized in a single pass."""
+    dumped = [item.model_dump(mode="json", exclude_unset=True) for item in items]
+    payload = InvoiceCreatePayload.model_validate({"items": dumped, **fields})
+    return payload.model_dump(mode="json", exclude_unset=True)
+
+
+def test_create_sends_the_same_body_as_before(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    pdf = make_client().invoices.create(
+        client_name="Acme",
+        client_email="billing@acme.example",
+        items=ITEMS,
+        invoice_number="INV-1",
+        due_date="2026-02-01",
+        notes="Thanks",
+    )
+
+    assert isinstance(pdf, PDFResponse)
+    assert pdf.file_id == "f1"
+    bodies = _bodies(server)
+    assert bodies == [
+        _two_pass_body(
+            client_name="Acme",
+            client_email="billing@acme.example",
+            items=ITEMS,
+            invoice_number="INV-1",
+            invoice_date=None,
+            upload_to_s3=True,
+            due_date="2026-02-01",
+            notes="Thanks",
+        )
+    ]
+    assert bodies[0]["items"][0]["price"] == "950.00"
+    assert "currency_code" not in bodies[0]
+
+
+def test_async_quote_create(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            await client.quotes.create(
+                client_name="Acme",
+                client_email="billing@acme.example",
+                items=[QuoteItem(description="Design", qty=2, price=Decimal("10.00"))],
+                quote_number="Q-1",
+                save_to_cloud=False,
+            )
+
+    asyncio.run(main())
+    [body] = _bodies(server)
+    assert body["quote_number"] == "Q-1"
+    assert body["upload_to_s3"] is False
+    assert body["items"] == [
+        {"description": "Design", "qty": 2, "price": "10.00", "discount_value": "0.00"}
+    ]
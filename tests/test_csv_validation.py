@@ -0,0 +1,99 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import CSVRowError, CSVValidationError
+
+DATA = """id,client_name,client_email,invoice_number,due_date
+1,Acme,billing@acme.example,INV-1,2026-02-01
+2,Globex,billing@globex.example,INV-2,2026-02-01
+"""
+ITEMS = """id,description,qty,price
+1,Design,1,100.00
+2,Build,2,50.00
+"""
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, json={"job_id": "job_1", "status": "queued", "webhook_url": "https://h"}
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def _files(tmp_path: Path, data: str = DATA, items: str = ITEMS) -> tuple[Path, Path]:
+    data_path, items_path = tmp_path / "invoices.csv", tmp_path / "items.csv"
+    data_path.write_text(data)
+    items_path.write_text(items)
+    return data_path, items_path
+
+
+def test_valid_files_are_uploaded(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client()
+    assert client.invoices.validate_csv(*_files(tmp_path)) == []
+    job = client.invoices.create_batch_from_csv(*_files(tmp_path), validate=True)
+    assert job.job_id == "job_1"
+    assert len(server.requests) == 1
+
+
+def test_row_errors_point_at_file_line_and_column(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    data = (
+        DATA + "2,Dup,d@example.test,INV-3,2026-02-01\n3,X,x@example.test,,2026-02-01\n"
+    )
+    items = ITEMS + "1,,1,10\n9,Orphan,1,10\n"
+    errors = make_client().invoices.validate_csv(*_files(tmp_path, data, items))
+
+    assert errors == [
+        CSVRowError("invoices.csv", 4, "id", "duplicate id '2'"),
+        CSVRowError("invoices.csv", 5, "invoice_number", "Field required"),
+        CSVRowError("invoices.csv", 5, "id", "document has no items"),
+        CSVRowError("items.csv", 4, "description", "Field required"),
+        CSVRowError("items.csv", 5, "id", "unknown document id '9'"),
+    ]
+
+
+def test_invalid_files_are_not_uploaded(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    paths = _files(tmp_path, items=ITEMS + "1,Extra,0,10\n")
+    with pytest.raises(CSVValidationError) as info:
+        make_client().invoices.create_batch_from_csv(*paths, validate=True)
+    assert [(e.line, e.column) for e in info.value.errors] == [(4, "qty")]
+    assert not server.requests
+
+
+def test_max_errors_caps_the_report(tmp_path: Path, make_client: ClientFactory) -> None:
+    items = ITEMS + "".join("1,Bad,0,10\n" for _ in range(10))
+    errors = make_client().invoices.validate_csv(
+        *_files(tmp_path, items=items), max_errors=3
+    )
+    assert len(errors) == 3
+
+
+def test_async_validation_runs_before_upload(
+    tmp_path: Path, server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            with pytest.raises(CSVValidationError):
+                await client.invoices.create_batch_from_csv(
+                    *_files(tmp_path, items="id,description,qty,price\n1,X,1\n"),
+                    validate=True,
+                )
+            await client.invoices.create_batch_from_csv(
+                *_files(tmp_path), validate=True
+            )
+
+    asyncio.run(main())
+    assert len(server.requests) == 1
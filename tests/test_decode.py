@@ -0,0 +1,59 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+from conftest import ClientFactory, MockServer
+from pydantic import ValidationError
+
+from billkit import JSONDecoder
+from billkit.models.invoices import InvoiceDocumentResponse
+
+DOCUMENT = {
+    "file_id": "file_0",
+    "created_at": "2026-01-01",
+    "client_name": "Acme",
+    "invoice_number": "INV-0",
+    "due_date": "2026-02-01",
+    "status": "paid",
+}
+
+
+class _CountingLoads:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, content: bytes) -> Any:
+        self.calls += 1
+        return json.loads(content)
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=[DOCUMENT])
+
+
+def test_typed_responses_are_validated_straight_from_json(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _respond
+    loads = _CountingLoads()
+    client = make_client(decoder=JSONDecoder(loads=loads))
+    [document] = client.invoices.list()
+    assert isinstance(document, InvoiceDocumentResponse)
+    assert document.invoice_number == "INV-0"
+    assert loads.calls == 0
+
+
+def test_untyped_bodies_use_the_configured_loads() -> None:
+    loads = _CountingLoads()
+    decoder = JSONDecoder(loads=loads)
+    assert decoder.decode(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    assert loads.calls == 1
+
+
+def test_decode_errors() -> None:
+    decoder = JSONDecoder()
+    with pytest.raises(ValueError):
+        decoder.decode(b"not json")
+    with pytest.raises(ValidationError):
+        decoder.decode(b'[{"file_id": "f"}]', list[InvoiceDocumentResponse])
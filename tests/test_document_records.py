@@ -0,0 +1,77 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import DocumentRecord
+from billkit.models.invoices import InvoiceDocumentResponse
+
+
+def _document(i: int) -> dict[str, Any]:
+    return {
+        "file_id": f"file_{i}",
+        "created_at": "2026-01-01",
+        "client_name": "Acme",
+        "invoice_number": f"INV-{i}",
+        "due_date": "2026-02-01",
+        "status": "paid",
+        "total": "12.50",
+    }
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    documents = [_document(i) for i in range(offset, min(5, offset + limit))]
+    if offset == 0:
+        # Records skip validation, so an incomplete document still lists.
+        del documents[0]["invoice_number"]
+    return httpx.Response(200, json=documents)
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def test_list_records_wraps_documents_without_validating(
+    make_client: ClientFactory,
+) -> None:
+    client = make_client()
+    first, second = client.invoices.list_records(limit=2)
+
+    assert isinstance(first, DocumentRecord)
+    assert (first.file_id, first.client_name, first.status) == (
+        "file_0",
+        "Acme",
+        "paid",
+    )
+    assert first["total"] == "12.50"
+    assert first.get("invoice_number") is None
+    assert not hasattr(first, "__dict__")
+    with pytest.raises(AttributeError):
+        first.file_id = "x"  # type: ignore[misc]
+
+    model = second.to_model()
+    assert isinstance(model, InvoiceDocumentResponse)
+    assert model.invoice_number == "INV-1"
+
+
+def test_iter_all_records_pages_through_everything(
+    make_client: ClientFactory,
+) -> None:
+    client = make_client()
+    records = client.invoices.iter_all_records(page_size=2)
+    assert [r.file_id for r in records] == [f"file_{i}" for i in range(5)]
+
+
+def test_async_iter_all_records(make_async_client: AsyncClientFactory) -> None:
+    async def main() -> list[str]:
+        async with make_async_client() as client:
+            return [
+                r.file_id async for r in client.invoices.iter_all_records(page_size=2)
+            ]
+
+    assert asyncio.run(main()) == [f"file_{i}" for i in range(5)]
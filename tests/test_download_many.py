@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import BulkResult
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    file_id = request.url.params["file_id"]
+    if file_id == "missing":
+        return httpx.Response(404, json={"detail": "Not found"})
+    return httpx.Response(
+        200,
+        content=b"%PDF " + file_id.encode(),
+        headers={"Content-Type": "application/pdf"},
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    """Serves `%PDF <file_id>` slowly enough for downloads to overlap."""
+    return MockServer(_respond, latency=0.02)
+
+
+FILE_IDS = [f"f{i}" for i in range(6)] + ["missing", "../escape"]
+
+
+def _check(results: list[BulkResult[str, Path]], dest: Path) -> None:
+    by_id = {r.key: r for r in results}
+    assert len(results) == len(FILE_IDS)
+    for file_id in FILE_IDS[:6]:
+        assert by_id[file_id].value == dest / f"{file_id}.pdf"
+        assert (dest / f"{file_id}.pdf").read_bytes() == b"%PDF " + file_id.encode()
+    assert not by_id["missing"].ok
+    assert isinstance(by_id["../escape"].error, ValueError)
+    assert sorted(p.name for p in dest.iterdir()) == [f"f{i}.pdf" for i in range(6)]
+
+
+def test_download_many_streams_files_with_bounded_concurrency(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client(coalesce=False)
+    dest = tmp_path / "pdfs"
+    results = client.invoices.download_many(FILE_IDS, dest, concurrency=3)
+
+    _check(results, dest)
+    assert 1 < server.peak_in_flight <= 3
+
+
+def test_async_download_many(
+    tmp_path: Path, server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            results = await client.quotes.download_many(
+                FILE_IDS, tmp_path, concurrency=2
+            )
+        _check(results, tmp_path)
+
+    asyncio.run(main())
+    assert server.peak_in_flight == 2
+
+
+def test_download_many_fetches_repeated_ids_once(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client(coalesce=False)
+    results = client.invoices.download_many(["a", "a", "b", "a"], tmp_path)
+
+    assert sorted(r.key for r in results) == ["a", "b"]
+    assert all(r.ok for r in results)
+    assert sorted(r.url.params["file_id"] for r in server.requests) == ["a", "b"]
+
+
+def test_concurrent_streams_to_one_path_do_not_clobber(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    def slow_body() -> Iterator[bytes]:
+        for chunk in (b"%PDF ", b"f1"):
+            time.sleep(0.02)
+            yield chunk
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=slow_body(), headers={"Content-Type": "application/pdf"}
+        )
+
+    server.respond = respond
+    client = make_client(coalesce=False)
+    dest = tmp_path / "same.pdf"
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(client.invoices.download_pdf, "f1", stream_to=dest)
+            for _ in range(3)
+        ]
+    assert all(f.result().bytes_written == len(b"%PDF f1") for f in futures)
+    assert dest.read_bytes() == b"%PDF f1"
+    assert [p.name for p in tmp_path.iterdir()] == ["same.pdf"]
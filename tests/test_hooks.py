@@ -0,0 +1,77 @@
+import logging
+
+import pytest
+from conftest import ClientFactory
+
+from billkit import RequestMetrics
+
+
+def test_hooks_receive_metrics_per_attempt(make_client: ClientFactory) -> None:
+    seen: list[RequestMetrics] = []
+    client = make_client(hooks=[seen.append])
+    client.invoices.list()
+
+    [metrics] = seen
+    assert (metrics.method, metrics.endpoint, metrics.status_code) == (
+        "GET",
+        "invoices",
+        200,
+    )
+    assert metrics.attempt == 0
+    assert metrics.error is None
+
+
+def test_failing_hook_is_logged_and_does_not_fail_the_call(
+    caplog: pytest.LogCaptureFixture, make_client: ClientFactory
+) -> None:
+    seen: list[RequestMetrics] = []
+
+    def broken(metrics: RequestMetrics) -> None:
+        raise RuntimeError("exporter down")
+
+    client = make_client(hooks=[broken, seen.append])
+    with caplog.at_level(logging.ERROR, logger="billkit"):
+        assert list(client.invoices.list()) == []
+
+    assert len(seen) == 1
+    assert "exporter down" in caplog.text
+
+
+def test_opentelemetry_hook_records_spans_and_metrics(
+    make_client: ClientFactory,
+) -> None:
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from billkit import OpenTelemetryHook
+
+    spans = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(spans))
+    reader = InMemoryMetricReader()
+    hook = OpenTelemetryHook(
+        tracer_provider=tracer_provider,
+        meter_provider=MeterProvider(metric_readers=[reader]),
+    )
+    client = make_client(hooks=[hook])
+    client.invoices.list()
+
+    [span] = spans.get_finished_spans()
+    assert span.name == "GET invoices"
+    assert span.attributes is not None
+    assert span.attributes["http.response.status_code"] == 200
+    data = reader.get_metrics_data()
+    assert data is not None
+    names = {
+        metric.name
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+    }
+    assert "http.client.request.duration" in names
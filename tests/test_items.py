@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from billkit import Totals, build_items, compute_totals
+from billkit.models.invoices import InvoiceItem
+
+
+def test_build_items_from_columns() -> None:
+    items = build_items(
+        InvoiceItem,
+        description=["Design", "Build"],
+        qty=[1, 2],
+        price=("100.00", 50),
+        discount_type=[None, "percentage"],
+        discount_value=[None, 10],
+    )
+    assert [item.price for item in items] == [Decimal("100.00"), Decimal(50)]
+    assert items[1].discount_value == Decimal(10)
+    assert "discount_type" not in items[0].model_fields_set
+
+
+def test_build_items_reports_rows_in_one_error() -> None:
+    with pytest.raises(ValidationError) as info:
+        build_items(InvoiceItem, description=["", "Ok"], qty=[1, 0], price=[1, 1])
+    assert {err["loc"][0] for err in info.value.errors()} == {0, 1}
+
+
+def test_build_items_rejects_ragged_columns() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        build_items(InvoiceItem, description=["a"], qty=[1, 2], price=[1])
+
+
+def test_compute_totals() -> None:
+    totals = compute_totals(
+        qty=[2, 1],
+        price=["50.00", 0.1],
+        tax=[20, None],
+        discount_type=["percentage", "fixed"],
+        discount_value=[10, 1],
+        document_discount_type="fixed",
+        document_discount_value=9,
+    )
+    # Line 1: 100 - 10% = 90; line 2: 0.10 - fixed 1 capped at 0.10 = 0.
+    # Document discount 9 of 90 leaves 90% of the taxable 90 at 20%.
+    assert totals == Totals(
+        subtotal=Decimal("100.10"),
+        discount=Decimal("19.10"),
+        tax=Decimal("16.20"),
+        total=Decimal("97.20"),
+    )
+
+
+@pytest.mark.parametrize(("kind", "value"), [("percentage", 150), ("fixed", -5)])
+def test_compute_totals_rejects_discounts_the_item_models_reject(
+    kind: str, value: int
+) -> None:
+    with pytest.raises(ValidationError):
+        build_items(
+            InvoiceItem,
+            description=["x"],
+            qty=[1],
+            price=[10],
+            discount_type=[kind],
+            discount_value=[value],
+        )
+    with pytest.raises(ValueError, match="[Dd]iscount"):
+        compute_totals(
+            qty=[1], price=[10], discount_type=[kind], discount_value=[value]
+        )
+
+
+def test_compute_totals_rejects_document_percentage_over_100() -> None:
+    with pytest.raises(ValueError, match="100 or less"):
+        compute_totals(
+            qty=[1],
+            price=[10],
+            document_discount_type="percentage",
+            document_discount_value="100.5",
+        )
@@ -0,0 +1,63 @@
+import subprocess
+import sys
+
+import httpx
+import pytest
+from conftest import ClientFactory, MockServer
+
+import billkit
+from billkit import BillKitException, RetryPolicy
+
+
+def _modules_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{code}\nprint(*sorted(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {name for name in out.split() if name.startswith("billkit")}
+
+
+def test_import_billkit_loads_no_submodules() -> None:
+    assert _modules_after("import billkit") == {"billkit"}
+
+
+def test_resource_modules_load_on_first_access() -> None:
+    loaded = _modules_after(
+        "from billkit import BillKitClient\n"
+        "client = BillKitClient(api_key='sk')\n"
+        "client.invoices"
+    )
+    assert "billkit.api.invoices" in loaded
+    assert "billkit.api.quotes" not in loaded
+    assert "billkit.models.quotes" not in loaded
+
+
+def test_every_export_resolves() -> None:
+    for name in billkit.__all__:
+        assert getattr(billkit, name) is not None
+    assert set(billkit.__all__) <= set(dir(billkit))
+    with pytest.raises(AttributeError):
+        billkit.NotAThing  # type: ignore[attr-defined]  # noqa: B018
+
+
+def _unavailable(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(503, json={"detail": "Unavailable"})
+
+
+def test_with_options_binds_fresh_resource_groups(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _unavailable
+    client = make_client(retry=RetryPolicy(max_attempts=2, backoff_base=0))
+    client.invoices  # noqa: B018
+    no_retry = client.with_options(retry=RetryPolicy.disabled())
+    assert no_retry.invoices is not client.invoices
+
+    with pytest.raises(BillKitException):
+        no_retry.invoices.list()
+    assert len(server.requests) == 1
+    with pytest.raises(BillKitException):
+        client.invoices.list()
+    assert len(server.requests) == 3
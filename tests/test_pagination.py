@@ -0,0 +1,77 @@
+import asyncio
+from itertools import islice
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer, Responder
+
+
+def _document(i: int) -> dict[str, str]:
+    return {
+        "file_id": f"file_{i}",
+        "created_at": "2026-01-01",
+        "client_name": "Acme",
+        "invoice_number": f"INV-{i}",
+        "due_date": "2026-02-01",
+        "status": "paid",
+    }
+
+
+def _documents(total: int) -> Responder:
+    """Pages through `total` invoice documents by limit and offset."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        end = min(total, offset + limit)
+        return httpx.Response(200, json=[_document(i) for i in range(offset, end)])
+
+    return respond
+
+
+def _offsets(server: MockServer) -> list[int]:
+    return [int(request.url.params["offset"]) for request in server.requests]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_all_walks_every_page(
+    prefetch: bool, server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _documents(7)
+    docs = make_client().invoices.iter_all(page_size=3, prefetch=prefetch)
+    assert [d.file_id for d in docs] == [f"file_{i}" for i in range(7)]
+    assert sorted(_offsets(server)) == [0, 3, 6]
+
+
+def test_iter_all_stops_after_an_exact_final_page(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _documents(6)
+    assert len(list(make_client().invoices.iter_all(page_size=3))) == 6
+    assert sorted(_offsets(server)) == [0, 3, 6]
+
+
+def test_iter_all_is_lazy(server: MockServer, make_client: ClientFactory) -> None:
+    server.respond = _documents(100)
+    docs = make_client().invoices.iter_all(page_size=10, prefetch=False)
+    assert _offsets(server) == []
+    assert len(list(islice(docs, 12))) == 12
+    assert _offsets(server) == [0, 10]
+
+
+def test_iter_all_rejects_empty_pages(make_client: ClientFactory) -> None:
+    with pytest.raises(ValueError):
+        list(make_client().invoices.iter_all(page_size=0))
+
+
+def test_async_iter_all_walks_every_page(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    server.respond = _documents(7)
+
+    async def main() -> list[str]:
+        async with make_async_client() as client:
+            return [d.file_id async for d in client.invoices.iter_all(page_size=3)]
+
+    assert asyncio.run(main()) == [f"file_{i}" for i in range(7)]
+    assert sorted(_offsets(server)) == [0, 3, 6]
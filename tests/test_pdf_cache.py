@@ -0,0 +1,124 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+from typing_extensions import Buffer, override
+
+from billkit import BillKitException, PDFCache
+
+
+@pytest.fixture
+def server() -> MockServer:
+    """Serves `%PDF <file_id>` until the document is deleted."""
+    server = MockServer()
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        file_id = request.url.params.get("file_id", "")
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"deleted": True, "fileId": file_id})
+        if request.method == "PATCH":
+            return httpx.Response(200, json={"fileId": "f1", "status": "paid"})
+        deleted = any(
+            r.method == "DELETE" and r.url.params.get("file_id") == file_id
+            for r in server.requests
+        )
+        if deleted:
+            return httpx.Response(404, json={"detail": "Not found"})
+        return httpx.Response(
+            200,
+            content=b"%PDF " + file_id.encode(),
+            headers={"Content-Type": "application/pdf", "X-Billkit-File-Id": file_id},
+        )
+
+    server.respond = respond
+    return server
+
+
+def _downloads(server: MockServer) -> int:
+    return sum(r.method == "GET" for r in server.requests)
+
+
+def test_downloads_are_served_from_the_cache(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client(pdf_cache=PDFCache(tmp_path))
+    assert client.invoices.download_pdf("f1").read() == b"%PDF f1"
+    assert client.invoices.download_pdf("f1").read() == b"%PDF f1"
+    assert _downloads(server) == 1
+
+
+def test_delete_discards_the_cached_pdf(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    client = make_client(pdf_cache=PDFCache(tmp_path))
+    client.invoices.download_pdf("f1")
+    client.invoices.delete("f1")
+
+    assert client.pdf_cache is not None
+    assert "f1" not in client.pdf_cache
+    with pytest.raises(BillKitException, match="404"):
+        client.invoices.download_pdf("f1")
+
+
+def test_status_update_discards_the_cached_pdf(
+    tmp_path: Path, server: MockServer, make_client: ClientFactory
+) -> None:
+    client = make_client(pdf_cache=PDFCache(tmp_path))
+    client.invoices.download_pdf("f1")
+    client.invoices.update_status("f1", invoice_status="paid")
+    client.invoices.download_pdf("f1")
+    assert _downloads(server) == 2
+
+
+def test_async_delete_discards_the_cached_pdf(
+    tmp_path: Path, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> None:
+        async with make_async_client(pdf_cache=PDFCache(tmp_path)) as client:
+            await client.quotes.download_pdf("q1")
+            await client.quotes.delete("q1")
+            with pytest.raises(BillKitException, match="404"):
+                await client.quotes.download_pdf("q1")
+
+    asyncio.run(main())
+
+
+class _OffLoopPDFCache(PDFCache):
+    """Counts cache reads and writes made on an event loop thread."""
+
+    calls_on_loop = 0
+
+    def _check(self) -> None:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.calls_on_loop += 1
+
+    @override
+    def path(self, file_id: str) -> str | None:
+        self._check()
+        return super().path(file_id)
+
+    @override
+    def put(self, file_id: str, data: Buffer) -> None:
+        self._check()
+        super().put(file_id, data)
+
+
+def test_async_client_uses_the_cache_off_the_event_loop(
+    tmp_path: Path, server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    pdf_cache = _OffLoopPDFCache(tmp_path)
+
+    async def main() -> None:
+        async with make_async_client(pdf_cache=pdf_cache) as client:
+            for _ in range(2):
+                pdf = await client.invoices.download_pdf("f1")
+                assert pdf.read() == b"%PDF f1"
+
+    asyncio.run(main())
+    assert _downloads(server) == 1
+    assert pdf_cache.calls_on_loop == 0
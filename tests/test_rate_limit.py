@@ -0,0 +1,60 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit import RateLimiter, TokenBucket
+
+
+def test_threads_share_one_bucket(make_client: ClientFactory) -> None:
+    limiter = RateLimiter({"invoices": TokenBucket(50, capacity=1)})
+    client = make_client(rate_limiter=limiter, coalesce=False)
+
+    def list_page(offset: int) -> None:
+        client.invoices.list(offset=offset)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(list_page, range(6)))
+    # The first request uses the burst; the other five wait 1/50 s each.
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_unmatched_endpoints_are_not_limited(make_client: ClientFactory) -> None:
+    client = make_client(rate_limiter=RateLimiter({"email/send": 0.1}), coalesce=False)
+    start = time.monotonic()
+    for _ in range(5):
+        client.invoices.list()
+    assert time.monotonic() - start < 1
+
+
+def test_rate_limit_headers_pause_the_bucket(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[],
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.2"},
+        )
+
+    server.respond = respond
+    client = make_client(rate_limiter=RateLimiter({}, default=1000))
+    client.invoices.list()
+    start = time.monotonic()
+    client.quotes.list()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_async_tasks_are_paced(make_async_client: AsyncClientFactory) -> None:
+    limiter = RateLimiter({"invoices": TokenBucket(50, capacity=1)})
+
+    async def main() -> float:
+        async with make_async_client(rate_limiter=limiter) as client:
+            start = time.monotonic()
+            await asyncio.gather(*(client.invoices.list(offset=i) for i in range(6)))
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 5 / 50 * 0.9
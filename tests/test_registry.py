@@ -0,0 +1,57 @@
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from billkit import TransportConfig, close_shared_clients, shared_client
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry() -> Iterator[None]:
+    close_shared_clients()
+    yield
+    close_shared_clients()
+
+
+def test_same_configuration_shares_one_client() -> None:
+    client = shared_client("sk_a", "https://api.test/v1")
+    assert shared_client("sk_a", "https://api.test/v1/") is client
+    assert shared_client("sk_b", "https://api.test/v1") is not client
+    assert (
+        shared_client(
+            "sk_a", "https://api.test/v1", transport_config=TransportConfig(http2=False)
+        )
+        is client
+    )
+    assert (
+        shared_client(
+            "sk_a",
+            "https://api.test/v1",
+            transport_config=TransportConfig(read_timeout=1),
+        )
+        is not client
+    )
+
+
+def test_closed_clients_are_replaced() -> None:
+    client = shared_client("sk_a", "https://api.test/v1")
+    client.close()
+    assert shared_client("sk_a", "https://api.test/v1") is not client
+
+    replacement = shared_client("sk_a", "https://api.test/v1")
+    close_shared_clients()
+    assert replacement._client.is_closed  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_its_own_pool() -> None:
+    client = shared_client("sk_a", "https://api.test/v1")
+    parent_pool = client._client  # pyright: ignore[reportPrivateUsage]
+    pid = os.fork()
+    if pid == 0:
+        child = shared_client("sk_a", "https://api.test/v1")
+        fresh = child is client and child._client is not parent_pool  # pyright: ignore[reportPrivateUsage]
+        os._exit(0 if fresh and not parent_pool.is_closed else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert client._client is parent_pool  # pyright: ignore[reportPrivateUsage]
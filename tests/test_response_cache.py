@@ -0,0 +1,69 @@
+import httpx
+import pytest
+from conftest import ClientFactory, MockServer
+
+from billkit import BillKitClient, ResponseCache
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    if request.method == "GET":
+        return httpx.Response(200, json=[])
+    if request.url.path.endswith("/email/send"):
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "message_id": "m1",
+                "status_code": 202,
+                "detail": None,
+            },
+        )
+    return httpx.Response(200, json={"deleted": True, "fileId": "f1"})
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+@pytest.fixture
+def client(make_client: ClientFactory) -> BillKitClient:
+    return make_client(cache=ResponseCache({"invoices": 60}))
+
+
+def _lists(server: MockServer) -> int:
+    return sum(request.method == "GET" for request in server.requests)
+
+
+def test_gets_are_cached(server: MockServer, client: BillKitClient) -> None:
+    client.invoices.list()
+    client.invoices.list()
+    assert _lists(server) == 1
+    assert client.cache is not None
+    assert client.cache.stats().hits == 1
+
+
+def test_sending_email_keeps_cached_entries(
+    server: MockServer, client: BillKitClient
+) -> None:
+    client.invoices.list()
+    client.invoices.send_email(to=["a@example.test"], subject="Hi", file_ids=["f1"])
+    client.invoices.list()
+    assert _lists(server) == 1
+
+
+def test_mutation_drops_its_family(server: MockServer, client: BillKitClient) -> None:
+    client.invoices.list()
+    client.invoices.delete("f1")
+    client.invoices.list()
+    assert _lists(server) == 2
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "kept"), [("email/send", True), ("something/new", False)]
+)
+def test_invalidate_after_by_family(endpoint: str, kept: bool) -> None:
+    cache = ResponseCache({"invoices": 60})
+    cache.set("invoices", None, [])
+    cache.invalidate_after("POST", endpoint)
+    assert (cache.stats().size == 1) is kept
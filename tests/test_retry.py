@@ -0,0 +1,140 @@
+import httpx
+import pytest
+from conftest import ClientFactory, MockServer, Responder
+
+from billkit import BillKitClient, BillKitException, RetryPolicy
+
+EMAIL_SENT = {"success": True, "message_id": "m1", "status_code": 202, "detail": None}
+
+
+def _scripted(
+    *outcomes: int | type[httpx.TransportError], retry_after: str = ""
+) -> Responder:
+    """Answers each request with the next scripted outcome, then with 200.
+
+    An outcome is a status code, or an exception class raised as a transport
+    error. Error responses carry the given Retry-After header.
+    """
+    pending = list(outcomes)
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        outcome = pending.pop(0) if pending else 200
+        if not isinstance(outcome, int):
+            raise outcome("Connection refused", request=request)
+        if outcome == 200:
+            if request.method == "POST":
+                return httpx.Response(200, json=EMAIL_SENT)
+            return httpx.Response(200, json=[])
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        return httpx.Response(outcome, json={"detail": "Unavailable"}, headers=headers)
+
+    return respond
+
+
+@pytest.fixture
+def delays(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Seconds the client slept between attempts, without actually sleeping."""
+    slept: list[float] = []
+    monkeypatch.setattr("billkit.client.time.sleep", slept.append)
+    return slept
+
+
+def _send_email(client: BillKitClient) -> object:
+    return client.invoices.send_email(to=["a@example.com"], subject="Hi", body="")
+
+
+def test_gateway_errors_are_retried_with_exponential_backoff(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(502, 503)
+    client = make_client(retry=RetryPolicy(backoff_base=0.5, jitter=False))
+    assert list(client.invoices.list()) == []
+    assert len(server.requests) == 3
+    assert delays == [0.5, 1.0]
+
+
+def test_exhausted_retries_report_the_attempt_count(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(503, 503, 503, 503)
+    with pytest.raises(BillKitException) as info:
+        make_client(retry=RetryPolicy(max_attempts=3)).invoices.list()
+    assert info.value.status_code == 503
+    assert info.value.retries == 2
+    assert len(server.requests) == 3
+    assert len(delays) == 2
+
+
+def test_client_errors_are_not_retried(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(400)
+    with pytest.raises(BillKitException) as info:
+        make_client().invoices.list()
+    assert info.value.retries == 0
+    assert len(server.requests) == 1
+
+
+def test_post_without_idempotency_key_is_not_retried(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(503)
+    with pytest.raises(BillKitException):
+        _send_email(make_client())
+    assert len(server.requests) == 1
+    assert "Idempotency-Key" not in server.requests[0].headers
+
+
+def test_idempotency_key_is_generated_once_and_reused(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(503, 502)
+    _send_email(make_client(retry=RetryPolicy(idempotency_keys=True)))
+    keys = {request.headers.get("Idempotency-Key") for request in server.requests}
+    assert len(server.requests) == 3
+    assert len(keys) == 1
+    assert None not in keys
+
+
+@pytest.mark.parametrize("error", [httpx.ConnectError, httpx.ConnectTimeout])
+def test_connect_errors_are_retried_even_for_post(
+    delays: list[float],
+    error: type[httpx.TransportError],
+    server: MockServer,
+    make_client: ClientFactory,
+) -> None:
+    server.respond = _scripted(error)
+    _send_email(make_client())
+    assert len(server.requests) == 2
+    assert len(delays) == 1
+
+
+def test_with_options_can_disable_retries(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(503, 503)
+    client = make_client().with_options(retry=RetryPolicy.disabled())
+    with pytest.raises(BillKitException) as info:
+        client.invoices.list()
+    assert info.value.retries == 0
+    assert len(server.requests) == 1
+    assert delays == []
+
+
+def test_short_retry_after_is_honoured(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(429, retry_after="2")
+    assert list(make_client().invoices.list()) == []
+    assert len(server.requests) == 2
+    assert delays == [2.0]
+
+
+def test_retry_after_beyond_the_cap_gives_up(
+    delays: list[float], server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _scripted(429, retry_after="120")
+    with pytest.raises(BillKitException) as info:
+        make_client().invoices.list()
+    assert info.value.retries == 0
+    assert len(server.requests) == 1
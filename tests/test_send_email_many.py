@@ -0,0 +1,63 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+SENT = {"success": True, "message_id": "m1", "status_code": 202, "detail": None}
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    if "bounce" in json.loads(request.content)["to"]:
+        return httpx.Response(422, json={"detail": "Invalid recipient"})
+    return httpx.Response(200, json=SENT)
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def _sent(server: MockServer) -> list[dict[str, Any]]:
+    bodies = [json.loads(request.content) for request in server.requests]
+    return [body for body in bodies if "bounce" not in body["to"]]
+
+
+JOBS = [
+    {"to": ["a@example.test"], "subject": "Due", "file_ids": ["f1"]},
+    {"to": ["a@example.test"], "subject": "Due", "file_ids": ["f2"]},
+    {"to": ["bounce"], "subject": "Due", "file_ids": ["f3"]},
+]
+
+
+def test_send_email_many_sends_each_job_by_default(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    results = list(make_client().invoices.send_email_many(JOBS))
+
+    assert sorted(e["file_ids"] for e in _sent(server)) == [["f1"], ["f2"]]
+    [failed] = [r for r in results if not r.ok]
+    assert failed.key["to"] == ["bounce"]
+
+
+def test_send_email_many_can_group_attachments(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    send_email_many = make_client().invoices.send_email_many
+    results = list(send_email_many(JOBS, group_attachments=True))
+
+    assert [e["file_ids"] for e in _sent(server)] == [["f1", "f2"]]
+    assert sum(r.ok for r in results) == 1
+
+
+def test_async_send_email_many_sends_each_job_by_default(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> int:
+        async with make_async_client() as client:
+            return sum([r.ok async for r in client.quotes.send_email_many(JOBS)])
+
+    assert asyncio.run(main()) == 2
+    assert len(_sent(server)) == 2
@@ -0,0 +1,178 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from io import BytesIO
+from pathlib import Path
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer, Responder
+from typing_extensions import Buffer, override
+
+from billkit import BillKitException, PDFResponse, RetryPolicy, StreamedPDF
+
+PDF = b"%PDF-1.7 " + bytes(range(256)) * 1024
+HEADERS = {"Content-Type": "application/pdf", "X-Billkit-File-Id": "f1"}
+# More than one 64 KiB write, so some of it reaches stream_to before the reset.
+PARTIAL = PDF[:100_000]
+
+
+class _BrokenStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Sends part of the body, then drops the connection."""
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield PARTIAL
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield PARTIAL
+        raise httpx.ReadError("connection reset")
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    file_id = request.url.params["file_id"]
+    if file_id == "missing":
+        return httpx.Response(404, json={"detail": "Not found"})
+    if file_id == "broken":
+        return httpx.Response(200, stream=_BrokenStream(), headers=HEADERS)
+    return httpx.Response(200, content=PDF, headers=HEADERS)
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def test_download_streams_to_a_path(tmp_path: Path, make_client: ClientFactory) -> None:
+    dest = tmp_path / "f1.pdf"
+    result = make_client().invoices.download_pdf("f1", stream_to=dest)
+    assert result == StreamedPDF(file_id="f1", bytes_written=len(PDF))
+    assert dest.read_bytes() == PDF
+    assert list(tmp_path.iterdir()) == [dest]
+
+
+def test_download_streams_to_a_file_object(make_client: ClientFactory) -> None:
+    buffer = BytesIO()
+    buffer.write(b"header:")
+    make_client().quotes.download_pdf("f1", stream_to=buffer)
+    assert buffer.getvalue() == b"header:" + PDF
+
+
+@pytest.mark.parametrize("file_id", ["missing", "broken"])
+def test_failed_download_leaves_no_partial_file(
+    tmp_path: Path, file_id: str, make_client: ClientFactory
+) -> None:
+    client = make_client(retry=RetryPolicy.disabled())
+    dest = tmp_path / "out.pdf"
+    with pytest.raises(BillKitException):
+        client.invoices.download_pdf(file_id, stream_to=dest)
+    assert list(tmp_path.iterdir()) == []
+
+    buffer = BytesIO()
+    buffer.write(b"header:")
+    with pytest.raises(BillKitException):
+        client.invoices.download_pdf(file_id, stream_to=buffer)
+    assert buffer.getvalue() == b"header:"
+
+
+def test_buffered_download_can_be_saved(
+    tmp_path: Path, make_client: ClientFactory
+) -> None:
+    pdf = make_client().invoices.download_pdf("f1")
+    assert isinstance(pdf, PDFResponse)
+    assert pdf.file_id == "f1"
+    pdf.save(tmp_path / "saved.pdf")
+    assert (tmp_path / "saved.pdf").read_bytes() == PDF
+
+
+def test_async_download_streams_to_a_path(
+    tmp_path: Path, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> StreamedPDF:
+        async with make_async_client(retry=RetryPolicy.disabled()) as client:
+            with pytest.raises(BillKitException):
+                await client.invoices.download_pdf(
+                    "broken", stream_to=tmp_path / "broken.pdf"
+                )
+            return await client.invoices.download_pdf(
+                "f1", stream_to=tmp_path / "f1.pdf"
+            )
+
+    assert asyncio.run(main()).bytes_written == len(PDF)
+    assert [p.name for p in tmp_path.iterdir()] == ["f1.pdf"]
+    assert (tmp_path / "f1.pdf").read_bytes() == PDF
+
+
+class _Pipe(BytesIO):
+    """A write-only target that cannot seek back, like a socket or stdout."""
+
+    @override
+    def seekable(self) -> bool:
+        return False
+
+
+def _flaky(server: MockServer) -> Responder:
+    """Drops the connection mid-body on the first request only."""
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if len(server.requests) == 1:
+            return httpx.Response(200, stream=_BrokenStream(), headers=HEADERS)
+        return httpx.Response(200, content=PDF, headers=HEADERS)
+
+    return respond
+
+
+def test_retried_download_rewinds_a_seekable_file_object(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _flaky(server)
+    buffer = BytesIO()
+    make_client(retry=RetryPolicy(backoff_base=0)).invoices.download_pdf(
+        "f1", stream_to=buffer
+    )
+    assert len(server.requests) == 2
+    assert buffer.getvalue() == PDF
+
+
+def test_partial_download_to_a_non_seekable_target_is_not_retried(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    server.respond = _flaky(server)
+    client = make_client(retry=RetryPolicy(backoff_base=0))
+    pipe = _Pipe()
+    with pytest.raises(BillKitException, match="non-seekable") as info:
+        client.invoices.download_pdf("f1", stream_to=pipe)
+    assert info.value.retries == 0
+    assert len(server.requests) == 1
+    assert pipe.getvalue() == PARTIAL[: 64 * 1024]
+
+
+class _OffLoopBuffer(BytesIO):
+    """Records whether each write ran on an event loop thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes_on_loop = 0
+
+    @override
+    def write(self, buffer: Buffer, /) -> int:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self.writes_on_loop += 1
+        return super().write(buffer)
+
+
+def test_async_download_writes_off_the_event_loop(
+    make_async_client: AsyncClientFactory,
+) -> None:
+    buffer = _OffLoopBuffer()
+
+    async def main() -> None:
+        async with make_async_client() as client:
+            await client.invoices.download_pdf("f1", stream_to=buffer)
+
+    asyncio.run(main())
+    assert buffer.getvalue() == PDF
+    assert buffer.writes_on_loop == 0
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+from billkit.api._batch import ChunkInfo, JsonChunk
+
+
+def _payload(i: int) -> dict[str, object]:
+    return {
+        "client_name": "Acme",
+        "client_email": "billing@acme.example",
+        "invoice_number": f"INV-{i}",
+        "due_date": "2026-02-01",
+        "items": [{"description": "Work", "qty": 1, "price": "10.00"}],
+    }
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    """Accepts every chunk except the one containing INV-2."""
+    numbers = [i["invoice_number"] for i in json.loads(request.content)["invoices"]]
+    if "INV-2" in numbers:
+        return httpx.Response(400, json={"detail": "Rejected"})
+    return httpx.Response(
+        200,
+        json={
+            "job_id": f"job_{numbers[0]}",
+            "status": "queued",
+            "webhook_url": "https://example.test/hook",
+        },
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def test_submit_batch_keeps_bodies_only_for_failed_chunks(
+    make_client: ClientFactory,
+) -> None:
+    client = make_client()
+    payloads = [_payload(i) for i in range(5)] + [{"client_name": "no items"}]
+    group = client.invoices.submit_batch(payloads, chunk_size=2, concurrency=2)
+
+    assert [chunk.key.index for chunk in group.chunks] == [0, 1, 2]
+    assert group.job_ids == ["job_INV-0", "job_INV-4"]
+    assert group.submitted_count == 3
+    assert [position for position, _ in group.invalid] == [5]
+    assert all(type(chunk.key) is ChunkInfo for chunk in group.chunks if chunk.ok)
+
+    [failed] = group.failed
+    assert isinstance(failed.key, JsonChunk)
+    assert failed.key.index == 1
+    assert json.loads(failed.key.body)["invoices"][0]["invoice_number"] == "INV-2"
+
+
+def test_async_submit_batch_releases_accepted_chunk_bodies(
+    make_async_client: AsyncClientFactory,
+) -> None:
+    async def main() -> None:
+        async with make_async_client() as client:
+            group = await client.invoices.submit_batch(
+                [_payload(i) for i in (0, 1, 3)], chunk_size=1
+            )
+            assert group.submitted_count == 3
+            assert not group.failed
+            assert all(type(chunk.key) is ChunkInfo for chunk in group.chunks)
+
+    asyncio.run(main())
@@ -0,0 +1,35 @@
+import httpx
+import pytest
+from conftest import ClientFactory, MockServer
+
+from billkit import TransportConfig
+
+
+def test_from_env_overrides_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BILLKIT_MAX_CONNECTIONS", "10")
+    monkeypatch.setenv("BILLKIT_KEEPALIVE_EXPIRY", "none")
+    monkeypatch.setenv("BILLKIT_READ_TIMEOUT", "2.5")
+    monkeypatch.setenv("BILLKIT_HTTP2", "yes")
+    config = TransportConfig.from_env()
+
+    assert config.max_connections == 10
+    assert config.max_keepalive_connections == 20
+    assert config.keepalive_expiry is None
+    assert config.read_timeout == 2.5
+    assert config.http2
+    assert config.limits == httpx.Limits(
+        max_connections=10, max_keepalive_connections=20, keepalive_expiry=None
+    )
+
+
+def test_requests_carry_the_configured_timeouts(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    config = TransportConfig(connect_timeout=1.0, read_timeout=None, pool_timeout=3.0)
+    client = make_client(transport_config=config)
+    client.invoices.list()
+
+    assert client.transport_config is config
+    assert [r.extensions["timeout"] for r in server.requests] == [
+        {"connect": 1.0, "read": None, "write": 30.0, "pool": 3.0}
+    ]
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+from conftest import AsyncClientFactory, ClientFactory, MockServer
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    if body["file_id"] == "missing":
+        return httpx.Response(404, json={"detail": "Invoice not found"})
+    return httpx.Response(
+        200, json={"fileId": body["file_id"], "status": body["status"]}
+    )
+
+
+@pytest.fixture
+def server() -> MockServer:
+    return MockServer(_respond)
+
+
+def _updates(server: MockServer) -> dict[str, str]:
+    """The status each existing invoice was last set to."""
+    bodies = [json.loads(request.content) for request in server.requests]
+    return {b["file_id"]: b["status"] for b in bodies if b["file_id"] != "missing"}
+
+
+def test_update_status_many_reports_each_invoice(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    results = make_client().invoices.update_status_many(
+        [("f1", "not_paid"), ("f2", "paid"), ("f1", "paid"), ("missing", "paid")],
+        concurrency=2,
+    )
+
+    by_id = {r.key: r for r in results}
+    assert sorted(by_id) == ["f1", "f2", "missing"]
+    assert _updates(server) == {"f1": "paid", "f2": "paid"}
+    assert by_id["f1"].value is not None
+    assert by_id["f1"].value.status == "paid"
+    assert not by_id["missing"].ok
+
+
+def test_invalid_statuses_fail_per_invoice_without_a_request(
+    server: MockServer, make_client: ClientFactory
+) -> None:
+    statuses: dict[str, Any] = {"f1": "paid", "f2": "lost"}
+    results = make_client().invoices.update_status_many(statuses)
+
+    [failed] = [r for r in results if not r.ok]
+    assert failed.key == "f2"
+    assert isinstance(failed.error, ValueError)
+    assert _updates(server) == {"f1": "paid"}
+
+
+def test_async_update_status_many(
+    server: MockServer, make_async_client: AsyncClientFactory
+) -> None:
+    async def main() -> int:
+        async with make_async_client() as client:
+            results = await client.invoices.update_status_many(
+                {f"f{i}": "paid" for i in range(5)}, concurrency=2
+            )
+            return sum(r.ok for r in results)
+
+    assert asyncio.run(main()) == 5
+    assert len(_updates(server)) == 5